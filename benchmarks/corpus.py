@@ -0,0 +1,130 @@
+"""
+Synthetic, Reddit-like labeled corpus for the PII benchmarks.
+
+The corpus is generated from a fixed seed, so every run of a benchmark sees exactly the same texts. Each
+document is a dictionary with the text and the labeled PII entities it contains, using presidio entity names:
+
+    {"text": "dm me at jane.doe@gmail.com", "entities": ["EMAIL_ADDRESS"]}
+
+The mix follows what a crawl of comments looks like: mostly short reactions and opinions without any PII, and a
+minority of texts mentioning people, places, dates, phone numbers, email addresses or URLs.
+"""
+
+import json
+import random
+from typing import Dict, List
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Carlos", "Priya",
+    "Wei", "Fatima", "Olga", "Kenji", "Aisha", "Mateo", "Ingrid", "Tariq", "Chloe", "Dmitri",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Nguyen", "Patel", "Kim", "Müller", "Rossi", "Kowalski", "Okafor", "Tanaka", "Silva", "Andersson",
+]
+CITIES = [
+    "London", "Seattle", "Toronto", "Berlin", "Austin", "Chicago", "Melbourne", "Dublin", "Lagos", "Mumbai",
+    "Denver", "Portland", "Manchester", "Boston", "Oslo", "Lisbon", "Osaka", "Nairobi", "Phoenix", "Glasgow",
+]
+DATES = [
+    "yesterday", "last week", "two years ago", "last Tuesday", "on March 3rd", "this morning", "in 2019",
+    "next month", "on Christmas", "a few days ago", "back in June", "last summer",
+]
+DOMAINS = ["gmail.com", "yahoo.com", "outlook.com", "protonmail.com", "hotmail.co.uk"]
+SITES = [
+    "https://imgur.com/a/Xk29dPq", "https://youtu.be/dQw4w9WgXcQ", "www.example.org/thread", "github.com/someuser",
+    "https://en.wikipedia.org/wiki/Reddit", "bit.ly/3xYzAbC",
+]
+
+NO_PII = [
+    "lol", "this", "same", "underrated comment", "big if true", "source?", "nice", "agreed", "this is the way",
+    "came here to say this", "ok but why", "thanks, that helped a lot", "I can't believe this is real",
+    "This is so true", "Honestly the best take in the thread", "what a time to be alive", "yikes", "deleted?",
+    "I don't get the joke", "That's not how any of this works", "Wait what", "haha same", "take my upvote",
+    "the mods are asleep, post cute cats", "it depends on your use case tbh", "Can confirm", "mods pls",
+    "People really need to read the rules before posting", "this comment section is gold", "Sure, why not",
+    "genuinely curious what the downside is", "It works on my machine", "ngl that looks delicious",
+    "I'd argue the opposite, but fair point", "Well that escalated quickly", "nope nope nope",
+    "the real answer is always more sleep", "What did I just watch", "good bot", "Username checks out",
+    "Because it is cheaper to maintain", "i tried this and it did not work for me", "So much this",
+]
+
+TEMPLATES = [
+    ("my buddy {first} told me the same thing", ["PERSON"]),
+    ("{first} {last} is a fraud and everyone knows it", ["PERSON"]),
+    ("I asked {first} about it and she laughed", ["PERSON"]),
+    ("just moved to {city} and the rent is insane", ["LOCATION"]),
+    ("anyone else from {city} here?", ["LOCATION"]),
+    ("Visited {city} {date}, would go again", ["LOCATION", "DATE_TIME"]),
+    ("my landlord {first} {last} in {city} kept the deposit", ["PERSON", "LOCATION"]),
+    ("it happened {date} and I'm still mad", ["DATE_TIME"]),
+    ("got laid off {date}, any advice?", ["DATE_TIME"]),
+    ("dm me at {email} if you want the files", ["EMAIL_ADDRESS"]),
+    ("contact {first} at {email}", ["PERSON", "EMAIL_ADDRESS"]),
+    ("call me at {phone}, I'm selling the couch", ["PHONE_NUMBER"]),
+    ("their support line is {phone} but nobody answers", ["PHONE_NUMBER"]),
+    ("full video here {url}", ["URL"]),
+    ("source: {url}", ["URL"]),
+    ("talked to {first_lower} about it {date}", ["PERSON", "DATE_TIME"]),
+    # Names typed in lowercase, which capitalization heuristics cannot see
+    ("ask {first_lower}, he knows this stuff", ["PERSON"]),
+    ("lmao {first_lower} {last_lower} really said that", ["PERSON"]),
+    ("{first} from {city} sent me this {date}: {url}", ["PERSON", "LOCATION", "DATE_TIME", "URL"]),
+]
+
+
+def generate(size: int = 5000, seed: int = 42, pii_share: float = 0.3) -> List[Dict]:
+    """
+    Generate the labeled corpus.
+
+    Args:
+        size (int, optional): The number of documents. Defaults to 5000.
+        seed (int, optional): The random seed. Defaults to 42.
+        pii_share (float, optional): The share of documents containing PII. Defaults to 0.3.
+
+    Returns:
+        List[Dict]: The documents, each with a "text" and its labeled "entities".
+    """
+    rng = random.Random(seed)
+    documents = []
+
+    for _ in range(size):
+        if rng.random() >= pii_share:
+            text = rng.choice(NO_PII)
+            # Longer comments are made of several PII-free sentences
+            if rng.random() < 0.3:
+                text = " ".join([text] + rng.sample(NO_PII, rng.randint(1, 3)))
+            documents.append({"text": text, "entities": []})
+            continue
+
+        template, entities = rng.choice(TEMPLATES)
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        text = template.format(
+            first=first,
+            last=last,
+            first_lower=first.lower(),
+            last_lower=last.lower(),
+            city=rng.choice(CITIES),
+            date=rng.choice(DATES),
+            email=f"{first.lower()}.{last.lower()}{rng.randint(1, 99)}@{rng.choice(DOMAINS)}",
+            phone=f"({rng.randint(200, 989)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+            url=rng.choice(SITES),
+        )
+        documents.append({"text": text, "entities": list(entities)})
+
+    return documents
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write the synthetic PII corpus as JSON lines.")
+    parser.add_argument("--size", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", default="pii_corpus.jsonl")
+    args = parser.parse_args()
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        for document in generate(args.size, args.seed):
+            f.write(json.dumps(document, ensure_ascii=False) + "\n")
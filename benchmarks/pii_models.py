@@ -0,0 +1,120 @@
+"""
+Benchmark the PII model tiers of `redditharbor.dock.pii.masker` on the synthetic labeled corpus.
+
+Each tier ("sm", "md", "lg" and "regex") runs in its own process, so its peak resident memory (RSS) is measured in
+isolation. For every tier the benchmark reports the load time, the masking throughput in texts per second, the
+peak RSS and the recall per labeled entity type: the share of texts labeled with an entity in which the masked
+text contains its placeholder (e.g. <PERSON>).
+
+spaCy models that are not installed are skipped, unless --download is given.
+
+Usage:
+    python benchmarks/pii_models.py [--tiers sm md lg regex] [--size 2000] [--seed 42] [--download]
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from rich.console import Console
+from rich.table import Table
+
+import corpus
+from redditharbor.dock import pii
+
+console = Console()
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_tier(tier, size, seed):
+    """Mask the corpus with one tier, in the current process, and return its measurements."""
+    documents = corpus.generate(size, seed)
+    texts = [document["text"] for document in documents]
+    masker = pii.masker(model=tier)
+
+    start = time.perf_counter()
+    masker.mask(texts[0])
+    load_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    masked = masker.mask_batch(texts)
+    elapsed = time.perf_counter() - start
+
+    labeled, found = Counter(), Counter()
+    for document, masked_text in zip(documents, masked):
+        for entity in set(document["entities"]):
+            labeled[entity] += 1
+            found[entity] += f"<{entity}>" in masked_text
+
+    return {
+        "tier": tier,
+        "load_seconds": load_time,
+        "texts_per_second": len(texts) / elapsed,
+        "peak_rss_mb": peak_rss_mb(),
+        "recall": {entity: found[entity] / labeled[entity] for entity in labeled},
+        "recall_overall": sum(found.values()) / sum(labeled.values()),
+    }
+
+
+def installed(tier):
+    if tier == "regex":
+        return True
+    import spacy
+
+    return spacy.util.is_package(pii.SPACY_MODELS[tier])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tiers", nargs="+", default=pii.MODEL_TIERS, choices=pii.MODEL_TIERS)
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--download", action="store_true", help="Download spaCy models that are not installed.")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_tier(args.child, args.size, args.seed)))
+        sys.exit(0)
+
+    results = []
+    for tier in args.tiers:
+        if not args.download and not installed(tier):
+            console.log(f"[yellow]Skipping {tier}: {pii.SPACY_MODELS[tier]} is not installed (use --download)")
+            continue
+        console.log(f"Benchmarking {tier}")
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", tier, "--size", str(args.size), "--seed", str(args.seed)],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+
+    entities = sorted({entity for result in results for entity in result["recall"]})
+    table = Table(title=f"PII model tiers on {args.size} synthetic texts")
+    for column in ["Tier", "Load (s)", "Texts/sec", "Peak RSS (MB)", "Recall", *entities]:
+        table.add_column(column, justify="right")
+    for result in results:
+        rss = result["peak_rss_mb"]
+        table.add_row(
+            result["tier"],
+            f"{result['load_seconds']:.1f}",
+            f"{result['texts_per_second']:.0f}",
+            f"{rss:.0f}" if rss is not None else "n/a",
+            f"{result['recall_overall']:.1%}",
+            *[f"{result['recall'].get(entity, 0):.1%}" for entity in entities],
+        )
+    console.print(table)
@@ -0,0 +1,872 @@
+import os
+import asyncio
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple
+from rich.console import Console
+from redditharbor.dock.pipeline import (
+    IN_FILTER_CHUNK_SIZE,
+    PARTIAL_REDDITORS_BATCH_SIZE,
+    SUBMISSION_PREFETCH_SIZE,
+    comment_row,
+    partial_redditor_row,
+    save_unenriched_redditors,
+    submission_row,
+    take_unenriched_redditors,
+)
+from redditharbor.dock.writer import async_writer
+from redditharbor.dock import cache, pii
+
+try:
+    import asyncpraw
+except ImportError as e:
+    raise ImportError(
+        "Asynchronous collection requires additional dependencies. "
+        "Please install with: pip install redditharbor[async]"
+    ) from e
+
+console = Console(record=True)
+
+
+class async_collect:
+    def __init__(
+        self,
+        reddit_client: asyncpraw.Reddit,
+        supabase_client: Any,
+        db_config: dict = None,
+        batch_size: int = 500,
+        reddit_concurrency: int = 4,
+        db_concurrency: int = 16,
+        redditor_cache: cache.redditor_cache = None,
+        pii_masker: pii.masker = None,
+        pii_model: str = "lg",
+    ):
+        """
+        Initialize the asynchronous counterpart of `collect`, driven by Async PRAW and an async PostgREST client.
+
+        The public methods are coroutines with the same arguments as those of `collect`. Listings of different
+        subreddits (and sort types) are walked concurrently, comment trees are fetched concurrently, and batches
+        are written to the database while collection carries on, so a single process keeps several Reddit requests
+        and many database requests in flight. Async PRAW still waits on Reddit's rate limit headers, so Reddit
+        requests never exceed the quota.
+
+        New redditors are stored with their id and name only, and their karma and creation date are filled in by
+        `enrich_redditors`, 100 redditors per API request (as `collect(deferred_enrichment=True)` does).
+
+        Args:
+            reddit_client (asyncpraw.Reddit): The Async PRAW client used for interacting with Reddit's API.
+            supabase_client (Any): The async client used for database interaction, e.g. a `supabase.AsyncClient`
+                (from `await supabase.acreate_client(url, key)`) or a `postgrest.AsyncPostgrestClient`.
+            db_config (dict, optional): A dictionary containing configuration details for database tables.
+                It should include keys 'user', 'submission', and 'comment' for respective table names.
+            batch_size (int, optional): The number of rows written to the database per request. Defaults to 500.
+            reddit_concurrency (int, optional): The maximum number of Reddit requests in flight. Defaults to 4.
+            db_concurrency (int, optional): The maximum number of database requests in flight, for writes and for
+                lookups each. Defaults to 16.
+            redditor_cache (redditor_cache, optional): A cache of redditors already stored in the database, which can
+                be shared with collect instances. Defaults to None, creating a new cache for this instance.
+            pii_masker (pii.masker, optional): The masker used when collecting with `mask_pii=True`. Masking runs in
+                a dedicated thread, one batch at a time, so the event loop carries on meanwhile. A masker is not
+                thread-safe, so do not share it with code masking from other threads. Defaults to None, creating
+                a masker with the `pii_model` tier.
+            pii_model (str, optional): The PII model tier used when no pii_masker is given. Defaults to "lg".
+
+        Raises:
+            ValueError: If db_config is not provided, or a concurrency limit is not a positive integer.
+        """
+        if db_config is None:
+            raise ValueError("Invalid input: db_config must be provided.")
+        if reddit_concurrency < 1 or db_concurrency < 1:
+            raise ValueError("Invalid input: reddit_concurrency and db_concurrency must be positive integers.")
+
+        self.reddit = reddit_client
+        self.supabase = supabase_client
+
+        self.redditor_db_config = db_config["user"]
+        self.submission_db_config = db_config["submission"]
+        self.comment_db_config = db_config["comment"]
+
+        self.reddit_concurrency = reddit_concurrency
+        self.db_concurrency = db_concurrency
+        # Created on first use, inside the running event loop
+        self._reddit_slots: Optional[asyncio.Semaphore] = None
+        self._db_slots: Optional[asyncio.Semaphore] = None
+
+        self.pii_masker = pii_masker if pii_masker is not None else pii.masker(model=pii_model)
+        self._unmasked_rows = []
+        # The masker's engines and counters are not thread-safe: every batch is masked on this single thread
+        self._mask_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pii-masker")
+
+        # Check and create "error_log" folder
+        self.error_log_path = os.path.join(os.getcwd(), "error_log")
+        os.makedirs(self.error_log_path, exist_ok=True)
+
+        # Rows are buffered and written in batches from tasks, ignoring rows already in the DB
+        self.writer = async_writer(
+            self.supabase,
+            primary_keys={
+                self.redditor_db_config: "redditor_id",
+                self.submission_db_config: "submission_id",
+                self.comment_db_config: "comment_id",
+            },
+            batch_size=batch_size,
+            max_in_flight=db_concurrency,
+            error_log_path=self.error_log_path,
+        )
+
+        self.redditor_cache = (
+            redditor_cache if redditor_cache is not None else cache.redditor_cache()
+        )
+        self._unenriched_redditor_ids = []
+        self.unenriched_path = os.path.join(self.error_log_path, f"unenriched_{self.redditor_db_config}.json")
+
+    def _log_error(self, prefix: str, error: Exception) -> None:
+        console.log(f"{prefix}: [bold red]{error}[/]")
+        console.print_exception()
+        console.save_html(os.path.join(self.error_log_path, f"{prefix}.html"))
+
+    async def _reddit(self, awaitable: Awaitable) -> Any:
+        """Await a Reddit request, once fewer than reddit_concurrency requests are in flight."""
+        if self._reddit_slots is None:
+            self._reddit_slots = asyncio.Semaphore(self.reddit_concurrency)
+        async with self._reddit_slots:
+            return await awaitable
+
+    async def _walk(self, listing: AsyncIterator) -> AsyncIterator:
+        """Iterate over an Async PRAW listing, counting each page request against reddit_concurrency."""
+        iterator = listing.__aiter__()
+        while True:
+            try:
+                item = await self._reddit(iterator.__anext__())
+            except StopAsyncIteration:
+                return
+            yield item
+
+    async def _query(self, query: Any) -> List[dict]:
+        """Execute a database request, once fewer than db_concurrency lookups are in flight."""
+        if self._db_slots is None:
+            self._db_slots = asyncio.Semaphore(self.db_concurrency)
+        async with self._db_slots:
+            response = await query.execute()
+        return response.model_dump()["data"]
+
+    async def _walk_chunks(self, listing: AsyncIterator, size: int = SUBMISSION_PREFETCH_SIZE) -> AsyncIterator:
+        """Iterate over an Async PRAW listing in lists of up to `size` items (one listing page by default)."""
+        chunk = []
+        async for item in self._walk(listing):
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    async def _select_existing(self, table: str, column: str, values: List[str]) -> set:
+        """Return the subset of values already present in a table column, querying chunks concurrently."""
+        values = list(dict.fromkeys(value for value in values if value))
+        chunks = [
+            values[start : start + IN_FILTER_CHUNK_SIZE]
+            for start in range(0, len(values), IN_FILTER_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *[self._query(self.supabase.table(table).select(column).in_(column, chunk)) for chunk in chunks]
+        )
+        return {row[column] for result in results for row in result}
+
+    async def _check_redditor_exists(self, redditor_id: str) -> bool:
+        """Check if a redditor exists in the database or is waiting to be written."""
+        if self.writer.pending(self.redditor_db_config, redditor_id):
+            return True
+        result = await self._query(
+            self.supabase.table(self.redditor_db_config).select("redditor_id").eq("redditor_id", redditor_id)
+        )
+        return len(result) == 1
+
+    async def _check_submission_exists(self, submission_id: str) -> bool:
+        """Check if a submission exists in the database or is waiting to be written."""
+        if self.writer.pending(self.submission_db_config, submission_id):
+            return True
+        return bool(await self._select_existing(self.submission_db_config, "submission_id", [submission_id]))
+
+    async def _prefetch_submissions(self, submissions: List[asyncpraw.models.Submission]) -> set:
+        """Return the ids of the submissions already in the database, looked up at once."""
+        return await self._select_existing(
+            self.submission_db_config, "submission_id", [submission.id for submission in submissions]
+        )
+
+    async def _check_submission_comments_exist(self, submission_id: str) -> bool:
+        """Check if comments for a submission exist in the database."""
+        result = await self._query(
+            self.supabase.table(self.comment_db_config).select("link_id").eq("link_id", submission_id).limit(1)
+        )
+        return len(result) >= 1
+
+    @staticmethod
+    def _author_id(praw_models: Any) -> Optional[str]:
+        """Return the author's redditor id from the listing data, without fetching the profile."""
+        author_fullname = getattr(praw_models, "author_fullname", None)
+        if author_fullname and author_fullname.startswith("t2_"):
+            return author_fullname[3:]
+        return None
+
+    async def _comments(self, submission: asyncpraw.models.Submission, level: Optional[int]) -> list:
+        """Fetch the comment tree of a submission, expanding replies up to `level`."""
+        if not getattr(submission, "_fetched", False):
+            await self._reddit(submission.load())
+        await self._reddit(submission.comments.replace_more(limit=level))
+        return submission.comments.list()
+
+    async def _queue_row(self, table: str, row: dict, text_column: str, mask_pii: bool) -> None:
+        """Queue a row for writing. With mask_pii, the row is held back until its text is masked in a batch."""
+        if mask_pii and row[text_column]:
+            self._unmasked_rows.append((table, row, text_column))
+            if len(self._unmasked_rows) >= self.pii_masker.capacity:
+                await self._mask_pending_rows()
+        else:
+            await self.writer.add(table, row)
+
+    async def _mask_pending_rows(self) -> None:
+        """Mask the text of all held back rows in one batch, in a thread so the event loop carries on."""
+        pending, self._unmasked_rows = self._unmasked_rows, []
+        if not pending:
+            return
+
+        loop = asyncio.get_running_loop()
+        texts = [row[column] for _, row, column in pending]
+        try:
+            masked_texts = await loop.run_in_executor(self._mask_executor, self.pii_masker.mask_batch, texts)
+        except Exception as error:
+            console.log(f"Failed to mask a batch of {len(pending)} text(s): [bold red]{error}[/]. Retrying one by one")
+            masked_texts = [None] * len(pending)
+            for i, (table, row, column) in enumerate(pending):
+                try:
+                    masked_texts[i] = await loop.run_in_executor(self._mask_executor, self.pii_masker.mask, row[column])
+                except Exception as error:
+                    self._log_error(f"{table}_{row[self.writer.primary_keys[table]]}", error)
+
+        for (table, row, column), masked_text in zip(pending, masked_texts):
+            # Rows that could not be masked are never written unmasked
+            if masked_text is not None:
+                row[column] = masked_text
+                await self.writer.add(table, row)
+
+    async def _flush_inserted(self, inserted_before: Dict[str, int]) -> Dict[str, int]:
+        """Write all buffered rows and return the number of rows inserted per table since `inserted_before`."""
+        await self._mask_pending_rows()
+        if self._unenriched_redditor_ids or os.path.exists(self.unenriched_path):
+            await self.enrich_redditors()
+        await self.writer.flush()
+        return {
+            table: count - inserted_before.get(table, 0)
+            for table, count in self.writer.inserted.items()
+        }
+
+    async def close(self) -> None:
+        """Write every pending row and shut down the PII workers. The Reddit client is left open."""
+        await self._flush_inserted(dict(self.writer.inserted))
+        self._mask_executor.shutdown()
+        self.pii_masker.close()
+
+    async def redditor_data(
+        self,
+        praw_models: Any,
+        insert: bool,
+        existing_redditor_ids: Optional[set] = None,
+    ) -> Tuple[str, bool]:
+        """
+        Collects and stores data related to the author of a submission or comment.
+
+        The redditor id is read from the listing data, so no profile is fetched. New redditors are stored with
+        their id and name, and enriched in bulk later.
+
+        Args:
+            praw_models (Any): An Async PRAW submission or comment.
+            insert (bool): Insert redditor data to DB.
+            existing_redditor_ids (set, optional): Redditor ids already known to be in the DB. When given, it is
+                consulted instead of querying the DB, and updated with every redditor found or inserted.
+
+        Returns:
+            Tuple[str, bool]: A tuple containing the unique identifier of the Redditor collected and a boolean indicating whether the Redditor was queued for insertion in the database.
+        """
+        redditor = praw_models.author
+        if redditor is None:
+            return "deleted", False
+
+        # Suspended accounts have no fullname in listings
+        author_id = self._author_id(praw_models)
+        redditor_id = author_id if author_id is not None else f"suspended:{redditor.name}"
+        if not insert:
+            return redditor_id, False
+
+        if self.redditor_cache.get(redditor.name) is not None:
+            return redditor_id, False
+
+        if existing_redditor_ids is not None:
+            exists = redditor_id in existing_redditor_ids
+        else:
+            exists = await self._check_redditor_exists(redditor_id)
+        if exists:
+            console.log(
+                f"Redditor [bold red]{redditor_id}[/] already in DB-{self.redditor_db_config}"
+            )
+            self.redditor_cache.add(redditor.name, redditor_id)
+            return redditor_id, False
+
+        console.log(
+            f"Redditor [bold red]{redditor_id}[/] not in DB. Adding to DB-{self.redditor_db_config} with deferred enrichment"
+        )
+        removed = "suspended" if author_id is None else None
+        row = {
+            "redditor_id": redditor_id,
+            "name": redditor.name,
+            "created_at": None,
+            "karma": None,
+            "is_gold": None,
+            "is_mod": None,
+            "trophy": None,
+            "removed": removed,
+        }
+
+        await self.writer.add(self.redditor_db_config, row)
+        self.redditor_cache.add(redditor.name, redditor_id, removed)
+        if existing_redditor_ids is not None:
+            existing_redditor_ids.add(redditor_id)
+        if author_id is not None:
+            self._unenriched_redditor_ids.append(redditor_id)
+            if len(self._unenriched_redditor_ids) >= PARTIAL_REDDITORS_BATCH_SIZE:
+                await self.enrich_redditors()
+        return redditor_id, True
+
+    async def enrich_redditors(self) -> int:
+        """
+        Fill in the karma and creation date of redditors stored with their id and name only.
+
+        Profiles are fetched through Reddit's bulk user data endpoint, 100 redditors per API request, and the
+        requests run concurrently. As with `collect.enrich_redditors`, the `karma` of enriched redditors holds
+        "comment", "link" and "total" only, and the ids of redditors whose request or write failed are saved to
+        "unenriched_<user table>.json" in the error log folder, to be retried by the next call.
+
+        Returns:
+            int: The number of redditors enriched.
+        """
+        redditor_ids, self._unenriched_redditor_ids = self._unenriched_redditor_ids, []
+        redditor_ids = list(dict.fromkeys(take_unenriched_redditors(self.unenriched_path) + redditor_ids))
+        if not redditor_ids:
+            return 0
+
+        # Minimal rows must be in the DB before they are merged with the profile data
+        await self.writer.flush(self.redditor_db_config)
+
+        failed = []
+
+        async def enrich(chunk: List[str]) -> int:
+            try:
+                rows = [
+                    partial_redditor_row(partial_redditor)
+                    async for partial_redditor in self._walk(
+                        self.reddit.redditors.partial_redditors(
+                            [f"t2_{redditor_id}" for redditor_id in chunk]
+                        )
+                    )
+                ]
+                if rows:
+                    await self._query(
+                        self.supabase.table(self.redditor_db_config).upsert(rows, on_conflict="redditor_id")
+                    )
+                return len(rows)
+
+            except Exception as error:
+                failed.extend(chunk)
+                console.log(f"Failed to enrich {len(chunk)} redditor(s): [bold red]{error}[/]")
+                console.print_exception()
+                console.save_html(os.path.join(self.error_log_path, f"t2_{chunk[0]}.html"))
+                return 0
+
+        enriched = sum(
+            await asyncio.gather(
+                *[
+                    enrich(redditor_ids[start : start + PARTIAL_REDDITORS_BATCH_SIZE])
+                    for start in range(0, len(redditor_ids), PARTIAL_REDDITORS_BATCH_SIZE)
+                ]
+            )
+        )
+        if failed:
+            save_unenriched_redditors(self.unenriched_path, failed)
+            console.log(
+                f"{len(failed)} redditor(s) left to enrich, saved to [bold red]{self.unenriched_path}[/]"
+            )
+        console.log(
+            f"{enriched} redditor(s) enriched in DB-{self.redditor_db_config}"
+        )
+        return enriched
+
+    async def submission_data(
+        self,
+        submission: asyncpraw.models.Submission,
+        mask_pii: bool,
+        insert_redditor: bool = True,
+        existing_submission_ids: Optional[set] = None,
+    ) -> Tuple[str, bool, bool]:
+        """
+        Collects and stores a submission and its author.
+
+        Args:
+            submission (asyncpraw.models.Submission): The Async PRAW Submission object representing the submission.
+            mask_pii (bool): Whether to mask PII in submission text.
+            insert_redditor (bool): Whether to insert redditor data.
+            existing_submission_ids (set, optional): Submission ids already known to be in the DB, e.g. looked up
+                for a whole listing page at once. When given, it is consulted instead of querying the DB.
+
+        Returns:
+            Tuple[str, bool, bool]: The submission id, whether the submission was queued and whether its author was queued.
+
+        Note:
+            Submissions already stored are skipped before their author is resolved or their text masked.
+        """
+        accessed_at = datetime.datetime.utcnow()
+        if existing_submission_ids is not None:
+            exists = submission.id in existing_submission_ids or self.writer.pending(
+                self.submission_db_config, submission.id
+            )
+        else:
+            exists = await self._check_submission_exists(submission.id)
+        if exists:
+            console.log(
+                f"Submission [bold red]{submission.id}[/] already in DB-{self.submission_db_config}"
+            )
+            return submission.id, False, False
+
+        console.log(
+            f"Adding submission [bold red]{submission.id}[/] to DB-{self.submission_db_config}"
+        )
+
+        redditor_id, redditor_inserted = await self.redditor_data(submission, insert=insert_redditor)
+        row = submission_row(submission, redditor_id, accessed_at)
+        await self._queue_row(self.submission_db_config, row, "text", mask_pii)
+        return submission.id, True, redditor_inserted
+
+    async def comment_data(
+        self,
+        comments: List[asyncpraw.models.Comment],
+        mask_pii: bool,
+        insert_redditor: bool = True,
+    ) -> Tuple[int, int]:
+        """
+        Collects and stores comment data associated with a list of comments.
+
+        Args:
+            comments (List[asyncpraw.models.Comment]): A list of Async PRAW Comment objects to collect and store.
+            mask_pii (bool): Whether to mask PII in comment text.
+            insert_redditor (bool): Whether to insert redditor data.
+
+        Returns:
+            Tuple[int, int]: A tuple containing the count of queued comments and the count of queued Redditors.
+        """
+        comment_inserted_count = 0
+        redditor_inserted_count = 0
+
+        # Resolve database existence for the whole list at once
+        existing_comment_ids = await self._select_existing(
+            self.comment_db_config, "comment_id", [comment.id for comment in comments]
+        )
+        new_comments = [comment for comment in comments if comment.id not in existing_comment_ids]
+        if existing_comment_ids:
+            console.log(
+                f"{len(existing_comment_ids)} comment(s) already in DB-{self.comment_db_config}"
+            )
+        # Authors that are not inserted are never checked against the database
+        existing_redditor_ids = set()
+        if insert_redditor:
+            existing_redditor_ids = await self._select_existing(
+                self.redditor_db_config,
+                "redditor_id",
+                [self._author_id(comment) for comment in new_comments],
+            )
+
+        for comment in new_comments:
+            accessed_at = datetime.datetime.utcnow()
+            try:
+                console.log(
+                    f"Adding comment [bold red]{comment.id}[/] to DB-{self.comment_db_config}"
+                )
+                redditor_id, redditor_inserted = await self.redditor_data(
+                    comment,
+                    insert=insert_redditor,
+                    existing_redditor_ids=existing_redditor_ids,
+                )
+                if redditor_inserted:
+                    redditor_inserted_count += 1
+
+                row = comment_row(comment, redditor_id, accessed_at)
+                await self._queue_row(self.comment_db_config, row, "body", mask_pii)
+                comment_inserted_count += 1
+
+            except Exception as error:
+                self._log_error(f"t1_{comment.id}", error)
+                continue
+
+        return comment_inserted_count, redditor_inserted_count
+
+    async def _collect_submission(
+        self,
+        submission: asyncpraw.models.Submission,
+        submissions: bool,
+        comments: bool,
+        level: Optional[int],
+        mask_pii: bool,
+        existing_submission_ids: Optional[set] = None,
+    ) -> None:
+        """Collect a submission and/or its comment tree, logging errors instead of raising them."""
+        try:
+            if submissions:
+                await self.submission_data(
+                    submission=submission, mask_pii=mask_pii, existing_submission_ids=existing_submission_ids
+                )
+
+            if comments:
+                # Check if comments of submission were crawled
+                if await self._check_submission_comments_exist(submission.id):
+                    console.log(
+                        f"Submission Link [bold red]{submission.id}[/] already in DB-{self.comment_db_config}"
+                    )
+                    return
+                submission_comments = await self._comments(submission, level)
+                await self.comment_data(comments=submission_comments, mask_pii=mask_pii)
+
+        except Exception as error:
+            self._log_error(f"t3_{submission.id}", error)
+
+    async def _collect_listings(
+        self,
+        subreddits: List[str],
+        sort_types: List[str],
+        limit: Optional[int],
+        level: Optional[int],
+        mask_pii: bool,
+        submissions: bool,
+        comments: bool,
+    ) -> None:
+        """Walk the listings of every subreddit and sort type concurrently, collecting each submission."""
+
+        async def walk(subreddit: str, sort_type: str) -> None:
+            try:
+                r_ = await self.reddit.subreddit(subreddit)
+                tasks = []
+                async for chunk in self._walk_chunks(getattr(r_, sort_type)(limit=limit)):
+                    existing_submission_ids = await self._prefetch_submissions(chunk) if submissions else None
+
+                    for submission in chunk:
+                        collected = self._collect_submission(
+                            submission, submissions, comments, level, mask_pii, existing_submission_ids
+                        )
+                        if comments:
+                            # Comment trees are fetched concurrently, bounded by reddit_concurrency
+                            tasks.append(asyncio.ensure_future(collected))
+                        else:
+                            await collected
+                await asyncio.gather(*tasks)
+                console.log(f"[bold]subreddit: {subreddit}[/] {sort_type} listing collected")
+
+            except Exception as error:
+                self._log_error(f"subreddit_{subreddit}_{sort_type}", error)
+
+        await asyncio.gather(
+            *[walk(subreddit, sort_type) for subreddit in subreddits for sort_type in sort_types]
+        )
+
+    async def subreddit_submission(
+        self,
+        subreddits: List[str],
+        sort_types: List[str],
+        limit: int = 10,
+        mask_pii: bool = False,
+    ) -> None:
+        """
+        Collects and stores submissions and associated users in specified subreddits.
+
+        Args:
+            subreddits (List[str]): A list of subreddit names to collect submissions from.
+            sort_types (List[str]): A list of sorting types for submissions (e.g., 'hot', 'new', 'rising', 'top', 'controversial').
+            limit (int, optional): The maximum number of submissions to collect for each subreddit. Defaults to 10. Set to None to fetch maximum number of submissions.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None. Prints the count of collected submissions and user data to the console.
+        """
+        with console.status(
+            "[bold green]Collecting submissions and users from subreddit(s)...",
+            spinner="aesthetic",
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await self._collect_listings(
+                subreddits, sort_types, limit, None, mask_pii, submissions=True, comments=False
+            )
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.submission_db_config]} submission and {inserted[self.redditor_db_config]} user data collected from subreddit(s) {subreddits}"
+        )
+
+    async def subreddit_comment(
+        self,
+        subreddits: List[str],
+        sort_types: List[str],
+        limit: int = 10,
+        level: Optional[int] = 1,
+        mask_pii: bool = False,
+    ) -> None:
+        """
+        Collects and stores comments and associated users in specified subreddits.
+
+        Args:
+            subreddits (List[str]): A list of subreddit names to collect comments from.
+            sort_types (List[str]): A list of sorting types for submissions (e.g., 'hot', 'new', 'rising', 'top', 'controversial').
+            limit (int, optional): The maximum number of submissions to collect comments from (for each subreddit). Defaults to 10. Set to None to fetch maximum number of submissions.
+            level (int, optional): The depth to which comment replies should be fetched. Defaults to 1. Set to None to fetch all comment replies.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None. Prints the count of collected comments and user data to the console.
+        """
+        with console.status(
+            "[bold green]Collecting comments and users from subreddit(s)...",
+            spinner="aesthetic",
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await self._collect_listings(
+                subreddits, sort_types, limit, level, mask_pii, submissions=False, comments=True
+            )
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.comment_db_config]} comment and {inserted[self.redditor_db_config]} user data collected from subreddit(s) {subreddits}"
+        )
+
+    async def subreddit_submission_and_comment(
+        self,
+        subreddits: List[str],
+        sort_types: List[str],
+        limit: int = 10,
+        level: int = 1,
+        mask_pii: bool = False,
+    ) -> None:
+        """
+        Collects and stores submissions, comments and associated users in specified subreddits.
+
+        Args:
+            subreddits (List[str]): A list of subreddit names to collect comments from.
+            sort_types (List[str]): A list of sorting types for submissions (e.g., 'hot', 'new', 'rising', 'top', 'controversial').
+            limit (int, optional): The maximum number of submissions to collect comments from (for each subreddit). Defaults to 10. Set to None to fetch maximum number of submissions.
+            level (int, optional): The depth to which comment replies should be fetched. Defaults to 1. Set to None to fetch all comment replies.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None. Prints the count of collected submissions, comments and user data to the console.
+        """
+        with console.status(
+            "[bold green]Collecting submissions, comments and users from subreddit(s)...",
+            spinner="aesthetic",
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await self._collect_listings(
+                subreddits, sort_types, limit, level, mask_pii, submissions=True, comments=True
+            )
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.submission_db_config]} submission, {inserted[self.comment_db_config]} comment, and {inserted[self.redditor_db_config]} user data collected from subreddit(s) {subreddits}"
+        )
+
+    async def submission_from_user(
+        self,
+        user_names: List[str],
+        sort_types: List[str],
+        limit: int = 10,
+        mask_pii: bool = False,
+    ) -> None:
+        """
+        Collects and stores submissions from specified user(s).
+
+        Args:
+            user_names (List[str]): A list of Reddit usernames from which to collect submissions.
+            sort_types (List[str]): A list of sorting types for user's submissions (e.g., 'hot', 'new', 'rising', 'top', 'controversial').
+            limit (int, optional): The maximum number of submissions to collect for each user. Defaults to 10.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None. Prints the count of collected submission data to the console.
+        """
+
+        async def walk(user_name: str, sort_type: str) -> None:
+            try:
+                redditor = await self.reddit.redditor(user_name)
+                async for chunk in self._walk_chunks(getattr(redditor.submissions, sort_type)(limit=limit)):
+                    existing_submission_ids = await self._prefetch_submissions(chunk)
+
+                    for submission in chunk:
+                        try:
+                            await self.submission_data(
+                                submission=submission,
+                                mask_pii=mask_pii,
+                                existing_submission_ids=existing_submission_ids,
+                            )
+                        except Exception as error:
+                            self._log_error(f"t3_{submission.id}", error)
+
+            except Exception as error:
+                self._log_error(f"user_{user_name}", error)
+
+        with console.status(
+            "[bold green]Collecting submissions from specified user(s)...",
+            spinner="aesthetic",
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await asyncio.gather(
+                *[walk(user_name, sort_type) for user_name in user_names for sort_type in sort_types]
+            )
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.submission_db_config]} submission data collected from {len(user_names)} user(s)"
+        )
+
+    async def comment_from_user(
+        self,
+        user_names: List[str],
+        sort_types: List[str],
+        limit: int = 10,
+        mask_pii: bool = False,
+    ) -> None:
+        """
+        Collects and stores comments from specified user(s).
+
+        Args:
+            user_names (List[str]): A list of Reddit usernames from which to collect comments. Must to user name, not id.
+            sort_types (List[str]): A list of sorting types for user's comments (e.g., 'hot', 'new', 'rising', 'top', 'controversial').
+            limit (int, optional): The maximum number of comments to collect for each user. Defaults to 10.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None. Prints the count of collected comment data to the console.
+        """
+
+        async def walk(user_name: str, sort_type: str) -> None:
+            try:
+                redditor = await self.reddit.redditor(user_name)
+                comments = [
+                    comment
+                    async for comment in self._walk(getattr(redditor.comments, sort_type)(limit=limit))
+                ]
+                await self.comment_data(comments=comments, mask_pii=mask_pii)
+
+            except Exception as error:
+                self._log_error(f"user_{user_name}", error)
+
+        with console.status(
+            "[bold green]Collecting comments from user(s)...", spinner="aesthetic"
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await asyncio.gather(
+                *[walk(user_name, sort_type) for user_name in user_names for sort_type in sort_types]
+            )
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.comment_db_config]} comment data collected from {len(user_names)} user(s)"
+        )
+
+    async def submission_by_keyword(
+        self, subreddits: List[str], query: str, limit: int = 10, mask_pii: bool = False
+    ) -> None:
+        """
+        Collects and stores submissions with specified keywords from given subreddits.
+
+        The query supports the same boolean operators (AND, OR, NOT and parentheses) as `collect.submission_by_keyword`.
+
+        Args:
+            subreddits (List[str]): List of subreddit names to collect submissions from.
+            query (str): Search terms.
+            limit (int, optional): Maximum number of submissions to collect. Defaults to 10.
+            mask_pii (bool, optional): Mask (anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None. Prints the count of collected submissions data to the console.
+        """
+
+        async def search(subreddit: str) -> None:
+            try:
+                r_ = await self.reddit.subreddit(subreddit)
+                async for chunk in self._walk_chunks(r_.search(query, sort="relevance", limit=limit)):
+                    existing_submission_ids = await self._prefetch_submissions(chunk)
+
+                    for submission in chunk:
+                        try:
+                            await self.submission_data(
+                                submission=submission,
+                                mask_pii=mask_pii,
+                                insert_redditor=False,
+                                existing_submission_ids=existing_submission_ids,
+                            )
+                        except Exception as error:
+                            self._log_error(f"t3_{submission.id}", error)
+
+            except Exception as error:
+                self._log_error(f"subreddit_{subreddit}", error)
+
+        with console.status(
+            "[bold green]Collecting submissions with specified keyword(s)...",
+            spinner="aesthetic",
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await asyncio.gather(*[search(subreddit) for subreddit in subreddits])
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.submission_db_config]} submission data collected from subreddit(s) {subreddits} with query='{query}'"
+        )
+
+    async def comment_from_submission(
+        self,
+        submission_ids: List[str],
+        level: Optional[int] = 1,
+        mask_pii: bool = False,
+    ) -> None:
+        """
+        Collects and stores comments from specified submission id(s), fetching the comment trees concurrently.
+
+        Parameters:
+            submission_ids (List[str]): A list of submission IDs from which to collect comments.
+            level (Optional[int]): The depth of comments to collect. Defaults to 1.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+
+        Returns:
+            None
+        """
+
+        async def collect_comments(submission_id: str) -> None:
+            try:
+                # Check if comments of submission were crawled
+                if await self._check_submission_comments_exist(submission_id):
+                    console.log(
+                        f"Submission Link [bold red]{submission_id}[/] already in DB-{self.comment_db_config}"
+                    )
+                    return
+
+                submission = await self._reddit(self.reddit.submission(submission_id))
+                comments = await self._comments(submission, level)
+                await self.comment_data(comments=comments, mask_pii=mask_pii, insert_redditor=False)
+
+            except Exception as error:
+                self._log_error(f"t3_{submission_id}", error)
+
+        with console.status(
+            "[bold green]Collecting comments from submission id(s)...",
+            spinner="aesthetic",
+        ):
+            inserted_before = dict(self.writer.inserted)
+            await asyncio.gather(*[collect_comments(submission_id) for submission_id in submission_ids])
+            inserted = await self._flush_inserted(inserted_before)
+
+        console.print(
+            f"[bold green]{inserted[self.comment_db_config]} comment data collected from {len(submission_ids)} submission(s)"
+        )
@@ -0,0 +1,191 @@
+import os
+import json
+from typing import Any, Dict, List, Optional, Set
+import supabase
+from rich.console import Console
+from rich.progress import track
+from redditharbor.dock.writer import writer
+from redditharbor.dock import pii, stages
+from redditharbor.utils import keyset
+
+console = Console(record=True)
+
+
+class backfill:
+    def __init__(
+        self,
+        supabase_client: supabase.Client,
+        db_config: dict = None,
+        pii_masker: pii.masker = None,
+        batch_size: int = 500,
+        page_size: int = 1000,
+        checkpoint_path: str = None,
+    ):
+        """
+        Initialize an offline job masking personally identifiable information (PII) in data already collected.
+
+        Data can be collected quickly with `mask_pii=False`, and masked later in a separate, throughput-oriented
+        pass. Texts are streamed from the submission ("text") and comment ("body") tables in primary key order,
+        masked in batches, and written back with batched upserts. The last primary key of each table is saved in
+        a checkpoint after every page, so an interrupted job resumes where it stopped. Rows that cannot be
+        written, even after a retry, stop the table's backfill, and the checkpoint stays before the first of them.
+
+        Args:
+            supabase_client (supabase.Client): The Supabase client used for database interaction.
+            db_config (dict, optional): A dictionary containing configuration details for database tables.
+                It should include keys 'submission' and 'comment' for respective table names.
+            pii_masker (pii.masker, optional): The masker used. Use `pii.masker(processes=N)` to mask on N cores.
+                Defaults to None, creating a masker with default settings.
+            batch_size (int, optional): The number of rows written to the database per request. Defaults to 500.
+            page_size (int, optional): The number of rows read per request. Defaults to 1000.
+            checkpoint_path (str, optional): The path of the checkpoint file. Defaults to
+                "pii_backfill_checkpoint.json" in the working directory.
+
+        Raises:
+            ValueError: If db_config is not provided.
+        """
+        if db_config is None:
+            raise ValueError("Invalid input: db_config must be provided.")
+
+        self.supabase = supabase_client
+        self.submission_db_config = db_config["submission"]
+        self.comment_db_config = db_config["comment"]
+
+        self.pii_masker = pii_masker if pii_masker is not None else pii.masker()
+        self.page_size = page_size
+        self.checkpoint_path = checkpoint_path or os.path.join(os.getcwd(), "pii_backfill_checkpoint.json")
+
+        # Check and create "error_log" folder
+        self.error_log_path = os.path.join(os.getcwd(), "error_log")
+        os.makedirs(self.error_log_path, exist_ok=True)
+
+        # Masked texts are merged into the existing rows, leaving the other columns untouched
+        self.writer = writer(
+            self.supabase,
+            primary_keys={
+                self.submission_db_config: "submission_id",
+                self.comment_db_config: "comment_id",
+            },
+            batch_size=batch_size,
+            flush_interval=None,
+            error_log_path=self.error_log_path,
+            ignore_duplicates=False,
+        )
+
+    def _load_checkpoint(self) -> Dict[str, Any]:
+        if not os.path.exists(self.checkpoint_path):
+            return dict()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_checkpoint(self, table: str, last_key: Optional[Any]) -> None:
+        checkpoint = self._load_checkpoint()
+        checkpoint[table] = last_key
+        # Write to a temporary file first so an interruption never leaves a corrupted checkpoint
+        with open(f"{self.checkpoint_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(f"{self.checkpoint_path}.tmp", self.checkpoint_path)
+
+    def reset(self, table: str = None) -> None:
+        """
+        Forget the checkpoint, so the next run starts from the first row.
+
+        Args:
+            table (str, optional): Only reset this table. Defaults to None, resetting every table.
+        """
+        if table is None:
+            if os.path.exists(self.checkpoint_path):
+                os.remove(self.checkpoint_path)
+        else:
+            self._save_checkpoint(table, None)
+
+    def _backfill(self, table: str, primary_key: str, column: str, limit: Optional[int]) -> int:
+        last_key = self._load_checkpoint().get(table)
+        if last_key is not None:
+            console.log(f"Resuming DB-{table} after [bold red]{last_key}[/]")
+
+        pages = keyset.pages(
+            self.supabase.table(table),
+            [primary_key, column],
+            key=primary_key,
+            page_size=self.page_size,
+            limit=limit,
+            start_after=last_key,
+        )
+
+        masked_count = 0
+        for rows in track(stages.producer(pages, max_size=2), description=f"Masking PII in DB-{table}"):
+            texts = [row[column] for row in rows]
+            masked_texts = self.pii_masker.mask_batch(texts)
+
+            masked_rows = dict()
+            for row, text, masked_text in zip(rows, texts, masked_texts):
+                if masked_text != text:
+                    masked_rows[row[primary_key]] = {primary_key: row[primary_key], column: masked_text}
+
+            failed = self._write(table, list(masked_rows.values()))
+            masked_count += len(masked_rows) - len(failed)
+
+            # The checkpoint only moves forward over rows confirmed written, so failed rows are masked again
+            # by the next run
+            written = rows
+            if failed:
+                first_failed = next(index for index, row in enumerate(rows) if row[primary_key] in failed)
+                written = rows[:first_failed]
+            if written:
+                self._save_checkpoint(table, written[-1][primary_key])
+            if failed:
+                console.log(
+                    f"Failed to write {len(failed)} masked row(s) to DB-{table}, stopping before "
+                    f"[bold red]{rows[first_failed][primary_key]}[/]. Run the backfill again to resume"
+                )
+                break
+
+        console.log(f"{masked_count} row(s) masked in DB-{table}")
+        return masked_count
+
+    def _write(self, table: str, rows: List[dict], attempts: int = 2) -> Set[str]:
+        """Write masked rows, retrying the rows that failed, and return the primary keys still not written."""
+        primary_key = self.writer.primary_keys[table]
+        failed = set()
+        for _ in range(attempts):
+            for row in rows:
+                self.writer.add(table, row)
+            self.writer.flush(table)
+            failed = set(self.writer.take_failed(table)[table])
+            if not failed:
+                break
+            rows = [row for row in rows if row[primary_key] in failed]
+        return failed
+
+    def submission(self, limit: int = None) -> int:
+        """
+        Mask PII in the text of submissions.
+
+        Args:
+            limit (int, optional): The maximum number of rows to process in this run. Defaults to None, processing
+                all remaining rows.
+
+        Returns:
+            int: The number of submissions whose text was masked.
+        """
+        return self._backfill(self.submission_db_config, "submission_id", "text", limit)
+
+    def comment(self, limit: int = None) -> int:
+        """
+        Mask PII in the body of comments.
+
+        Args:
+            limit (int, optional): The maximum number of rows to process in this run. Defaults to None, processing
+                all remaining rows.
+
+        Returns:
+            int: The number of comments whose body was masked.
+        """
+        return self._backfill(self.comment_db_config, "comment_id", "body", limit)
+
+    def run(self) -> None:
+        """Mask PII in all submissions and comments, resuming from the checkpoint."""
+        self.submission()
+        self.comment()
+        self.pii_masker.close()
@@ -0,0 +1,237 @@
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+# Number of keys per SQLite `IN` query, under the default limit of 999 variables
+SQLITE_CHUNK_SIZE = 500
+
+
+class lru:
+    """
+    A thread-safe, in-process least-recently-used cache with an optional time-to-live.
+
+    Args:
+        max_size (int, optional): The maximum number of entries kept. Defaults to 100,000.
+        ttl (float, optional): The number of seconds an entry stays valid. Defaults to None, keeping entries
+            until they are evicted.
+    """
+
+    def __init__(self, max_size: int = 100_000, ttl: Optional[float] = None) -> None:
+        if max_size < 1:
+            raise ValueError("Invalid input: max_size must be a positive integer.")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.time() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache value under key, evicting the least recently used entry if the cache is full."""
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove every entry and reset the hit-rate statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dict[str, float]: The number of entries, hits and misses, and the hit rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups > 0 else 0.0,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class redditor_cache(lru):
+    """
+    Cache of redditors already stored in the database, keyed by redditor name.
+
+    Each entry holds the redditor id and the removed status ("active", "suspended" or None if unknown).
+    Suspended accounts are cached as well, so they only cost one profile and name lookup per run.
+
+    Args:
+        max_size (int, optional): The maximum number of redditors kept. Defaults to 100,000.
+        ttl (float, optional): The number of seconds a redditor stays cached. Defaults to None.
+    """
+
+    def add(self, name: str, redditor_id: Optional[str], removed: Optional[str] = None) -> None:
+        """
+        Record that a redditor is stored in the database.
+
+        Args:
+            name (str): The redditor name.
+            redditor_id (str, optional): The redditor id, if known.
+            removed (str, optional): The removed status of the redditor, if known.
+        """
+        self.set(name, (redditor_id, removed))
+
+    def warm(self, names: List[str]) -> None:
+        """
+        Pre-warm the cache with names already in the database, e.g. from `redditharbor.utils.fetch.user.name`.
+
+        Args:
+            names (List[str]): The redditor names stored in the database.
+        """
+        for name in names:
+            if name:
+                self.add(name, None)
+
+
+class mask_cache(lru):
+    """
+    Cache of PII masking results, keyed by a SHA-256 hash of the masker's configuration and the text.
+
+    Bot comments, copypastas and crossposted texts repeat across many rows, and are only masked once. Recently
+    used results are kept in memory. With `sqlite_path`, every result is also stored in a SQLite database, so the
+    cache survives restarts and can be shared between processes.
+
+    The configuration (`masker.config`: language, model tier, spaCy model and presidio version) is part of the
+    key, so maskers with different settings can share a cache without ever reading each other's results. Results
+    cached under another configuration, including those of earlier versions of RedditHarbor, are not reused.
+
+    Args:
+        max_size (int, optional): The maximum number of results kept in memory. Defaults to 100,000.
+        sqlite_path (str, optional): The path of the SQLite database. Defaults to None, keeping results in
+            memory only.
+    """
+
+    def __init__(self, max_size: int = 100_000, sqlite_path: Optional[str] = None) -> None:
+        super().__init__(max_size=max_size)
+        self.sqlite_path = sqlite_path
+        self.disk_hits = 0
+
+        self._connection = None
+        self._disk_lock = threading.Lock()
+        if sqlite_path is not None:
+            self._connection = sqlite3.connect(sqlite_path, check_same_thread=False)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS masked_text (key TEXT PRIMARY KEY, masked TEXT NOT NULL)"
+            )
+            self._connection.commit()
+
+    @staticmethod
+    def key(text: str, config: str) -> str:
+        """Return the cache key of a text masked with a masker configuration."""
+        return hashlib.sha256(f"{config}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get_many(self, texts: List[str], config: str) -> List[Optional[str]]:
+        """
+        Look up the masked version of each text, in memory first and then on disk.
+
+        Args:
+            texts (List[str]): The texts to look up.
+            config (str): The configuration of the masker, see `masker.config`.
+
+        Returns:
+            List[Optional[str]]: The masked texts, or None for texts not in the cache.
+        """
+        keys = [self.key(text, config) for text in texts]
+        results = [self.get(key) for key in keys]
+
+        missing = [key for key, result in zip(keys, results) if result is None]
+        if self._connection is None or not missing:
+            return results
+
+        found = dict()
+        with self._disk_lock:
+            for start in range(0, len(missing), SQLITE_CHUNK_SIZE):
+                chunk = missing[start : start + SQLITE_CHUNK_SIZE]
+                found.update(
+                    self._connection.execute(
+                        f"SELECT key, masked FROM masked_text WHERE key IN ({','.join('?' * len(chunk))})",
+                        chunk,
+                    ).fetchall()
+                )
+
+        for i, key in enumerate(keys):
+            if results[i] is None and key in found:
+                results[i] = found[key]
+                self.disk_hits += 1
+                self.set(key, found[key])
+        return results
+
+    def set_many(self, texts: List[str], masked_texts: List[str], config: str) -> None:
+        """
+        Cache the masked version of each text.
+
+        Args:
+            texts (List[str]): The original texts.
+            masked_texts (List[str]): The masked texts, in the same order.
+            config (str): The configuration of the masker, see `masker.config`.
+        """
+        rows = [(self.key(text, config), masked) for text, masked in zip(texts, masked_texts)]
+        for key, masked in rows:
+            self.set(key, masked)
+
+        if self._connection is not None:
+            with self._disk_lock:
+                self._connection.executemany("INSERT OR REPLACE INTO masked_text VALUES (?, ?)", rows)
+                self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove every entry kept in memory and reset the hit-rate statistics. Results on disk are kept."""
+        super().clear()
+        self.disk_hits = 0
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the cache statistics.
+
+        Returns:
+            Dict[str, float]: The number of entries in memory, memory and disk hits, misses, and the overall
+                hit rate.
+        """
+        stats = super().stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["disk_hits"] = self.disk_hits
+        stats["misses"] -= self.disk_hits
+        stats["hit_rate"] = (stats["hits"] + self.disk_hits) / lookups if lookups > 0 else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Close the SQLite database, if any."""
+        if self._connection is not None:
+            with self._disk_lock:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,341 @@
+import re
+import multiprocessing
+from importlib import metadata
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from rich.console import Console
+from redditharbor.dock import cache
+
+console = Console(record=True)
+
+# Cheap patterns for the PII presidio detects: email addresses, URLs and domain names, anything with a digit
+# (phone, credit card and IBAN numbers, IP addresses, dates) and relative dates written in lowercase
+CANDIDATE_PATTERNS = [
+    re.compile(r"\S@\S"),
+    re.compile(r"https?://|www\.|\w\.(?:com|org|net|edu|gov|io|co|uk|us|ca|de|fr|au|info|me|ly)\b", re.IGNORECASE),
+    re.compile(r"\d"),
+    re.compile(
+        r"\b(?:today|tonight|tomorrow|yesterday|ago|morning|afternoon|evening|night|week|weekend|month|year|decade|"
+        r"monday|tuesday|wednesday|thursday|friday|saturday|sunday|january|february|march|april|may|june|july|"
+        r"august|september|october|november|december|christmas|summer|winter|spring|autumn|fall)s?\b",
+        re.IGNORECASE,
+    ),
+]
+CAPITALIZED_WORD = re.compile(r"\b[A-Z][\w'-]*")
+
+# Capitalized words that start a sentence without being a name
+COMMON_SENTENCE_STARTS = frozenset(
+    """
+    i i'm i've i'd i'll im ive id a an the this that these those it it's its he she we they you your my our their
+    his her there here what why how when where who which if so and but or no yes yeah yep nope not just also
+    lol lmao omg wow ok okay thanks thank please same agreed true exactly literally honestly imagine edit
+    is are was were be do does did can could would should will have has had don't doesn't didn't can't isn't
+    that's there's what's let's see maybe well oh haha good great nice love all one some most even still then now
+    because since as in on for with to of at from any every people never always really actually probably sure
+    damn wait hey hi hello
+    """.split()
+)
+
+
+def has_pii_candidates(text: str) -> bool:
+    """
+    Pre-screen a text for anything presidio could flag as PII.
+
+    A text is a candidate if it matches an email, URL, digit or date pattern, or contains a capitalized word
+    that is not a common word at the start of a sentence (names, places and organisations). Texts that are not
+    candidates can skip the NLP pipeline.
+    """
+    if any(pattern.search(text) for pattern in CANDIDATE_PATTERNS):
+        return True
+
+    for match in CAPITALIZED_WORD.finditer(text):
+        if not _at_sentence_start(text, match.start()) or match.group().lower() not in COMMON_SENTENCE_STARTS:
+            return True
+    return False
+
+
+def _at_sentence_start(text: str, position: int) -> bool:
+    """Check if only whitespace separates position from the start of the text or the end of a sentence."""
+    position -= 1
+    while position >= 0 and text[position].isspace():
+        if text[position] == "\n":
+            return True
+        position -= 1
+    return position < 0 or text[position] in ".!?:;\"("
+
+
+# spaCy models of each model tier. The "regex" tier uses presidio's pattern recognizers only, without spaCy
+SPACY_MODELS = {"sm": "en_core_web_sm", "md": "en_core_web_md", "lg": "en_core_web_lg"}
+MODEL_TIERS = [*SPACY_MODELS, "regex"]
+
+
+def _download_spacy_model(model_name: str) -> None:
+    """Download a spaCy model if it is not installed."""
+    import spacy
+
+    if spacy.util.is_package(model_name):
+        return
+
+    import subprocess
+    import sys
+
+    console.log(f"[yellow]SpaCy model '{model_name}' not found. Downloading...[/yellow]")
+    try:
+        subprocess.check_call(
+            [sys.executable, "-m", "spacy", "download", model_name],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT
+        )
+        console.log(f"[green]Successfully downloaded {model_name}[/green]")
+    except subprocess.CalledProcessError:
+        raise RuntimeError(
+            "Failed to download spaCy model automatically.\n"
+            "Please install it manually by running:\n"
+            f"    python -m spacy download {model_name}"
+        )
+
+
+# The masker of each worker process, loaded once by `_initialize_worker`
+_worker_masker = None
+
+
+def _presidio_version() -> str:
+    """Return the installed version of presidio-analyzer, whose recognizers change between versions."""
+    try:
+        return metadata.version("presidio-analyzer")
+    except metadata.PackageNotFoundError:
+        return "none"
+
+
+def _initialize_worker(language: str, batch_size: int, model: str) -> None:
+    global _worker_masker
+    _worker_masker = masker(language=language, batch_size=batch_size, model=model)
+    _worker_masker._initialize()
+
+
+def _mask_in_worker(texts: List[str]) -> List[str]:
+    return _worker_masker._mask_texts(texts)
+
+
+class masker:
+    """
+    Mask (or anonymise) personally identifiable information (PII) in batches of texts with presidio.
+
+    Texts are analysed with presidio's `BatchAnalyzerEngine`, which runs spaCy's `nlp.pipe` over the whole batch
+    instead of calling the NLP pipeline once per text. The presidio and spaCy engines are loaded on first use, and
+    the spaCy model of the chosen tier is downloaded if it is not installed.
+
+    Args:
+        language (str, optional): The language of the texts. Defaults to "en".
+        model (str, optional): The model tier: "sm", "md" or "lg" for the spaCy English models of that size, or
+            "regex" for presidio's pattern-based recognizers only (email, phone, URL, credit card, IP, numeric
+            dates, ...), which needs no spaCy model but does not detect names or places. Defaults to "lg".
+        batch_size (int, optional): The number of texts processed per `nlp.pipe` batch. Defaults to 64.
+        processes (int, optional): The number of worker processes masking batches in parallel. Defaults to 1,
+            masking in the calling process.
+        prefilter (bool, optional): Skip the NLP pipeline for texts without any PII candidate (see
+            `has_pii_candidates`). Much faster on short comments, at a small cost in recall. Defaults to False.
+        result_cache (cache.mask_cache, optional): A cache of masked texts, which can be shared between maskers
+            and kept on disk. Results are keyed by `config`, so maskers with other settings never read them.
+            Defaults to None, masking every text.
+
+    Note:
+        With `processes > 1`, each worker process loads the presidio and spaCy engines once when it starts, and
+        is then fed batches through the pool's queue. Results are returned in input order. The workers are
+        started with "spawn", so scripts must be guarded by `if __name__ == "__main__":`.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        model: str = "lg",
+        batch_size: int = 64,
+        processes: int = 1,
+        prefilter: bool = False,
+        result_cache: cache.mask_cache = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Invalid input: batch_size must be a positive integer.")
+        if processes < 1:
+            raise ValueError("Invalid input: processes must be a positive integer.")
+        if model not in MODEL_TIERS:
+            raise ValueError(f"Invalid input: model must be one of {MODEL_TIERS}")
+
+        self.language = language
+        self.model = model
+        self.batch_size = batch_size
+        self.processes = processes
+        self.prefilter = prefilter
+        self.result_cache = result_cache
+        self._pool = None
+
+        # Identifies the recognizers a result was produced with, keying the result cache
+        self.config = "|".join(
+            [language, model, SPACY_MODELS.get(model, "patterns"), f"presidio-{_presidio_version()}"]
+        )
+
+        # Number of texts pre-screened and skipped by the pre-filter
+        self.screened = 0
+        self.skipped = 0
+
+        # Initialize PII components as None - will be loaded on demand
+        self.analyzer = None
+        self.batch_analyzer = None
+        self.recognizers = None
+        self.anonymizer = None
+
+    def _initialize(self) -> None:
+        """
+        Lazily initialize PII detection and anonymization tools.
+        Downloads the spaCy model of the chosen tier if not available.
+        """
+        if self.anonymizer is not None:
+            return  # Already initialized
+
+        try:
+            from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine
+            from presidio_anonymizer import AnonymizerEngine
+
+            if self.model == "regex":
+                from presidio_analyzer import RecognizerRegistry
+                from presidio_analyzer.predefined_recognizers import SpacyRecognizer
+
+                # Keep the pattern and checksum based recognizers only, dropping the NER-based ones
+                registry = RecognizerRegistry()
+                registry.load_predefined_recognizers(languages=[self.language])
+                self.recognizers = [
+                    recognizer
+                    for recognizer in registry.get_recognizers(language=self.language, all_fields=True)
+                    if not isinstance(recognizer, SpacyRecognizer)
+                ]
+            else:
+                from presidio_analyzer.nlp_engine import NlpEngineProvider
+
+                model_name = SPACY_MODELS[self.model]
+                _download_spacy_model(model_name)
+                nlp_engine = NlpEngineProvider(
+                    nlp_configuration={
+                        "nlp_engine_name": "spacy",
+                        "models": [{"lang_code": self.language, "model_name": model_name}],
+                    }
+                ).create_engine()
+                self.analyzer = AnalyzerEngine(nlp_engine=nlp_engine, supported_languages=[self.language])
+                self.batch_analyzer = BatchAnalyzerEngine(analyzer_engine=self.analyzer)
+
+            self.anonymizer = AnonymizerEngine()
+
+        except ImportError as e:
+            raise ImportError(
+                "PII masking requires additional dependencies. "
+                "Please install with: pip install redditharbor[pii]"
+            ) from e
+
+    @property
+    def capacity(self) -> int:
+        """The number of texts needed to give every worker process a full batch."""
+        return self.batch_size * self.processes
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the pre-filter statistics.
+
+        Returns:
+            Dict[str, float]: The number of texts screened and skipped, and the skip rate.
+        """
+        return {
+            "screened": self.screened,
+            "skipped": self.skipped,
+            "skip_rate": self.skipped / self.screened if self.screened > 0 else 0.0,
+        }
+
+    def mask(self, text: Optional[str]) -> Optional[str]:
+        """Mask PII in a single text."""
+        return self.mask_batch([text])[0]
+
+    def mask_batch(self, texts: List[Optional[str]]) -> List[Optional[str]]:
+        """
+        Mask PII in a list of texts.
+
+        Args:
+            texts (List[Optional[str]]): The texts to mask. Empty texts and None are returned unchanged.
+
+        Returns:
+            List[Optional[str]]: The masked texts, in the same order as `texts`.
+        """
+        indices = [i for i, text in enumerate(texts) if text]
+        masked = list(texts)
+
+        if self.prefilter:
+            candidates = [i for i in indices if has_pii_candidates(texts[i])]
+            self.screened += len(indices)
+            self.skipped += len(indices) - len(candidates)
+            indices = candidates
+
+        if self.result_cache is not None and indices:
+            cached_texts = self.result_cache.get_many([texts[i] for i in indices], self.config)
+            for i, cached_text in zip(indices, cached_texts):
+                masked[i] = cached_text
+            indices = [i for i, cached_text in zip(indices, cached_texts) if cached_text is None]
+
+        if not indices:
+            return masked
+
+        # Identical texts in a batch (bots, copypastas) are only masked once
+        unique_texts = list(dict.fromkeys(texts[i] for i in indices))
+        if self.processes > 1 and len(unique_texts) > self.batch_size:
+            unique_masked_texts = self._mask_in_pool(unique_texts)
+        else:
+            unique_masked_texts = self._mask_texts(unique_texts)
+
+        if self.result_cache is not None:
+            self.result_cache.set_many(unique_texts, unique_masked_texts, self.config)
+
+        masked_by_text = dict(zip(unique_texts, unique_masked_texts))
+        for i in indices:
+            masked[i] = masked_by_text[texts[i]]
+
+        return masked
+
+    def _mask_texts(self, texts: List[str]) -> List[str]:
+        """Mask PII in a list of non-empty texts in the calling process."""
+        self._initialize()
+        if self.model == "regex":
+            analyzer_results = [self._analyze_patterns(text) for text in texts]
+        else:
+            analyzer_results = self.batch_analyzer.analyze_iterator(
+                texts, language=self.language, batch_size=self.batch_size
+            )
+        return [
+            self.anonymizer.anonymize(text=text, analyzer_results=results).text
+            for text, results in zip(texts, analyzer_results)
+        ]
+
+    def _analyze_patterns(self, text: str) -> list:
+        """Run the pattern-based recognizers of the "regex" tier on a text."""
+        from presidio_analyzer import EntityRecognizer
+
+        results = []
+        for recognizer in self.recognizers:
+            results.extend(
+                recognizer.analyze(text=text, entities=recognizer.supported_entities, nlp_artifacts=None) or []
+            )
+        return EntityRecognizer.remove_duplicates(results)
+
+    def _mask_in_pool(self, texts: List[str]) -> List[str]:
+        """Split the texts into batches, mask them across the worker processes and merge them back in order."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(self.language, self.batch_size, self.model),
+            )
+
+        batches = [texts[start : start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+        return [text for batch in self._pool.map(_mask_in_worker, batches) for text in batch]
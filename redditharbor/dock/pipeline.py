@@ -1,6 +1,7 @@
 import os
+import json
 import logging.config
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Iterable, Iterator, Union
 import datetime
 import praw
 import supabase
@@ -10,28 +11,345 @@ from rich.progress import track
 import threading
 from threading import Event
 import time
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from redditharbor.dock.writer import writer
+from redditharbor.dock import cache, pii, stages
+from redditharbor.utils import fetch, keyset, ratelimit
 
 console = Console(record=True)
 install()
 
 logging.config.dictConfig({"version": 1, "disable_existing_loggers": True})
 
+# Number of ids sent per `in_` filter. Keeps the PostgREST query string well under URL length limits.
+IN_FILTER_CHUNK_SIZE = 200
+
+# Maximum number of accounts Reddit returns per bulk user data request.
+PARTIAL_REDDITORS_BATCH_SIZE = 100
+
+# Maximum number of fullnames Reddit resolves per `reddit.info()` request.
+INFO_BATCH_SIZE = 100
+
+# Maximum length of the "a+b+c" path segment of a multireddit listing, keeping its URL (with the listing's
+# query string) under the 2,048 characters commonly accepted, and maximum number of subreddits it combines.
+MULTIREDDIT_MAX_LENGTH = 1800
+MULTIREDDIT_MAX_SUBREDDITS = 100
+
+# Number of listed submissions whose existence in the DB is looked up at once (one listing page), and number of
+# submissions with their comment trees held while looked up.
+SUBMISSION_PREFETCH_SIZE = 100
+COMMENT_TREE_PREFETCH_SIZE = 10
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Group the items of an iterable into lists of up to `size` items, consuming it lazily."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def multireddit_chunks(
+    subreddits: List[str],
+    max_length: int = MULTIREDDIT_MAX_LENGTH,
+    max_subreddits: int = MULTIREDDIT_MAX_SUBREDDITS,
+) -> List[List[str]]:
+    """
+    Split subreddits into groups small enough to be combined into one "a+b+c" multireddit.
+
+    Args:
+        subreddits (List[str]): The subreddit names.
+        max_length (int, optional): The maximum length of a group joined with "+". Defaults to 1800.
+        max_subreddits (int, optional): The maximum number of subreddits per group. Defaults to 100.
+
+    Returns:
+        List[List[str]]: The groups, in the order of the subreddits.
+    """
+    chunks = []
+    chunk, length = [], 0
+    for subreddit in dict.fromkeys(subreddits):
+        added_length = len(subreddit) + (1 if chunk else 0)
+        if chunk and (length + added_length > max_length or len(chunk) >= max_subreddits):
+            chunks.append(chunk)
+            chunk, length = [], 0
+            added_length = len(subreddit)
+        chunk.append(subreddit)
+        length += added_length
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def submission_row(
+    submission: praw.models.reddit.submission.Submission,
+    redditor_id: str,
+    accessed_at: datetime.datetime,
+) -> Dict[str, Any]:
+    """
+    Build the database row of a submission.
+
+    Args:
+        submission (praw.models.reddit.submission.Submission): The submission, from PRAW or Async PRAW.
+        redditor_id (str): The id of the submission's author.
+        accessed_at (datetime.datetime): When the submission was fetched, used to key its score and counts.
+
+    Returns:
+        Dict[str, Any]: The row, ready to be written to the submission table.
+    """
+    submission_id = submission.id
+    created_at = datetime.datetime.fromtimestamp(submission.created_utc)
+    title = submission.title
+
+    # Handle selftext
+    selftext = submission.selftext
+
+    subreddit = submission.subreddit.display_name
+    permalink = f"https://www.reddit.com{submission.permalink}"
+
+    # Handle attachments
+    attachment = None
+    if submission.is_reddit_media_domain:
+        if submission.is_video:
+            attachment = {"video": submission.url}
+        elif ".jpg" in submission.url:
+            attachment = {"jpg": submission.url}
+        elif ".png" in submission.url:
+            attachment = {"png": submission.url}
+        elif ".gif" in submission.url:
+            attachment = {"gif": submission.url}
+    elif not submission.is_self:
+        attachment = {"url": submission.url}
+
+    # Handle polls
+    poll = None
+    if hasattr(submission, "poll_data"):
+        vote_ends_at = datetime.datetime.fromtimestamp(
+            submission.poll_data.voting_end_timestamp / 1000
+        )
+        options = submission.poll_data.options
+        Options = {str(option): "unavailable" for option in options}
+
+        poll = {
+            "total_vote_count": submission.poll_data.total_vote_count,
+            "vote_ends_at": vote_ends_at.isoformat(timespec="seconds"),
+            "options": Options,
+            "closed": vote_ends_at <= datetime.datetime.utcnow(),
+        }
+
+        if poll["closed"]:
+            for option in options:
+                Options[str(option)] = str(option.vote_count)
+
+    # Handle flairs
+    flair = {
+        "link": submission.link_flair_text,
+        "author": submission.author_flair_text,
+    }
+
+    # Handle awards
+    awards = {
+        "total_awards_count": submission.total_awards_received,
+        "total_awards_price": 0,
+        "list": None,
+    }
+
+    if submission.total_awards_received > 0:
+        awards_list = {}
+        total_awards_price = 0
+        for award in submission.all_awardings:
+            awards_list[award["name"]] = [award["count"], award["coin_price"]]
+            total_awards_price += award["coin_price"] * award["count"]
+        awards["total_awards_price"] = total_awards_price
+        awards["list"] = awards_list
+
+    score = {accessed_at.isoformat(timespec="seconds"): submission.score}
+    upvote_ratio = {accessed_at.isoformat(timespec="seconds"): submission.upvote_ratio}
+    num_comments = {accessed_at.isoformat(timespec="seconds"): submission.num_comments}
+
+    edited = submission.edited is not False
+    archived = submission.archived
+    removed = submission.removed_by_category is not None
+
+    row = {
+        "submission_id": submission_id,
+        "redditor_id": redditor_id,
+        "created_at": created_at.isoformat(),
+        "title": title,
+        "text": selftext,
+        "subreddit": subreddit,
+        "permalink": permalink,
+        "attachment": attachment,
+        "poll": poll,
+        "flair": flair,
+        "awards": awards,
+        "score": score,
+        "upvote_ratio": upvote_ratio,
+        "num_comments": num_comments,
+        "edited": edited,
+        "archived": archived,
+        "removed": removed,
+    }
+    return row
+
+
+def comment_row(
+    comment: praw.models.reddit.comment.Comment,
+    redditor_id: str,
+    accessed_at: datetime.datetime,
+) -> Dict[str, Any]:
+    """
+    Build the database row of a comment.
+
+    Args:
+        comment (praw.models.reddit.comment.Comment): The comment, from PRAW or Async PRAW.
+        redditor_id (str): The id of the comment's author.
+        accessed_at (datetime.datetime): When the comment was fetched, used to key its score.
+
+    Returns:
+        Dict[str, Any]: The row, ready to be written to the comment table.
+    """
+    comment_id = comment.id
+    link_id = comment.link_id.replace("t3_", "")
+    subreddit = str(comment.subreddit)
+    parent_id = comment.parent_id
+    created_at = datetime.datetime.fromtimestamp(comment.created_utc)
+
+    # Handle body text
+    selfbody = comment.body
+    removed = None
+
+    if selfbody == "[deleted]":
+        selfbody = None
+        removed = "deleted"
+    elif selfbody == "[removed]":
+        selfbody = None
+        removed = "removed"
+
+    edited = comment.edited is not False
+    score = {accessed_at.isoformat(timespec="seconds"): comment.score}
+
+    row = {
+        "comment_id": comment_id,
+        "link_id": link_id,
+        "subreddit": subreddit,
+        "parent_id": parent_id,
+        "redditor_id": redditor_id,
+        "created_at": created_at.isoformat(),
+        "body": selfbody,
+        "score": score,
+        "edited": edited,
+        "removed": removed,
+    }
+    return row
+
+
+def partial_redditor_row(partial_redditor: Any) -> Dict[str, Any]:
+    """
+    Build the enriched columns of a redditor returned by Reddit's bulk user data endpoint.
+
+    The endpoint only reports link and comment karma, so `karma` holds "comment", "link" and their sum as "total",
+    without the "awardee" and "awarder" karma stored by full collection.
+
+    Args:
+        partial_redditor (Any): A `PartialRedditor`, from PRAW or Async PRAW.
+
+    Returns:
+        Dict[str, Any]: The redditor's id, name, creation date, karma and removed status.
+    """
+    return {
+        "redditor_id": partial_redditor.fullname.replace("t2_", ""),
+        "name": partial_redditor.name,
+        "created_at": datetime.datetime.fromtimestamp(partial_redditor.created_utc).isoformat(),
+        "karma": {
+            "comment": partial_redditor.comment_karma,
+            "link": partial_redditor.link_karma,
+            "total": partial_redditor.comment_karma + partial_redditor.link_karma,
+        },
+        "removed": "active",
+    }
+
+
+# Guards the files of redditors left to enrich, which collect instances of a process may share
+_unenriched_lock = threading.Lock()
+
+
+def take_unenriched_redditors(path: str) -> List[str]:
+    """Return the ids of redditors whose enrichment failed in an earlier run, removing them from the file."""
+    with _unenriched_lock:
+        if not os.path.exists(path):
+            return []
+        with open(path, "r", encoding="utf-8") as f:
+            redditor_ids = json.load(f)
+        os.remove(path)
+    return redditor_ids
+
+
+def save_unenriched_redditors(path: str, redditor_ids: List[str]) -> None:
+    """Add the ids of redditors whose enrichment failed to the file, for a later run to retry."""
+    if not redditor_ids:
+        return
+    with _unenriched_lock:
+        saved = []
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        # Write to a temporary file first so an interruption never leaves a corrupted file
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(list(dict.fromkeys(saved + list(redditor_ids))), f)
+        os.replace(f"{path}.tmp", path)
+
 
 class collect:
     def __init__(
         self,
-        reddit_client: praw.Reddit,
+        reddit_client: Union[praw.Reddit, ratelimit.client_pool],
         supabase_client: supabase.Client,
         db_config: dict = None,
+        batch_size: int = 500,
+        flush_interval: Optional[float] = 5,
+        redditor_cache: cache.redditor_cache = None,
+        deferred_enrichment: bool = False,
+        mod_and_trophy: bool = False,
+        pii_masker: pii.masker = None,
+        pii_model: str = "lg",
+        pipelined: bool = False,
+        queue_size: int = 8,
     ):
         """
         Initialize the Collect instance for collecting data from Reddit and storing it in Supabase.
 
         Args:
-            reddit_client (praw.Reddit): The Reddit client used for interacting with Reddit's API.
+            reddit_client (praw.Reddit): The Reddit client used for interacting with Reddit's API, or a
+                `ratelimit.client_pool` (see `login.reddit_pool`) to spread listings, users and submissions across
+                several clients, walking the listings of different clients concurrently.
             supabase_client (supabase.Client): The Supabase client used for database interaction.
             db_config (dict, optional): A dictionary containing configuration details for database tables.
                 It should include keys 'user', 'submission', and 'comment' for respective table names.
+            batch_size (int, optional): The number of rows written to the database per request. Defaults to 500.
+            flush_interval (float, optional): The maximum number of seconds collected rows are buffered before
+                being written to the database. Defaults to 5.
+            redditor_cache (redditor_cache, optional): A cache of redditors already stored in the database, which can
+                be shared between collect instances. Defaults to None, creating a new cache for this instance.
+            deferred_enrichment (bool, optional): Store new redditors with their id and name only, and fill in their
+                karma and creation date later in bulk, 100 redditors per API request (see `enrich_redditors`).
+                Defaults to False.
+            mod_and_trophy (bool, optional): Collect the subreddits moderated and the trophies of new redditors.
+                Costs two extra API requests per redditor. Defaults to False.
+            pii_masker (pii.masker, optional): The masker used when collecting with `mask_pii=True`. Texts are
+                masked in batches of its batch size, across its worker processes if any. Defaults to None,
+                creating a masker with the `pii_model` tier.
+            pii_model (str, optional): The PII model tier used when no pii_masker is given: "sm", "md" or "lg"
+                for the spaCy English model of that size, or "regex" for pattern-based recognizers only. Smaller
+                tiers load and run faster at a cost in recall (see benchmarks/pii_models.py). Defaults to "lg".
+            pipelined (bool, optional): Run collection as concurrent stages connected by bounded queues: listings
+                and comment trees are fetched from Reddit in a background thread, rows are built and PII is masked
+                in the calling thread and a masking thread, and batches are written to the database from a writer
+                thread. Defaults to False, running every step in turn.
+            queue_size (int, optional): The maximum number of submissions fetched ahead when pipelined.
+                Defaults to 8.
 
         Raises:
             ValueError: If db_config is not provided.
@@ -53,61 +371,65 @@ class collect:
         self.submission_db = self.supabase.table(self.submission_db_config)
         self.comment_db = self.supabase.table(self.comment_db_config)
 
-        # Initialize PII components as None - will be loaded on demand
-        self.pii_analyzer = None
-        self.pii_anonymizer = None
+        # PII engines are loaded on demand. Rows waiting to be masked are held back from the writer and masked
+        # in batches
+        self.pii_masker = pii_masker if pii_masker is not None else pii.masker(model=pii_model)
+        self._unmasked_rows = []
 
         # Check and create "error_log" folder
         self.error_log_path = os.path.join(os.getcwd(), "error_log")
         os.makedirs(self.error_log_path, exist_ok=True)
 
-    def _initialize_pii_tools(self):
+        # Rows are buffered and written in batches, ignoring rows already in the DB
+        self.writer = writer(
+            self.supabase,
+            primary_keys={
+                self.redditor_db_config: "redditor_id",
+                self.submission_db_config: "submission_id",
+                self.comment_db_config: "comment_id",
+            },
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+            error_log_path=self.error_log_path,
+            background=pipelined,
+        )
+
+        # Redditors already in the DB, shared by all collect methods to skip repeated lookups
+        self.redditor_cache = (
+            redditor_cache if redditor_cache is not None else cache.redditor_cache()
+        )
+
+        self.deferred_enrichment = deferred_enrichment
+        self.mod_and_trophy = mod_and_trophy
+        self._unenriched_redditor_ids = []
+        self.unenriched_path = os.path.join(self.error_log_path, f"unenriched_{self.redditor_db_config}.json")
+
+        # Stages of the pipelined mode. Setting the stop event stops fetching after the current submission
+        self.pipelined = pipelined
+        self.queue_size = queue_size
+        self.stop_event = Event()
+        self._mask_stage = (
+            stages.worker(self._mask_rows, max_size=2, name="pii masker") if pipelined else None
+        )
+
+    def warm_redditor_cache(self, limit: int = None) -> None:
         """
-        Lazily initialize PII detection and anonymization tools.
-        Downloads required spacy model if not available.
+        Pre-warm the redditor cache with the names already stored in the user table.
+
+        Args:
+            limit (int, optional): The maximum number of names to fetch. Defaults to None, fetching all.
         """
-        if self.pii_analyzer is not None:
-            return  # Already initialized
-        
-        try:
-            from presidio_analyzer import AnalyzerEngine
-            from presidio_anonymizer import AnonymizerEngine
-            import spacy
-            
-            # Try to load the spacy model
-            try:
-                spacy.load("en_core_web_lg")
-            except OSError:
-                # Model not found, attempt to download it
-                import subprocess
-                import sys
-                
-                console.log("[yellow]SpaCy model 'en_core_web_lg' not found. Downloading...[/yellow]")
-                try:
-                    subprocess.check_call(
-                        [sys.executable, "-m", "spacy", "download", "en_core_web_lg"],
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.STDOUT
-                    )
-                    console.log("[green]Successfully downloaded en_core_web_lg[/green]")
-                except subprocess.CalledProcessError:
-                    raise RuntimeError(
-                        "Failed to download spaCy model automatically.\n"
-                        "Please install it manually by running:\n"
-                        "    python -m spacy download en_core_web_lg"
-                    )
-            
-            self.pii_analyzer = AnalyzerEngine()
-            self.pii_anonymizer = AnonymizerEngine()
-            
-        except ImportError as e:
-            raise ImportError(
-                "PII masking requires additional dependencies. "
-                "Please install with: pip install redditharbor[pii]"
-            ) from e
+        names = fetch.user(self.supabase, self.redditor_db_config).name(limit=limit)
+        self.redditor_cache.warm(names)
+        console.log(
+            f"Redditor cache warmed with {len(names)} name(s) from DB-{self.redditor_db_config}"
+        )
 
     def _check_redditor_exists(self, redditor_id: str) -> bool:
-        """Check if a redditor exists in the database."""
+        """Check if a redditor exists in the database or is waiting to be written."""
+        if self.writer.pending(self.redditor_db_config, redditor_id):
+            return True
+
         result = (
             self.redditor_db.select("redditor_id")
             .eq("redditor_id", redditor_id)
@@ -116,25 +438,258 @@ class collect:
         )
         return len(result) == 1
 
+    def _select_existing(self, db, column: str, values: List[str]) -> set:
+        """Return the subset of values already present in a table column, querying in chunks."""
+        values = list(dict.fromkeys(value for value in values if value))
+        existing = set()
+
+        for start in range(0, len(values), IN_FILTER_CHUNK_SIZE):
+            chunk = values[start : start + IN_FILTER_CHUNK_SIZE]
+            result = (
+                db.select(column)
+                .in_(column, chunk)
+                .execute()
+                .model_dump()["data"]
+            )
+            existing.update(row[column] for row in result)
+
+        return existing
+
+    @staticmethod
+    def _author_id(praw_models: praw.models) -> Optional[str]:
+        """Return the author's redditor id from the listing data, without fetching the profile."""
+        author_fullname = getattr(praw_models, "author_fullname", None)
+        if author_fullname and author_fullname.startswith("t2_"):
+            return author_fullname[3:]
+        return None
+
     def _check_submission_exists(self, submission_id: str) -> bool:
-        """Check if a submission exists in the database."""
-        result = (
-            self.submission_db.select("submission_id")
-            .eq("submission_id", submission_id)
-            .execute()
-            .dict()["data"]
+        """Check if a submission exists in the database or is waiting to be written."""
+        if self.writer.pending(self.submission_db_config, submission_id):
+            return True
+        return bool(self._select_existing(self.submission_db, "submission_id", [submission_id]))
+
+    def _prefetch_submissions(self, submissions: List[praw.models.reddit.submission.Submission]) -> set:
+        """Return the ids of the submissions already in the database, looked up at once."""
+        return self._select_existing(
+            self.submission_db, "submission_id", [submission.id for submission in submissions]
         )
-        return len(result) == 1
 
-    def _check_comment_exists(self, comment_id: str) -> bool:
-        """Check if a comment exists in the database."""
-        result = (
-            self.comment_db.select("comment_id")
-            .eq("comment_id", comment_id)
-            .execute()
-            .dict()["data"]
+    def _prefetch_comments(
+        self, comments: List[praw.models.reddit.comment.Comment], insert_redditor: bool = True
+    ) -> Tuple[List[praw.models.reddit.comment.Comment], set]:
+        """
+        Resolve database existence for a whole list of comments and their authors.
+
+        Args:
+            comments (List[praw.models.reddit.comment.Comment]): The comments to check.
+            insert_redditor (bool, optional): Whether the authors will be inserted. Authors are only looked up
+                when they are. Defaults to True.
+
+        Returns:
+            Tuple[List[praw.models.reddit.comment.Comment], set]: The comments not yet in the database and
+            the set of their authors' redditor ids that are already in the database (empty when
+            insert_redditor is False).
+        """
+        existing_comment_ids = self._select_existing(
+            self.comment_db, "comment_id", [comment.id for comment in comments]
         )
-        return len(result) == 1
+        new_comments = [
+            comment for comment in comments if comment.id not in existing_comment_ids
+        ]
+
+        if existing_comment_ids:
+            console.log(
+                f"{len(existing_comment_ids)} comment(s) already in DB-{self.comment_db_config}"
+            )
+
+        # Authors that are not inserted are never checked against the database
+        if not insert_redditor:
+            return new_comments, set()
+
+        existing_redditor_ids = self._select_existing(
+            self.redditor_db,
+            "redditor_id",
+            [self._author_id(comment) for comment in new_comments],
+        )
+        return new_comments, existing_redditor_ids
+
+    def _queue_row(self, table: str, row: dict, text_column: str, mask_pii: bool) -> None:
+        """Queue a row for writing. With mask_pii, the row is held back until its text is masked in a batch."""
+        if mask_pii and row[text_column]:
+            self._unmasked_rows.append((table, row, text_column))
+            if len(self._unmasked_rows) >= self.pii_masker.capacity:
+                self._mask_pending_rows()
+        else:
+            self.writer.add(table, row)
+
+    def _mask_pending_rows(self) -> None:
+        """Mask the text of all held back rows in one batch (in the masking stage when pipelined)."""
+        pending, self._unmasked_rows = self._unmasked_rows, []
+        if not pending:
+            return
+
+        if self._mask_stage is not None:
+            self._mask_stage.submit(pending)
+        else:
+            self._mask_rows(pending)
+
+    def _mask_rows(self, pending: List[Tuple[str, dict, str]]) -> None:
+        """Mask the text of a batch of held back rows and queue them for writing."""
+        try:
+            masked_texts = self.pii_masker.mask_batch([row[column] for _, row, column in pending])
+        except Exception as error:
+            console.log(f"Failed to mask a batch of {len(pending)} text(s): [bold red]{error}[/]. Retrying one by one")
+            masked_texts = [None] * len(pending)
+            for i, (table, row, column) in enumerate(pending):
+                key = row[self.writer.primary_keys[table]]
+                try:
+                    masked_texts[i] = self.pii_masker.mask(row[column])
+                except Exception as error:
+                    console.log(f"{table}_{key}: [bold red]{error}[/]")
+                    console.print_exception()
+                    console.save_html(os.path.join(self.error_log_path, f"{table}_{key}.html"))
+
+        for (table, row, column), masked_text in zip(pending, masked_texts):
+            # Rows that could not be masked are never written unmasked
+            if masked_text is not None:
+                row[column] = masked_text
+                self.writer.add(table, row)
+
+    def _flush_inserted(self, inserted_before: Dict[str, int]) -> Dict[str, int]:
+        """Write all buffered rows and return the number of rows inserted per table since `inserted_before`."""
+        self._mask_pending_rows()
+        if self._mask_stage is not None:
+            self._mask_stage.join()
+        if self.pii_masker.prefilter and self.pii_masker.screened:
+            stats = self.pii_masker.stats()
+            console.log(
+                f"PII pre-filter skipped {stats['skipped']} of {stats['screened']} text(s) ({stats['skip_rate']:.1%})"
+            )
+        if self.pii_masker.result_cache is not None and len(self.pii_masker.result_cache):
+            stats = self.pii_masker.result_cache.stats()
+            console.log(f"PII mask cache hit rate: {stats['hit_rate']:.1%}")
+        if self._unenriched_redditor_ids or os.path.exists(self.unenriched_path):
+            self.enrich_redditors()
+        self.writer.flush()
+        return {
+            table: count - inserted_before.get(table, 0)
+            for table, count in self.writer.inserted.items()
+        }
+
+    def close(self) -> None:
+        """Stop fetching, write every pending row and shut down the background stages and PII workers."""
+        self.stop_event.set()
+        self._flush_inserted(dict(self.writer.inserted))
+        if self._mask_stage is not None:
+            self._mask_stage.close()
+        self.writer.close()
+        self.pii_masker.close()
+
+    def _stage(self, items: Iterator[Any]) -> Iterator[Any]:
+        """Fetch items in a background stage when pipelined."""
+        if not self.pipelined:
+            return items
+        return stages.producer(items, max_size=self.queue_size, stop_event=self.stop_event)
+
+    def _listing(
+        self,
+        subreddits: List[str],
+        sort_types: List[str],
+        limit: Optional[int],
+        level: Optional[int] = 1,
+        comments: bool = False,
+        multireddit: bool = False,
+    ) -> Iterator[Tuple[praw.models.reddit.submission.Submission, Optional[list]]]:
+        """
+        Walk the submission listings of subreddits, expanding comment trees if requested.
+
+        With a client pool, each listing is walked by the next client of the pool, and the listings are walked
+        concurrently, one thread per client. With multireddit, subreddits are combined into "a+b+c" listings.
+
+        Yields:
+            Tuple[Submission, Optional[list]]: Each submission and its comments, or None if comments were not
+            requested or are already in the database.
+        """
+        groups = multireddit_chunks(subreddits) if multireddit else [[subreddit] for subreddit in subreddits]
+        listings = [
+            self._walk_listing(ratelimit.next_client(self.reddit), group, sort_type, limit, level, comments)
+            for group in groups
+            for sort_type in sort_types
+        ]
+        if isinstance(self.reddit, ratelimit.client_pool) and len(self.reddit) > 1:
+            return stages.merge(listings, workers=len(self.reddit), max_size=self.queue_size, stop_event=self.stop_event)
+        return itertools.chain.from_iterable(listings)
+
+    def _walk_listing(
+        self,
+        reddit_client: praw.Reddit,
+        subreddits: List[str],
+        sort_type: str,
+        limit: Optional[int],
+        level: Optional[int],
+        comments: bool,
+    ) -> Iterator[Tuple[praw.models.reddit.submission.Submission, Optional[list]]]:
+        """Walk one submission listing of a subreddit, or of a multireddit of several subreddits, with the given client."""
+        subreddit = "+".join(subreddits)
+        console.print(f"[bold]subreddit: {subreddit}[/] {sort_type}", justify="center")
+        r_ = reddit_client.subreddit(subreddit)
+
+        if len(subreddits) == 1:
+            submissions = getattr(r_, sort_type)(limit=limit)
+        else:
+            # The combined listing is walked until every subreddit has its own limit of submissions
+            submissions = self._fan_out(getattr(r_, sort_type)(limit=None), subreddits, limit)
+
+        for submission in submissions:
+            if not comments:
+                yield submission, None
+                continue
+
+            try:
+                # Check if comments of submission were crawled
+                if self._check_submission_comments_exist(submission.id):
+                    console.log(
+                        f"Submission Link [bold red]{submission.id}[/] already in DB-{self.comment_db_config}"
+                    )
+                    yield submission, None
+                    continue
+
+                submission.comments.replace_more(limit=level)
+                submission_comments = submission.comments.list()
+
+            except Exception as error:
+                console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                console.print_exception()
+                console.save_html(
+                    os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                )
+                continue
+
+            yield submission, submission_comments
+
+    @staticmethod
+    def _fan_out(
+        submissions: Iterator[praw.models.reddit.submission.Submission],
+        subreddits: List[str],
+        limit: Optional[int],
+    ) -> Iterator[praw.models.reddit.submission.Submission]:
+        """Yield the submissions of a multireddit listing, up to `limit` per subreddit."""
+        counts = {subreddit.lower(): 0 for subreddit in subreddits}
+        full = 0
+
+        for submission in submissions:
+            subreddit = submission.subreddit.display_name.lower()
+            if subreddit not in counts or (limit is not None and counts[subreddit] >= limit):
+                continue
+
+            counts[subreddit] += 1
+            yield submission
+
+            if limit is not None and counts[subreddit] == limit:
+                full += 1
+                if full == len(counts):
+                    return
 
     def _check_submission_comments_exist(self, submission_id: str) -> bool:
         """Check if comments for a submission exist in the database."""
@@ -146,35 +701,43 @@ class collect:
         )
         return len(result) >= 1
 
-    def _mask_text_pii(self, text: str, language: str = "en") -> str:
-        """Mask PII in text using presidio."""
-        if not text:
-            return text
-        
-        self._initialize_pii_tools()
-        pii_results = self.pii_analyzer.analyze(
-            text=text, language=language, return_decision_process=False
-        )
-        return self.pii_anonymizer.anonymize(
-            text=text, analyzer_results=pii_results
-        ).text
-
-    def redditor_data(self, praw_models: praw.models, insert: bool) -> Tuple[str, bool]:
+    def redditor_data(
+        self,
+        praw_models: praw.models,
+        insert: bool,
+        existing_redditor_ids: Optional[set] = None,
+    ) -> Tuple[str, bool]:
         """
         Collects and stores data related to a specific Redditor.
 
         Args:
             praw_models (praw.models): An object containing praw models.
             insert (bool): Insert redditor data to DB. 
+            existing_redditor_ids (set, optional): Redditor ids already known to be in the DB. When given, it is
+                consulted instead of querying the DB, and updated with every redditor found or inserted.
 
         Returns:
-            Tuple[str, bool]: A tuple containing the unique identifier of the Redditor collected and a boolean indicating whether the Redditor was inserted in the database.
+            Tuple[str, bool]: A tuple containing the unique identifier of the Redditor collected and a boolean indicating whether the Redditor was queued for insertion in the database.
         """
         redditor_inserted = False
         redditor = praw_models.author
 
+        # Redditors seen earlier in the run are resolved without any DB or API lookup
+        cached = self.redditor_cache.get(redditor.name) if redditor is not None else None
+        if cached is not None:
+            redditor_id = cached[0] or self._author_id(praw_models)
+            if redditor_id is not None:
+                if insert:
+                    console.log(
+                        f"Redditor [bold red]{redditor_id}[/] already in DB-{self.redditor_db_config}"
+                    )
+                return redditor_id, redditor_inserted
+
         if not insert:
-            # Early return when not inserting
+            # Early return when not inserting, reading the id from the listing data when it is there
+            author_id = self._author_id(praw_models)
+            if author_id is not None:
+                return author_id, False
             if hasattr(redditor, "id"):
                 return redditor.id, False
             elif hasattr(redditor, "name") and redditor.is_suspended:
@@ -182,14 +745,50 @@ class collect:
             elif redditor is None:
                 return "deleted", False
 
+        # Resolve prefetched authors without loading their profile
+        author_id = self._author_id(praw_models)
+        prefetched = existing_redditor_ids is not None and author_id is not None
+        if prefetched and author_id in existing_redditor_ids:
+            console.log(
+                f"Redditor [bold red]{author_id}[/] already in DB-{self.redditor_db_config}"
+            )
+            self.redditor_cache.add(redditor.name, author_id)
+            return author_id, redditor_inserted
+
         # Handle insertion logic
-        if hasattr(redditor, "id"):
-            redditor_id = redditor.id
+        if self.deferred_enrichment and author_id is not None:
+            redditor_id = author_id
+
+            if not prefetched and self._check_redditor_exists(redditor_id):
+                console.log(
+                    f"Redditor [bold red]{redditor_id}[/] already in DB-{self.redditor_db_config}"
+                )
+                self.redditor_cache.add(redditor.name, redditor_id)
+                return redditor_id, redditor_inserted
+
+            console.log(
+                f"Redditor [bold red]{redditor_id}[/] not in DB. Adding to DB-{self.redditor_db_config} with deferred enrichment"
+            )
+
+            # Build minimal redditor data, completed by enrich_redditors()
+            name = redditor.name
+            created_at = None
+            karma = None
+            is_gold = None
+            is_moderator = None
+            trophy = None
+            removed = None
+            self._unenriched_redditor_ids.append(redditor_id)
+
+        elif author_id is not None or hasattr(redditor, "id"):
+            # The listing's author id is checked first, so known authors never have their profile fetched
+            redditor_id = author_id if author_id is not None else redditor.id
             
-            if self._check_redditor_exists(redditor_id):
+            if not prefetched and self._check_redditor_exists(redditor_id):
                 console.log(
                     f"Redditor [bold red]{redditor_id}[/] already in DB-{self.redditor_db_config}"
                 )
+                self.redditor_cache.add(redditor.name, redditor_id)
                 return redditor_id, redditor_inserted
             
             console.log(
@@ -210,7 +809,7 @@ class collect:
 
             # Handle moderator status
             is_moderator = None
-            if redditor.is_mod:
+            if self.mod_and_trophy and redditor.is_mod:
                 is_moderator = {}
                 for mod in redditor.moderated():
                     is_moderator[mod.name] = [
@@ -220,7 +819,7 @@ class collect:
 
             # Handle trophies
             trophy = None
-            trophies = list(redditor.trophies())
+            trophies = list(redditor.trophies()) if self.mod_and_trophy else []
             if trophies:
                 trophy = {
                     "list": [t.name for t in trophies],
@@ -247,6 +846,7 @@ class collect:
                         f"Redditor [bold red]{redditor_id}[/] already in DB-{self.redditor_db_config}. Updating removed status"
                     )
                     self.redditor_db.update({"removed": "suspended"}).eq("name", name).execute()
+                    self.redditor_cache.add(name, redditor_id, "suspended")
                     return redditor_id, redditor_inserted
                 
                 # New suspended user
@@ -279,14 +879,77 @@ class collect:
             "removed": removed,
         }
 
-        self.redditor_db.insert(row).execute()
+        self.writer.add(self.redditor_db_config, row)
+        self.redditor_cache.add(name, redditor_id, removed)
+        if existing_redditor_ids is not None:
+            existing_redditor_ids.add(redditor_id)
+        if len(self._unenriched_redditor_ids) >= PARTIAL_REDDITORS_BATCH_SIZE:
+            self.enrich_redditors()
         return redditor_id, True
 
+    def enrich_redditors(self) -> int:
+        """
+        Fill in the karma and creation date of redditors stored with deferred enrichment.
+
+        Profiles are fetched through Reddit's bulk user data endpoint, 100 redditors per API request. The endpoint
+        only reports link and comment karma, so the `karma` of enriched redditors holds "comment", "link" and
+        "total" (their sum), without the "awardee" and "awarder" karma of full collection. Suspended and deleted
+        accounts are not returned by the endpoint and keep an unknown removed status.
+
+        The ids of redditors whose request or write failed are saved to "unenriched_<user table>.json" in the
+        error log folder, and retried by the next call, in this run or a later one.
+
+        Returns:
+            int: The number of redditors enriched.
+        """
+        redditor_ids, self._unenriched_redditor_ids = self._unenriched_redditor_ids, []
+        redditor_ids = list(dict.fromkeys(take_unenriched_redditors(self.unenriched_path) + redditor_ids))
+        if not redditor_ids:
+            return 0
+
+        # Minimal rows must be in the DB before they are merged with the profile data
+        self.writer.flush(self.redditor_db_config)
+
+        enriched = 0
+        failed = []
+        for start in range(0, len(redditor_ids), PARTIAL_REDDITORS_BATCH_SIZE):
+            chunk = redditor_ids[start : start + PARTIAL_REDDITORS_BATCH_SIZE]
+            try:
+                rows = [
+                    partial_redditor_row(partial_redditor)
+                    for partial_redditor in ratelimit.next_client(self.reddit).redditors.partial_redditors(
+                        [f"t2_{redditor_id}" for redditor_id in chunk]
+                    )
+                ]
+                if rows:
+                    self.redditor_db.upsert(rows, on_conflict="redditor_id").execute()
+                enriched += len(rows)
+
+            except Exception as error:
+                failed.extend(chunk)
+                console.log(f"Failed to enrich {len(chunk)} redditor(s): [bold red]{error}[/]")
+                console.print_exception()
+                console.save_html(
+                    os.path.join(self.error_log_path, f"t2_{chunk[0]}.html")
+                )
+                continue
+
+        if failed:
+            save_unenriched_redditors(self.unenriched_path, failed)
+            console.log(
+                f"{len(failed)} redditor(s) left to enrich, saved to [bold red]{self.unenriched_path}[/]"
+            )
+        console.log(
+            f"{enriched} redditor(s) enriched in DB-{self.redditor_db_config}"
+        )
+        return enriched
+
     def submission_data(
         self,
         submission: praw.models.reddit.submission.Submission,
         mask_pii: bool,
         insert_redditor: bool = True,
+        existing_submission_ids: Optional[set] = None,
     ) -> Tuple[str, int, int]:
         """
         Collects and stores submissions and associated users in a specified subreddit.
@@ -295,120 +958,37 @@ class collect:
             submission (praw.models.reddit.submission.Submission): The praw Submission object representing the submission.
             mask_pii (bool): Whether to mask PII in submission text.
             insert_redditor (bool): Whether to insert redditor data.
+            existing_submission_ids (set, optional): Submission ids already known to be in the DB, e.g. looked up
+                for a whole listing page at once. When given, it is consulted instead of querying the DB.
 
         Returns:
-            Tuple[str, int, int]: A tuple containing the submission id, the count of inserted submissions and the count of inserted Redditors.
+            Tuple[str, int, int]: A tuple containing the submission id, the count of queued submissions and the count of queued Redditors.
+
+        Note:
+            Submissions already stored are skipped before their author is resolved or their text masked.
         """
         accessed_at = datetime.datetime.utcnow()
         submission_id = submission.id
-        
-        if self._check_submission_exists(submission_id):
+
+        if existing_submission_ids is not None:
+            exists = submission_id in existing_submission_ids or self.writer.pending(
+                self.submission_db_config, submission_id
+            )
+        else:
+            exists = self._check_submission_exists(submission_id)
+        if exists:
             console.log(
                 f"Submission [bold red]{submission_id}[/] already in DB-{self.submission_db_config}"
             )
             return submission_id, False, False
 
         console.log(
-            f"Submission [bold red]{submission_id}[/] not in DB. Adding to DB-{self.submission_db_config}"
+            f"Adding submission [bold red]{submission_id}[/] to DB-{self.submission_db_config}"
         )
 
         redditor_id, redditor_inserted = self.redditor_data(submission, insert=insert_redditor)
-        created_at = datetime.datetime.fromtimestamp(submission.created_utc)
-        title = submission.title
-
-        # Handle selftext and PII masking
-        selftext = submission.selftext
-        if mask_pii and selftext:
-            selftext = self._mask_text_pii(selftext)
-
-        subreddit = submission.subreddit.display_name
-        permalink = f"https://www.reddit.com{submission.permalink}"
-        
-        # Handle attachments
-        attachment = None
-        if submission.is_reddit_media_domain:
-            if submission.is_video:
-                attachment = {"video": submission.url}
-            elif ".jpg" in submission.url:
-                attachment = {"jpg": submission.url}
-            elif ".png" in submission.url:
-                attachment = {"png": submission.url}
-            elif ".gif" in submission.url:
-                attachment = {"gif": submission.url}
-        elif not submission.is_self:
-            attachment = {"url": submission.url}
-
-        # Handle polls
-        poll = None
-        if hasattr(submission, "poll_data"):
-            vote_ends_at = datetime.datetime.fromtimestamp(
-                submission.poll_data.voting_end_timestamp / 1000
-            )
-            options = submission.poll_data.options
-            Options = {str(option): "unavailable" for option in options}
-            
-            poll = {
-                "total_vote_count": submission.poll_data.total_vote_count,
-                "vote_ends_at": vote_ends_at.isoformat(timespec="seconds"),
-                "options": Options,
-                "closed": vote_ends_at <= datetime.datetime.utcnow(),
-            }
-            
-            if poll["closed"]:
-                for option in options:
-                    Options[str(option)] = str(option.vote_count)
-
-        # Handle flairs
-        flair = {
-            "link": submission.link_flair_text,
-            "author": submission.author_flair_text,
-        }
-
-        # Handle awards
-        awards = {
-            "total_awards_count": submission.total_awards_received,
-            "total_awards_price": 0,
-            "list": None,
-        }
-        
-        if submission.total_awards_received > 0:
-            awards_list = {}
-            total_awards_price = 0
-            for award in submission.all_awardings:
-                awards_list[award["name"]] = [award["count"], award["coin_price"]]
-                total_awards_price += award["coin_price"] * award["count"]
-            awards["total_awards_price"] = total_awards_price
-            awards["list"] = awards_list
-
-        score = {accessed_at.isoformat(timespec="seconds"): submission.score}
-        upvote_ratio = {accessed_at.isoformat(timespec="seconds"): submission.upvote_ratio}
-        num_comments = {accessed_at.isoformat(timespec="seconds"): submission.num_comments}
-
-        edited = submission.edited is not False
-        archived = submission.archived
-        removed = submission.removed_by_category is not None
-
-        row = {
-            "submission_id": submission_id,
-            "redditor_id": redditor_id,
-            "created_at": created_at.isoformat(),
-            "title": title,
-            "text": selftext,
-            "subreddit": subreddit,
-            "permalink": permalink,
-            "attachment": attachment,
-            "poll": poll,
-            "flair": flair,
-            "awards": awards,
-            "score": score,
-            "upvote_ratio": upvote_ratio,
-            "num_comments": num_comments,
-            "edited": edited,
-            "archived": archived,
-            "removed": removed,
-        }
-
-        self.submission_db.insert(row).execute()
+        row = submission_row(submission, redditor_id, accessed_at)
+        self._queue_row(self.submission_db_config, row, "text", mask_pii)
         return submission_id, True, redditor_inserted
 
     def comment_data(
@@ -426,69 +1006,33 @@ class collect:
             insert_redditor (bool): Whether to insert redditor data.
 
         Returns:
-            Tuple[int, int]: A tuple containing the count of inserted comments and the count of inserted Redditors.
+            Tuple[int, int]: A tuple containing the count of queued comments and the count of queued Redditors.
         """
         comment_inserted_count = 0
         redditor_inserted_count = 0
 
-        for comment in comments:
+        new_comments, existing_redditor_ids = self._prefetch_comments(comments, insert_redditor)
+
+        for comment in new_comments:
             accessed_at = datetime.datetime.utcnow()
             try:
                 comment_id = comment.id
-                
-                if self._check_comment_exists(comment_id):
-                    console.log(
-                        f"Comment [bold red]{comment_id}[/] already in DB-{self.comment_db_config}"
-                    )
-                    continue
-                
+
                 console.log(
                     f"Adding comment [bold red]{comment_id}[/] to DB-{self.comment_db_config}"
                 )
                 
-                link_id = comment.link_id.replace("t3_", "")
-                subreddit = str(comment.subreddit)
-                parent_id = comment.parent_id
-                
                 redditor_id, redditor_inserted = self.redditor_data(
-                    comment, insert=insert_redditor
+                    comment,
+                    insert=insert_redditor,
+                    existing_redditor_ids=existing_redditor_ids,
                 )
                 
                 if redditor_inserted:
                     redditor_inserted_count += 1
 
-                created_at = datetime.datetime.fromtimestamp(comment.created_utc)
-
-                # Handle body text
-                selfbody = comment.body
-                removed = None
-                
-                if selfbody == "[deleted]":
-                    selfbody = None
-                    removed = "deleted"
-                elif selfbody == "[removed]":
-                    selfbody = None
-                    removed = "removed"
-                elif mask_pii and selfbody:
-                    selfbody = self._mask_text_pii(selfbody)
-
-                edited = comment.edited is not False
-                score = {accessed_at.isoformat(timespec="seconds"): comment.score}
-
-                row = {
-                    "comment_id": comment_id,
-                    "link_id": link_id,
-                    "subreddit": subreddit,
-                    "parent_id": parent_id,
-                    "redditor_id": redditor_id,
-                    "created_at": created_at.isoformat(),
-                    "body": selfbody,
-                    "score": score,
-                    "edited": edited,
-                    "removed": removed,
-                }
-
-                self.comment_db.insert(row).execute()
+                row = comment_row(comment, redditor_id, accessed_at)
+                self._queue_row(self.comment_db_config, row, "body", mask_pii)
                 comment_inserted_count += 1
 
             except Exception as error:
@@ -507,6 +1051,7 @@ class collect:
         sort_types: List[str],
         limit: int = 10,
         mask_pii: bool = False,
+        multireddit: bool = False,
     ) -> None:
         """
         Lazy collection. Collects and stores submissions and associated users in specified subreddits.
@@ -516,6 +1061,7 @@ class collect:
             sort_types (List[str]): A list of sorting types for submissions (e.g., 'hot', 'new', 'rising', 'top', 'controversial').
             limit (int, optional): The maximum number of submissions to collect for each subreddit. Defaults to 10. Set to None to fetch maximum number of submissions. 
             mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+            multireddit (bool, optional): Combine the subreddits into "a+b+c" multireddit listings, fanned back out per subreddit with the limit applied to each. Cuts the number of listing requests by up to the number of subreddits, but a subreddit whose submissions fall beyond the first 1,000 of a combined listing returns fewer. Defaults to False.
 
         Returns:
             None. Prints the count of collected submissions and user data to the console.
@@ -524,37 +1070,32 @@ class collect:
             "[bold green]Collecting submissions and users from subreddit(s)...",
             spinner="aesthetic",
         ):
-            total_submission_inserted_count = 0
-            total_redditor_inserted_count = 0
-            
-            for subreddit in subreddits:
-                console.print(f"[bold]subreddit: {subreddit}", justify="center")
-                r_ = self.reddit.subreddit(subreddit)
-                
-                for sort_type in sort_types:
-                    console.print(sort_type, justify="center")
-                    
-                    for submission in getattr(r_, sort_type)(limit=limit):
-                        try:
-                            submission_id, submission_inserted, redditor_inserted = self.submission_data(
-                                submission=submission, mask_pii=mask_pii
-                            )
+            inserted_before = dict(self.writer.inserted)
 
-                            if submission_inserted:
-                                total_submission_inserted_count += 1
-                            if redditor_inserted:
-                                total_redditor_inserted_count += 1
+            listing = self._stage(self._listing(subreddits, sort_types, limit, multireddit=multireddit))
+            for chunk in chunked(listing, SUBMISSION_PREFETCH_SIZE):
+                existing_submission_ids = self._prefetch_submissions([submission for submission, _ in chunk])
 
-                        except Exception as error:
-                            console.log(f"t3_{submission_id}: [bold red]{error}[/]")
-                            console.print_exception()
-                            console.save_html(
-                                os.path.join(self.error_log_path, f"t3_{submission_id}.html")
-                            )
-                            continue
+                for submission, _ in chunk:
+                    try:
+                        self.submission_data(
+                            submission=submission,
+                            mask_pii=mask_pii,
+                            existing_submission_ids=existing_submission_ids,
+                        )
+
+                    except Exception as error:
+                        console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                        console.print_exception()
+                        console.save_html(
+                            os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                        )
+                        continue
+
+            inserted = self._flush_inserted(inserted_before)
 
         console.print(
-            f"[bold green]{total_submission_inserted_count} submission and {total_redditor_inserted_count} user data collected from subreddit(s) {subreddits}"
+            f"[bold green]{inserted[self.submission_db_config]} submission and {inserted[self.redditor_db_config]} user data collected from subreddit(s) {subreddits}"
         )
 
     def subreddit_comment(
@@ -564,6 +1105,7 @@ class collect:
         limit: int = 10,
         level: Optional[int] = 1,
         mask_pii: bool = False,
+        multireddit: bool = False,
     ) -> None:
         """
         Lazy collection. Collects and stores comments and associated users in specified subreddits.
@@ -574,6 +1116,7 @@ class collect:
             limit (int, optional): The maximum number of submissions to collect comments from (for each subreddit). Defaults to 10. Set to None to fetch maximum number of submissions. 
             level (int, optional): The depth to which comment replies should be fetched. Defaults to 1. Set to None to fetch all comment replies. 
             mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+            multireddit (bool, optional): Combine the subreddits into "a+b+c" multireddit listings, fanned back out per subreddit with the limit applied to each. Cuts the number of listing requests by up to the number of subreddits, but a subreddit whose submissions fall beyond the first 1,000 of a combined listing returns fewer. Defaults to False.
 
         Returns:
             None. Prints the count of collected comments and user data to the console.
@@ -582,45 +1125,30 @@ class collect:
             "[bold green]Collecting comments and users from subreddit(s)...",
             spinner="aesthetic",
         ):
-            total_comment_inserted_count = 0
-            total_redditor_inserted_count = 0
+            inserted_before = dict(self.writer.inserted)
 
-            for subreddit in subreddits:
-                console.print(f"[bold]subreddit: {subreddit}", justify="center")
-                r_ = self.reddit.subreddit(subreddit)
-                
-                for sort_type in sort_types:
-                    console.print(sort_type, justify="center")
+            listing = self._listing(
+                subreddits, sort_types, limit, level=level, comments=True, multireddit=multireddit
+            )
+            for submission, comments in self._stage(listing):
+                if comments is None:
+                    continue
 
-                    for submission in getattr(r_, sort_type)(limit=limit):
-                        try:
-                            submission_id = submission.id
-
-                            if self._check_submission_comments_exist(submission_id):
-                                console.log(
-                                    f"Submission Link [bold red]{submission_id}[/] already in DB-{self.comment_db_config}"
-                                )
-                                continue
-
-                            submission.comments.replace_more(limit=level)
-                            comments = submission.comments.list()
-                            
-                            comment_inserted_count, redditor_inserted_count = self.comment_data(
-                                comments=comments, mask_pii=mask_pii
-                            )
-                            total_comment_inserted_count += comment_inserted_count
-                            total_redditor_inserted_count += redditor_inserted_count
+                try:
+                    self.comment_data(comments=comments, mask_pii=mask_pii)
 
-                        except Exception as error:
-                            console.log(f"t3_{submission.id}: [bold red]{error}[/]")
-                            console.print_exception()
-                            console.save_html(
-                                os.path.join(self.error_log_path, f"t3_{submission.id}.html")
-                            )
-                            continue
+                except Exception as error:
+                    console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                    console.print_exception()
+                    console.save_html(
+                        os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                    )
+                    continue
+
+            inserted = self._flush_inserted(inserted_before)
 
         console.print(
-            f"[bold green]{total_comment_inserted_count} comment and {total_redditor_inserted_count} user data collected from subreddit(s) {subreddits}"
+            f"[bold green]{inserted[self.comment_db_config]} comment and {inserted[self.redditor_db_config]} user data collected from subreddit(s) {subreddits}"
         )
 
     def subreddit_submission_and_comment(
@@ -630,6 +1158,7 @@ class collect:
         limit: int = 10,
         level: int = 1,
         mask_pii: bool = False,
+        multireddit: bool = False,
     ) -> None:
         """
         Lazy collection. Collects and stores submissions, comments and associated users in specified subreddits.
@@ -640,6 +1169,7 @@ class collect:
             limit (int, optional): The maximum number of submissions to collect comments from (for each subreddit). Defaults to 10. Set to None to fetch maximum number of submissions. 
             level (int, optional): The depth to which comment replies should be fetched. Defaults to 1. Set to None to fetch all comment replies. 
             mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+            multireddit (bool, optional): Combine the subreddits into "a+b+c" multireddit listings, fanned back out per subreddit with the limit applied to each. Cuts the number of listing requests by up to the number of subreddits, but a subreddit whose submissions fall beyond the first 1,000 of a combined listing returns fewer. Defaults to False.
 
         Returns:
             None. Prints the count of collected submissions, comments and user data to the console.
@@ -648,55 +1178,38 @@ class collect:
             "[bold green]Collecting submissions, comments and users from subreddit(s)...",
             spinner="aesthetic",
         ):
-            total_submission_inserted_count = 0
-            total_comment_inserted_count = 0
-            total_redditor_inserted_count = 0
+            inserted_before = dict(self.writer.inserted)
 
-            for subreddit in subreddits:
-                console.print(f"[bold]subreddit: {subreddit}", justify="center")
-                r_ = self.reddit.subreddit(subreddit)
-                
-                for sort_type in sort_types:
-                    console.print(sort_type, justify="center")
-                    
-                    for submission in getattr(r_, sort_type)(limit=limit):
-                        try:
-                            # Collect Submission
-                            submission_id, submission_inserted, submission_redditor_inserted = self.submission_data(
-                                submission=submission, mask_pii=mask_pii
-                            )
+            listing = self._listing(
+                subreddits, sort_types, limit, level=level, comments=True, multireddit=multireddit
+            )
+            for chunk in chunked(self._stage(listing), COMMENT_TREE_PREFETCH_SIZE):
+                existing_submission_ids = self._prefetch_submissions([submission for submission, _ in chunk])
 
-                            if submission_inserted:
-                                total_submission_inserted_count += 1
-                            if submission_redditor_inserted:
-                                total_redditor_inserted_count += 1
-
-                            # Check if comments of submission were crawled
-                            if self._check_submission_comments_exist(submission_id):
-                                console.log(
-                                    f"Submission Link [bold red]{submission_id}[/] already in DB-{self.comment_db_config}"
-                                )
-                                continue
-
-                            submission.comments.replace_more(limit=level)
-                            comments = submission.comments.list()
-                            
-                            comment_inserted_count, comment_redditor_inserted_count = self.comment_data(
-                                comments=comments, mask_pii=mask_pii
-                            )
-                            total_comment_inserted_count += comment_inserted_count
-                            total_redditor_inserted_count += comment_redditor_inserted_count
+                for submission, comments in chunk:
+                    try:
+                        # Collect Submission
+                        self.submission_data(
+                            submission=submission,
+                            mask_pii=mask_pii,
+                            existing_submission_ids=existing_submission_ids,
+                        )
 
-                        except Exception as error:
-                            console.log(f"t3_{submission.id}: [bold red]{error}[/]")
-                            console.print_exception()
-                            console.save_html(
-                                os.path.join(self.error_log_path, f"t3_{submission.id}.html")
-                            )
-                            continue
+                        if comments is not None:
+                            self.comment_data(comments=comments, mask_pii=mask_pii)
+
+                    except Exception as error:
+                        console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                        console.print_exception()
+                        console.save_html(
+                            os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                        )
+                        continue
+
+            inserted = self._flush_inserted(inserted_before)
 
         console.print(
-            f"[bold green]{total_submission_inserted_count} submission, {total_comment_inserted_count} comment, and {total_redditor_inserted_count} user data collected from subreddit(s) {subreddits}"
+            f"[bold green]{inserted[self.submission_db_config]} submission, {inserted[self.comment_db_config]} comment, and {inserted[self.redditor_db_config]} user data collected from subreddit(s) {subreddits}"
         )
 
     def submission_from_user(
@@ -722,31 +1235,35 @@ class collect:
             "[bold green]Collecting submissions from specified user(s)...",
             spinner="aesthetic",
         ):
-            total_submission_inserted_count = 0
-            
+            inserted_before = dict(self.writer.inserted)
+
             for user_name in user_names:
                 console.print(f"[bold]user: {user_name}", justify="center")
-                redditor = self.reddit.redditor(user_name)
+                redditor = ratelimit.next_client(self.reddit).redditor(user_name)
                 
                 for sort_type in sort_types:
                     console.print(sort_type, justify="center")
                     
                     try:
-                        for submission in getattr(redditor.submissions, sort_type)(limit=limit):
-                            try:
-                                submission_id, submission_inserted, _ = self.submission_data(
-                                    submission=submission, mask_pii=mask_pii
-                                )
-                                if submission_inserted:
-                                    total_submission_inserted_count += 1
-                                    
-                            except Exception as error:
-                                console.log(f"t3_{submission_id}: [bold red]{error}[/]")
-                                console.print_exception()
-                                console.save_html(
-                                    os.path.join(self.error_log_path, f"t3_{submission_id}.html")
-                                )
-                                continue
+                        listing = getattr(redditor.submissions, sort_type)(limit=limit)
+                        for chunk in chunked(listing, SUBMISSION_PREFETCH_SIZE):
+                            existing_submission_ids = self._prefetch_submissions(chunk)
+
+                            for submission in chunk:
+                                try:
+                                    self.submission_data(
+                                        submission=submission,
+                                        mask_pii=mask_pii,
+                                        existing_submission_ids=existing_submission_ids,
+                                    )
+
+                                except Exception as error:
+                                    console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                                    console.print_exception()
+                                    console.save_html(
+                                        os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                                    )
+                                    continue
 
                     except Exception as error:
                         console.log(f"user_{user_name}: [bold red]{error}[/]")
@@ -755,9 +1272,11 @@ class collect:
                             os.path.join(self.error_log_path, f"user_{user_name}.html")
                         )
                         continue
-                        
+
+            inserted = self._flush_inserted(inserted_before)
+
         console.print(
-            f"[bold green]{total_submission_inserted_count} submission data collected from {len(user_names)} user(s)"
+            f"[bold green]{inserted[self.submission_db_config]} submission data collected from {len(user_names)} user(s)"
         )
 
     def comment_from_user(
@@ -782,22 +1301,19 @@ class collect:
         with console.status(
             "[bold green]Collecting comments from user(s)...", spinner="aesthetic"
         ):
-            total_comment_inserted_count = 0
-            
+            inserted_before = dict(self.writer.inserted)
+
             for user_name in user_names:
                 console.print(f"[bold]user: {user_name}", justify="center")
-                redditor = self.reddit.redditor(user_name)
+                redditor = ratelimit.next_client(self.reddit).redditor(user_name)
                 
                 for sort_type in sort_types:
                     console.print(sort_type, justify="center")
                     
                     try:
                         comments = list(getattr(redditor.comments, sort_type)(limit=limit))
-                        comment_inserted_count, _ = self.comment_data(
-                            comments=comments, mask_pii=mask_pii
-                        )
-                        total_comment_inserted_count += comment_inserted_count
-                        
+                        self.comment_data(comments=comments, mask_pii=mask_pii)
+
                     except Exception as error:
                         console.log(f"user_{user_name}: [bold red]{error}[/]")
                         console.print_exception()
@@ -806,8 +1322,10 @@ class collect:
                         )
                         continue
 
+            inserted = self._flush_inserted(inserted_before)
+
         console.print(
-            f"[bold green]{total_comment_inserted_count} comment data collected from {len(user_names)} user(s)"
+            f"[bold green]{inserted[self.comment_db_config]} comment data collected from {len(user_names)} user(s)"
         )
 
     def submission_by_keyword(
@@ -840,33 +1358,36 @@ class collect:
             "[bold green]Collecting submissions with specified keyword(s)...",
             spinner="aesthetic",
         ):
-            total_submission_inserted_count = 0
-            
+            inserted_before = dict(self.writer.inserted)
+
             for subreddit in subreddits:
                 console.print(f"[bold]subreddit: {subreddit}", justify="center")
-                r_ = self.reddit.subreddit(subreddit)
+                r_ = ratelimit.next_client(self.reddit).subreddit(subreddit)
                 
-                for submission in r_.search(query, sort="relevance", limit=limit):
-                    try:
-                        submission_id, submission_inserted, _ = self.submission_data(
-                            submission=submission,
-                            mask_pii=mask_pii,
-                            insert_redditor=False,
-                        )
+                for chunk in chunked(r_.search(query, sort="relevance", limit=limit), SUBMISSION_PREFETCH_SIZE):
+                    existing_submission_ids = self._prefetch_submissions(chunk)
 
-                        if submission_inserted:
-                            total_submission_inserted_count += 1
+                    for submission in chunk:
+                        try:
+                            self.submission_data(
+                                submission=submission,
+                                mask_pii=mask_pii,
+                                insert_redditor=False,
+                                existing_submission_ids=existing_submission_ids,
+                            )
 
-                    except Exception as error:
-                        console.log(f"t3_{submission_id}: [bold red]{error}[/]")
-                        console.print_exception()
-                        console.save_html(
-                            os.path.join(self.error_log_path, f"t3_{submission_id}.html")
-                        )
-                        continue
+                        except Exception as error:
+                            console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                            console.print_exception()
+                            console.save_html(
+                                os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                            )
+                            continue
+
+            inserted = self._flush_inserted(inserted_before)
 
         console.print(
-            f"[bold green]{total_submission_inserted_count} submission data collected from subreddit(s) {subreddits} with query='{query}'"
+            f"[bold green]{inserted[self.submission_db_config]} submission data collected from subreddit(s) {subreddits} with query='{query}'"
         )
 
     def comment_from_submission(
@@ -890,11 +1411,11 @@ class collect:
             "[bold green]Collecting comments from submission id(s)...",
             spinner="aesthetic",
         ):
-            total_comment_inserted_count = 0
-            
+            inserted_before = dict(self.writer.inserted)
+
             for submission_id in submission_ids:
                 console.print(f"[bold]submission: {submission_id}", justify="center")
-                submission = self.reddit.submission(submission_id)
+                submission = ratelimit.next_client(self.reddit).submission(submission_id)
                 
                 try:
                     # Check if comments of submission were crawled
@@ -906,11 +1427,10 @@ class collect:
 
                     submission.comments.replace_more(limit=level)
                     comments = submission.comments.list()
-                    comment_inserted_count, _ = self.comment_data(
+                    self.comment_data(
                         comments=comments, mask_pii=mask_pii, insert_redditor=False
                     )
-                    total_comment_inserted_count += comment_inserted_count
-                    
+
                 except Exception as error:
                     console.log(f"t3_{submission.id}: [bold red]{error}[/]")
                     console.print_exception()
@@ -918,9 +1438,172 @@ class collect:
                         os.path.join(self.error_log_path, f"t3_{submission.id}.html")
                     )
                     continue
-                    
+
+            inserted = self._flush_inserted(inserted_before)
+
         console.print(
-            f"[bold green]{total_comment_inserted_count} comment data collected from {len(submission_ids)} submission(s)"
+            f"[bold green]{inserted[self.comment_db_config]} comment data collected from {len(submission_ids)} submission(s)"
+        )
+
+
+    def _stream_batch(
+        self,
+        source: str,
+        submissions: List[praw.models.reddit.submission.Submission],
+        comments: List[praw.models.reddit.comment.Comment],
+        mask_pii: bool,
+    ) -> None:
+        """Store a micro-batch of streamed submissions and comments, and write it to the database."""
+        if not submissions and not comments:
+            return
+        inserted_before = dict(self.writer.inserted)
+
+        # Existing submissions of the whole micro-batch are looked up at once
+        existing_submission_ids = self._prefetch_submissions(submissions)
+        for submission in submissions:
+            try:
+                self.submission_data(
+                    submission=submission, mask_pii=mask_pii, existing_submission_ids=existing_submission_ids
+                )
+
+            except Exception as error:
+                console.log(f"t3_{submission.id}: [bold red]{error}[/]")
+                console.print_exception()
+                console.save_html(
+                    os.path.join(self.error_log_path, f"t3_{submission.id}.html")
+                )
+                continue
+
+        if comments:
+            # Existing comments and authors of the whole micro-batch are looked up at once
+            self.comment_data(comments=comments, mask_pii=mask_pii)
+
+        inserted = self._flush_inserted(inserted_before)
+        console.log(
+            f"{inserted[self.submission_db_config]} submission, {inserted[self.comment_db_config]} comment, and {inserted[self.redditor_db_config]} user data collected from {source}"
+        )
+
+    def stream(
+        self,
+        subreddits: List[str],
+        kinds: List[str] = None,
+        mask_pii: bool = False,
+        batch_size: int = 100,
+        batch_interval: float = 10,
+        poll_interval: float = 5,
+        duration: Optional[float] = None,
+        skip_existing: bool = False,
+    ) -> None:
+        """
+        Continuous collection. Streams new submissions and comments from specified subreddits as they are posted,
+        and stores them with their users in micro-batches.
+
+        Subreddits are followed through multireddit streams ("a+b+c", split only when the list exceeds URL length
+        limits), so each poll costs one API request per kind for up to 100 subreddits. Streamed items are collected into micro-batches,
+        written when `batch_size` items are collected or `batch_interval` seconds have passed. The stream runs
+        until `duration` seconds have passed or `stop_event` is set (e.g. `collect.stop_event.set()` from another
+        thread, or Ctrl+C), after which the last micro-batch is written. The event is shared with the pipelined
+        stages and is never cleared: if it is already set when the stream starts, e.g. after `close()`, nothing is
+        streamed. Clear it yourself, or use a new collect instance, to stream again.
+
+        Args:
+            subreddits (List[str]): A list of subreddit names to stream from.
+            kinds (List[str], optional): What to stream: "submission", "comment" or both. Defaults to None,
+                streaming both.
+            mask_pii (bool, optional): Mask (or anonymise) personally identifiable information (PII). Defaults to False.
+            batch_size (int, optional): The number of streamed items written per micro-batch. Defaults to 100.
+            batch_interval (float, optional): The maximum number of seconds a streamed item waits before being
+                written. Defaults to 10.
+            poll_interval (float, optional): The number of seconds to wait after a poll without new items.
+                Defaults to 5.
+            duration (float, optional): The number of seconds to stream for. Defaults to None, streaming until stopped.
+            skip_existing (bool, optional): Skip the items posted before the stream started (up to 100 per kind
+                are otherwise collected first). Defaults to False.
+
+        Raises:
+            ValueError: If kinds contains anything other than "submission" and "comment".
+
+        Returns:
+            None. Prints the count of collected submissions, comments and user data to the console.
+        """
+        kinds = kinds if kinds is not None else ["submission", "comment"]
+        invalid_kinds = set(kinds) - {"submission", "comment"}
+        if invalid_kinds or not kinds:
+            raise ValueError(
+                f"Invalid kinds: {sorted(invalid_kinds)}. Available kinds are 'submission' and 'comment'."
+            )
+
+        # Long lists of subreddits are split into several multireddits to respect URL length limits
+        multireddits = ["+".join(group) for group in multireddit_chunks(subreddits)]
+        source = f"r/{multireddits[0]}" if len(multireddits) == 1 else f"{len(subreddits)} subreddits"
+
+        def open_streams(skip_existing: bool) -> List[Tuple[str, Iterator]]:
+            # pause_after=-1 yields None after every response, so the streams take turns and stop promptly
+            return [
+                (
+                    kind,
+                    getattr(ratelimit.next_client(self.reddit).subreddit(multireddit).stream, f"{kind}s")(
+                        pause_after=-1, skip_existing=skip_existing
+                    ),
+                )
+                for multireddit in multireddits
+                for kind in kinds
+            ]
+
+        # A stop requested before the stream started (or by close()) is honoured rather than cleared
+        if self.stop_event.is_set():
+            console.log(f"Not streaming {source}: stop_event is already set")
+            return
+
+        loop_end = time.time() + (duration if duration else float("inf"))
+        inserted_before = dict(self.writer.inserted)
+        submissions, comments = [], []
+        last_batch = time.time()
+        failures = 0
+
+        with console.status(f"[bold green]Streaming {' and '.join(kinds)}s from {source}...", spinner="aesthetic"):
+            streams = open_streams(skip_existing)
+            try:
+                while not self.stop_event.is_set() and time.time() < loop_end:
+                    found = 0
+                    try:
+                        for kind, items in streams:
+                            for item in items:
+                                if item is None:
+                                    break
+                                (submissions if kind == "submission" else comments).append(item)
+                                found += 1
+                        failures = 0
+
+                    except Exception as error:
+                        failures += 1
+                        wait = min(2**failures, 60)
+                        console.log(f"Stream of {source} failed: [bold red]{error}[/]. Reconnecting in {wait} seconds")
+                        console.print_exception()
+                        self.stop_event.wait(wait)
+                        # Items posted while disconnected are picked up, duplicates are skipped by the writer
+                        streams = open_streams(skip_existing=False)
+                        continue
+
+                    if len(submissions) + len(comments) >= batch_size or time.time() - last_batch >= batch_interval:
+                        self._stream_batch(source, submissions, comments, mask_pii)
+                        submissions, comments = [], []
+                        last_batch = time.time()
+
+                    if not found:
+                        self.stop_event.wait(poll_interval)
+
+            except KeyboardInterrupt:
+                console.log(f"Stopping the stream of {source}")
+
+            self._stream_batch(source, submissions, comments, mask_pii)
+
+        inserted = {
+            table: count - inserted_before.get(table, 0)
+            for table, count in self.writer.inserted.items()
+        }
+        console.print(
+            f"[bold green]{inserted[self.submission_db_config]} submission, {inserted[self.comment_db_config]} comment, and {inserted[self.redditor_db_config]} user data streamed from subreddit(s) {subreddits}"
         )
 
 
@@ -929,16 +1612,19 @@ class update:
     Class to update data from Reddit to Supabase periodically.
     
     Args:
-        reddit_client (praw.Reddit): Reddit client.
+        reddit_client (praw.Reddit): Reddit client, or a `ratelimit.client_pool` to fetch submissions with several
+            clients concurrently.
         supabase_client (supabase.Client): Supabase client.
         db_config (dict, optional): Database configuration. Defaults to None.
+        batch_size (int, optional): The number of updated rows written to the database per request. Defaults to 500.
     """
 
     def __init__(
         self,
-        reddit_client: praw.Reddit,
+        reddit_client: Union[praw.Reddit, ratelimit.client_pool],
         supabase_client: supabase.Client,
         db_config: dict = None,
+        batch_size: int = 500,
     ) -> None:
         if db_config is None:
             raise ValueError("Invalid input: db_config must be provided.")
@@ -962,9 +1648,46 @@ class update:
             .count
         )
 
+        # Updated metrics are merged into existing rows in batches, flushed at the end of each cycle
+        self.writer = writer(
+            self.supabase,
+            primary_keys={self.submission_db_config: "submission_id"},
+            batch_size=batch_size,
+            flush_interval=None,
+            ignore_duplicates=False,
+        )
+
         # Event to signal the threads to stop
         self.stop_event = Event()
 
+    def _fetch_submissions(
+        self, submission_ids: List[str]
+    ) -> Dict[str, praw.models.reddit.submission.Submission]:
+        """
+        Fetch submissions from Reddit in batches of 100 fullnames per request, keyed by submission id.
+
+        With a client pool, the batches are spread across the clients and fetched concurrently.
+        """
+        chunks = [
+            [f"t3_{submission_id}" for submission_id in submission_ids[start : start + INFO_BATCH_SIZE]]
+            for start in range(0, len(submission_ids), INFO_BATCH_SIZE)
+        ]
+
+        def fetch_chunk(fullnames: List[str]) -> list:
+            return list(ratelimit.next_client(self.reddit).info(fullnames=fullnames))
+
+        if isinstance(self.reddit, ratelimit.client_pool) and len(self.reddit) > 1:
+            with ThreadPoolExecutor(max_workers=len(self.reddit)) as executor:
+                results = list(executor.map(fetch_chunk, chunks))
+        else:
+            results = [fetch_chunk(fullnames) for fullnames in chunks]
+
+        return {
+            reddit_submission.id: reddit_submission
+            for result in results
+            for reddit_submission in result
+        }
+
     def submission(self):
         """
         Update submission data from Reddit to Supabase.
@@ -973,22 +1696,21 @@ class update:
         page_numbers = (self.submission_row_count // page_size) + (
             1 if self.submission_row_count % page_size != 0 else 0
         )
-        start_row = 0
-        end_row = min(self.submission_row_count, page_size)
-
-        for page in range(1, page_numbers + 1):
-            if page > 1:
-                start_row += page_size
-                end_row = min(start_row + page_size, self.submission_row_count)
-
-            columns = {"submission_id", "score", "upvote_ratio", "num_comments"}
-            paginated_submission = (
-                self.submission_db.select(*columns)
-                .eq("archived", False)
-                .order("created_at", desc=True)
-                .range(start_row, end_row)
-                .execute()
-                .model_dump()["data"]
+
+        columns = ["submission_id", "score", "upvote_ratio", "num_comments"]
+        for page, paginated_submission in enumerate(
+            keyset.pages(
+                self.submission_db,
+                columns,
+                key=("created_at", "submission_id"),
+                page_size=page_size,
+                filters={"archived": False},
+                desc=True,
+            ),
+            start=1,
+        ):
+            reddit_submissions = self._fetch_submissions(
+                [submission["submission_id"] for submission in paginated_submission]
             )
 
             for submission in track(
@@ -1001,7 +1723,11 @@ class update:
                 num_comments = submission["num_comments"]
 
                 accessed_at = datetime.datetime.utcnow()
-                reddit_submission = self.reddit.submission(id=submission_id)
+                reddit_submission = reddit_submissions.get(submission_id)
+
+                if reddit_submission is None:
+                    console.print(f"{submission_id} is no longer available")
+                    continue
 
                 score[accessed_at.isoformat(timespec="seconds")] = reddit_submission.score
                 upvote_ratio[accessed_at.isoformat(timespec="seconds")] = reddit_submission.upvote_ratio
@@ -1011,14 +1737,24 @@ class update:
                 if archived:
                     console.print(f"{submission_id} is archived")
 
-                self.submission_db.update(
+                self.writer.add(
+                    self.submission_db_config,
                     {
+                        "submission_id": submission_id,
                         "score": score,
                         "upvote_ratio": upvote_ratio,
                         "num_comments": num_comments,
                         "archived": archived,
-                    }
-                ).eq("submission_id", submission_id).execute()
+                    },
+                )
+
+        self.writer.flush()
+        failed = self.writer.take_failed(self.submission_db_config)[self.submission_db_config]
+        if failed:
+            console.log(
+                f"{len(failed)} submission(s) could not be updated in DB-{self.submission_db_config}: "
+                f"[bold red]{', '.join(failed)}[/]"
+            )
 
     def run_task_with_interval(self, task: str, interval: int, duration: int) -> None:
         """
@@ -1067,23 +1803,26 @@ class update:
                 f"Invalid task type: {task}. Available tasks are 'submission', 'comment', and 'user'."
             )
 
-        # Get Row Count
+        # Get Row Count. A client pool shares the requests of a cycle between its clients
+        clients = len(self.reddit) if isinstance(self.reddit, ratelimit.client_pool) else 1
         if task == "submission":
-            row_count = self.submission_row_count
+            row_count = self.submission_row_count / clients
         else:
             row_count = None
             raise NotImplementedError(f"Task '{task}' is not yet implemented.")
 
-        # Automatically determine update time interval based on the Row Count
-        if row_count <= 1000:
+        # Automatically determine update time interval based on the Row Count.
+        # A cycle costs one API request per 100 submissions, i.e. 10,000 submissions per minute at 100 QPM.
+        # Each interval is at least twice the API time of a cycle, leaving headroom for the database I/O.
+        if row_count <= 50000:
             interval = 10 * 60
-        elif row_count <= 3000:
+        elif row_count <= 150000:
             interval = 30 * 60
-        elif row_count <= 6000:
+        elif row_count <= 300000:
             interval = 60 * 60
-        elif row_count <= 36000:
+        elif row_count <= 1800000:
             interval = 6 * 60 * 60
-        elif row_count <= 72000:
+        elif row_count <= 3600000:
             interval = 12 * 60 * 60
         else:
             interval = 24 * 60 * 60
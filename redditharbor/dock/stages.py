@@ -0,0 +1,156 @@
+import queue
+import threading
+from threading import Event
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+from rich.console import Console
+
+console = Console(record=True)
+
+# Marks the end of a queue
+_DONE = object()
+
+
+def producer(items: Iterable[Any], max_size: int = 8, stop_event: Optional[Event] = None) -> Iterator[Any]:
+    """
+    Produce items in a background thread, handing them to the consumer through a bounded queue.
+
+    The producer runs at most `max_size` items ahead of the consumer and blocks when the queue is full, so a slow
+    consumer slows the producer down instead of piling up items in memory. An exception raised by the producer is
+    raised again in the consumer.
+
+    Args:
+        items (Iterable[Any]): The items to produce, e.g. a generator walking Reddit listings.
+        max_size (int, optional): The maximum number of items waiting in the queue. Defaults to 8.
+        stop_event (Event, optional): An event stopping the producer after its current item once set.
+
+    Yields:
+        Any: The items, in the order they were produced.
+    """
+    return merge([items], workers=1, max_size=max_size, stop_event=stop_event)
+
+
+def merge(
+    iterables: List[Iterable[Any]],
+    workers: int = 4,
+    max_size: int = 8,
+    stop_event: Optional[Event] = None,
+) -> Iterator[Any]:
+    """
+    Produce the items of several iterables from `workers` background threads, through one bounded queue.
+
+    Each thread walks one iterable at a time, taking the next one when it is exhausted. Items of an iterable keep
+    their order, but items of different iterables are interleaved in the order they are produced. As with
+    `producer`, a full queue blocks the threads, and the first exception raised is raised again in the consumer.
+
+    Args:
+        iterables (List[Iterable[Any]]): The iterables to produce, e.g. one generator per Reddit listing.
+        workers (int, optional): The number of threads. Defaults to 4.
+        max_size (int, optional): The maximum number of items waiting in the queue. Defaults to 8.
+        stop_event (Event, optional): An event stopping the threads after their current item once set.
+
+    Yields:
+        Any: The items of all iterables.
+    """
+    buffer = queue.Queue(maxsize=max_size)
+    stop_event = stop_event or Event()
+    # Set when the consumer stops early, so a producer blocked on a full queue can exit
+    closed = Event()
+    pending = iter(list(iterables))
+    pending_lock = threading.Lock()
+    workers = max(1, min(workers, len(iterables)))
+
+    def put(item: Any) -> bool:
+        while not closed.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            while True:
+                with pending_lock:
+                    items = next(pending, _DONE)
+                if items is _DONE:
+                    break
+                for item in items:
+                    if stop_event.is_set() or not put(item):
+                        return
+        except Exception as error:
+            put(error)
+        finally:
+            put(_DONE)
+
+    for _ in range(workers):
+        threading.Thread(target=produce, daemon=True).start()
+
+    finished = 0
+    try:
+        while finished < workers:
+            item = buffer.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        closed.set()
+
+
+class worker:
+    """
+    Process items in a background thread, fed through a bounded queue.
+
+    `submit` blocks while the queue is full, which applies backpressure to the stage feeding the worker. Errors
+    raised while processing an item are logged, and the worker carries on with the next item.
+
+    Args:
+        function (Callable[[Any], None]): The function processing each item.
+        max_size (int, optional): The maximum number of items waiting in the queue. Defaults to 4.
+        name (str, optional): The name of the stage, used in logs. Defaults to "worker".
+    """
+
+    def __init__(self, function: Callable[[Any], None], max_size: int = 4, name: str = "worker") -> None:
+        self.function = function
+        self.name = name
+        self._queue = queue.Queue(maxsize=max_size)
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            item = self._queue.get()
+            try:
+                if item is _DONE:
+                    return
+                self.function(item)
+            except Exception as error:
+                console.log(f"{self.name}: [bold red]{error}[/]")
+                console.print_exception()
+            finally:
+                self._queue.task_done()
+
+    def submit(self, item: Any) -> None:
+        """Queue an item, blocking while the queue is full."""
+        if not self._thread.is_alive():
+            raise RuntimeError(f"{self.name} is closed.")
+        self._queue.put(item)
+
+    def join(self) -> None:
+        """Wait until every queued item is processed."""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Process the remaining items and stop the thread."""
+        if not self._thread.is_alive():
+            return
+        if self._thread is threading.current_thread():
+            # Closed from the worker's own thread (e.g. by a finalizer): stop after the current item
+            self._stopping = True
+            return
+        self._queue.put(_DONE)
+        self._thread.join()
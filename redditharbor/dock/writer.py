@@ -0,0 +1,459 @@
+import os
+import asyncio
+import atexit
+import functools
+import threading
+import weakref
+from collections import deque
+from threading import Event
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import supabase
+from rich.console import Console
+from redditharbor.dock import stages
+
+console = Console(record=True)
+
+
+def _weak_method(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a bound method so that calling it does not keep its instance alive, doing nothing once it is gone."""
+    reference = weakref.WeakMethod(method)
+
+    def call(*args: Any) -> Any:
+        bound = reference()
+        if bound is not None:
+            return bound(*args)
+
+    return call
+
+
+def _shutdown(stop_event: Event, sender: Optional[stages.worker], exit_hook: Callable[[], None]) -> None:
+    stop_event.set()
+    if sender is not None:
+        sender.close()
+    atexit.unregister(exit_hook)
+
+
+class writer:
+    """
+    Buffer rows per table and write them to Supabase in batches.
+
+    Rows are flushed as `upsert(..., on_conflict=<primary key>, ignore_duplicates=True)` when a table's buffer
+    reaches `batch_size`, when `flush_interval` seconds have passed since the table was last flushed, and at
+    interpreter exit. Rows whose primary key is already stored are skipped by the database, so two workers
+    collecting the same submission, comment or redditor can never insert it twice.
+
+    With `ignore_duplicates=False`, rows whose primary key is already stored are merged instead: the columns
+    present in the row are updated, and the other columns are left untouched.
+
+    Batches are sent in the order they were flushed, one request at a time, and `add` never waits on a request
+    made by another thread. The primary keys of rows that could not be written, even one row at a time, are kept
+    in `failed` until taken with `take_failed`.
+
+    Call `close()` once done: it stops the flushing thread and writes the remaining rows. The writer does not keep
+    itself alive, so a writer dropped without `close()` stops its threads when it is garbage collected, losing the
+    rows still buffered.
+
+    Args:
+        supabase_client (supabase.Client): The Supabase client used for database interaction.
+        primary_keys (Dict[str, str]): A dictionary mapping each table name to its primary key column.
+        batch_size (int, optional): The maximum number of rows sent per request. Defaults to 500.
+        flush_interval (float, optional): The maximum number of seconds a row waits in the buffer. Defaults to 5.
+            Set to None to only flush on size, on `flush()` and at exit.
+        error_log_path (str, optional): The folder where failed rows are logged. Defaults to "error_log".
+        ignore_duplicates (bool, optional): Skip rows already in the database rather than merging them.
+            Defaults to True.
+        background (bool, optional): Send full batches from a background thread, so that collecting carries on
+            while rows are written. At most `queue_size` batches wait to be sent, after which `add` blocks.
+            Defaults to False, sending batches from the thread adding the rows.
+        queue_size (int, optional): The maximum number of batches waiting to be sent in the background.
+            Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        supabase_client: supabase.Client,
+        primary_keys: Dict[str, str],
+        batch_size: int = 500,
+        flush_interval: Optional[float] = 5,
+        error_log_path: str = None,
+        ignore_duplicates: bool = True,
+        background: bool = False,
+        queue_size: int = 4,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Invalid input: batch_size must be a positive integer.")
+
+        self.supabase = supabase_client
+        self.primary_keys = primary_keys
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.ignore_duplicates = ignore_duplicates
+        self.error_log_path = error_log_path or os.path.join(os.getcwd(), "error_log")
+        os.makedirs(self.error_log_path, exist_ok=True)
+
+        # Rows are keyed by primary key so a row queued twice is only sent once (first row kept when ignoring
+        # duplicates, latest row kept when merging)
+        self._buffers: Dict[str, Dict[str, dict]] = {table: {} for table in primary_keys}
+        self._last_flush = {table: time.time() for table in primary_keys}
+        self.inserted = {table: 0 for table in primary_keys}
+        self.failed: Dict[str, set] = {table: set() for table in primary_keys}
+        self._lock = threading.RLock()
+
+        # Batches taken from the buffers, waiting to be sent in order. Whichever thread holds `_send_lock` sends
+        # them all, so `add` only holds `_lock` while swapping buffers, never during a request
+        self._outbox = deque()
+        self._send_lock = threading.Lock()
+
+        # Batches being sent, by primary key, and the lock guarding them and the counts. Sending never takes
+        # `_lock`, so a full background queue cannot deadlock it
+        self._in_flight: Dict[str, set] = {table: set() for table in primary_keys}
+        self._count_lock = threading.Lock()
+        self._sender = (
+            stages.worker(_weak_method(self._send), max_size=queue_size, name="writer") if background else None
+        )
+
+        # Event to signal the flushing thread to stop
+        self.stop_event = Event()
+        self._flush_thread = None
+        if self.flush_interval:
+            self._flush_thread = threading.Thread(
+                target=self._flush_periodically,
+                args=(weakref.ref(self), self.stop_event, self.flush_interval),
+                daemon=True,
+            )
+            self._flush_thread.start()
+
+        # Neither hook holds a reference to the writer, so a writer dropped without close() can still be collected
+        self._exit_hook = functools.partial(self._close_at_exit, weakref.ref(self))
+        atexit.register(self._exit_hook)
+        self._finalizer = weakref.finalize(self, _shutdown, self.stop_event, self._sender, self._exit_hook)
+        self._finalizer.atexit = False
+
+    def add(self, table: str, row: dict) -> None:
+        """
+        Queue a row for insertion, flushing the table if its buffer is full.
+
+        Args:
+            table (str): The name of the table to insert the row into.
+            row (dict): The row to insert. Must contain the table's primary key.
+        """
+        with self._lock:
+            buffer = self._buffers[table]
+            key = row[self.primary_keys[table]]
+            if self.ignore_duplicates:
+                buffer.setdefault(key, row)
+            else:
+                buffer[key] = row
+
+            if len(buffer) < self.batch_size:
+                return
+            self._take(table)
+        self._dispatch()
+
+    def pending(self, table: str, key: str) -> bool:
+        """Check if a row with the given primary key is waiting in the buffer."""
+        with self._lock, self._count_lock:
+            return key in self._buffers[table] or key in self._in_flight[table]
+
+    def flush(self, table: str = None) -> int:
+        """
+        Write all buffered rows to the database.
+
+        Rows that could not be written are logged, and their primary keys added to `failed`: check it, or call
+        `take_failed`, to find out whether every row was written.
+
+        Args:
+            table (str, optional): Only flush this table. Defaults to None, flushing every table.
+
+        Returns:
+            int: The number of rows written (rows skipped as duplicates are not counted).
+        """
+        tables = [table] if table is not None else list(self._buffers)
+        inserted_before = sum(self.inserted[table] for table in tables)
+
+        with self._lock:
+            for table in tables:
+                self._take(table)
+        self._dispatch()
+        if self._sender is not None:
+            self._sender.join()
+
+        return sum(self.inserted[table] for table in tables) - inserted_before
+
+    def take_failed(self, table: str = None) -> Dict[str, List[str]]:
+        """
+        Return the primary keys of the rows that could not be written, and forget them.
+
+        Args:
+            table (str, optional): Only return the keys of this table. Defaults to None, returning every table.
+
+        Returns:
+            Dict[str, List[str]]: The failed primary keys per table.
+        """
+        tables = [table] if table is not None else list(self.failed)
+        with self._count_lock:
+            failed = {table: sorted(self.failed[table]) for table in tables}
+            for table in tables:
+                self.failed[table].clear()
+        return failed
+
+    def close(self) -> None:
+        """Stop the flushing thread and write any remaining rows."""
+        self.stop_event.set()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join()
+        self.flush()
+        self._finalizer()
+
+    @staticmethod
+    def _close_at_exit(reference: weakref.ref) -> None:
+        instance = reference()
+        if instance is not None:
+            instance.close()
+
+    @staticmethod
+    def _flush_periodically(reference: weakref.ref, stop_event: Event, flush_interval: float) -> None:
+        # The thread only holds the writer while flushing, and stops once the writer is garbage collected
+        while not stop_event.wait(flush_interval):
+            instance = reference()
+            if instance is None:
+                return
+            with instance._lock:
+                for table in instance._buffers:
+                    if time.time() - instance._last_flush[table] >= flush_interval:
+                        instance._take(table)
+            instance._dispatch()
+            del instance
+
+    def _take(self, table: str) -> None:
+        """Move a table's buffered rows to the outbox in batches. Must be called holding `_lock`."""
+        rows = list(self._buffers[table].values())
+        self._buffers[table] = {}
+        self._last_flush[table] = time.time()
+
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start : start + self.batch_size]
+            with self._count_lock:
+                self._in_flight[table].update(row[self.primary_keys[table]] for row in batch)
+            self._outbox.append((table, batch))
+
+    def _dispatch(self) -> None:
+        """Send the batches of the outbox in order, or hand them to the background sender."""
+        with self._send_lock:
+            while True:
+                with self._lock:
+                    if not self._outbox:
+                        return
+                    item = self._outbox.popleft()
+                if self._sender is None:
+                    self._send(item)
+                else:
+                    self._sender.submit(item)
+
+    def _send(self, item) -> None:
+        table, rows = item
+        inserted, failed = self._upsert(table, rows)
+        keys = [row[self.primary_keys[table]] for row in rows]
+        with self._count_lock:
+            self.inserted[table] += inserted
+            self._in_flight[table].difference_update(keys)
+            # A row written after failing earlier (e.g. queued again by the caller) is no longer failed
+            self.failed[table].difference_update(keys)
+            self.failed[table].update(failed)
+
+    def _upsert(self, table: str, rows: List[dict]) -> Tuple[int, List[str]]:
+        """Write rows, returning the number of rows written and the primary keys of the rows that failed."""
+        try:
+            return len(self._execute(table, rows)), []
+        except Exception as error:
+            console.log(
+                f"Failed to write {len(rows)} row(s) to DB-{table}: [bold red]{error}[/]. Retrying row by row"
+            )
+
+        # Retry individually so that a single invalid row does not drop the whole batch
+        inserted = 0
+        failed = []
+        for row in rows:
+            key = row[self.primary_keys[table]]
+            try:
+                inserted += len(self._execute(table, [row]))
+            except Exception as error:
+                failed.append(key)
+                console.log(f"{table}_{key}: [bold red]{error}[/]")
+                console.print_exception()
+                console.save_html(
+                    os.path.join(self.error_log_path, f"{table}_{key}.html")
+                )
+        return inserted, failed
+
+    def _execute(self, table: str, rows: List[dict]) -> List[dict]:
+        return (
+            self.supabase.table(table)
+            .upsert(
+                rows,
+                on_conflict=self.primary_keys[table],
+                ignore_duplicates=self.ignore_duplicates,
+            )
+            .execute()
+            .model_dump()["data"]
+        )
+
+
+class async_writer:
+    """
+    Buffer rows per table and write them to Supabase in batches, from asyncio tasks.
+
+    The asyncio counterpart of `writer`, with the same upsert semantics. Each full batch is sent in its own task,
+    so collecting carries on while rows are written, and at most `max_in_flight` requests are in flight at once:
+    `add` waits for a request to complete when all are taken. As with `writer`, the primary keys of rows that
+    could not be written are kept in `failed`.
+
+    Args:
+        client (Any): An async client exposing `table()`, e.g. a `supabase.AsyncClient` (from
+            `supabase.acreate_client`) or a `postgrest.AsyncPostgrestClient`.
+        primary_keys (Dict[str, str]): A dictionary mapping each table name to its primary key column.
+        batch_size (int, optional): The maximum number of rows sent per request. Defaults to 500.
+        max_in_flight (int, optional): The maximum number of requests in flight. Defaults to 16.
+        error_log_path (str, optional): The folder where failed rows are logged. Defaults to "error_log".
+        ignore_duplicates (bool, optional): Skip rows already in the database rather than merging them.
+            Defaults to True.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        primary_keys: Dict[str, str],
+        batch_size: int = 500,
+        max_in_flight: int = 16,
+        error_log_path: str = None,
+        ignore_duplicates: bool = True,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("Invalid input: batch_size must be a positive integer.")
+        if max_in_flight < 1:
+            raise ValueError("Invalid input: max_in_flight must be a positive integer.")
+
+        self.client = client
+        self.primary_keys = primary_keys
+        self.batch_size = batch_size
+        self.max_in_flight = max_in_flight
+        self.ignore_duplicates = ignore_duplicates
+        self.error_log_path = error_log_path or os.path.join(os.getcwd(), "error_log")
+        os.makedirs(self.error_log_path, exist_ok=True)
+
+        self._buffers: Dict[str, Dict[str, dict]] = {table: {} for table in primary_keys}
+        self._in_flight: Dict[str, set] = {table: set() for table in primary_keys}
+        self.inserted = {table: 0 for table in primary_keys}
+        self.failed: Dict[str, set] = {table: set() for table in primary_keys}
+        self._tasks = set()
+        # Created on first use, inside the running event loop
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def add(self, table: str, row: dict) -> None:
+        """
+        Queue a row for insertion, sending the table's batch if its buffer is full.
+
+        Args:
+            table (str): The name of the table to insert the row into.
+            row (dict): The row to insert. Must contain the table's primary key.
+        """
+        buffer = self._buffers[table]
+        key = row[self.primary_keys[table]]
+        if self.ignore_duplicates:
+            buffer.setdefault(key, row)
+        else:
+            buffer[key] = row
+
+        if len(buffer) >= self.batch_size:
+            await self._flush_table(table)
+
+    def pending(self, table: str, key: str) -> bool:
+        """Check if a row with the given primary key is waiting in the buffer or being sent."""
+        return key in self._buffers[table] or key in self._in_flight[table]
+
+    async def flush(self, table: str = None) -> int:
+        """
+        Write all buffered rows to the database and wait for every request in flight.
+
+        Rows that could not be written are logged, and their primary keys added to `failed`.
+
+        Args:
+            table (str, optional): Only flush this table. Defaults to None, flushing every table.
+
+        Returns:
+            int: The number of rows written (rows skipped as duplicates are not counted).
+        """
+        tables = [table] if table is not None else list(self._buffers)
+        inserted_before = sum(self.inserted[table] for table in tables)
+
+        for table in tables:
+            await self._flush_table(table)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks))
+
+        return sum(self.inserted[table] for table in tables) - inserted_before
+
+    async def _flush_table(self, table: str) -> None:
+        rows = list(self._buffers[table].values())
+        self._buffers[table] = {}
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start : start + self.batch_size]
+            # Wait for a free slot, so that no more than max_in_flight batches are ever held in memory
+            await self._slots.acquire()
+            self._in_flight[table].update(row[self.primary_keys[table]] for row in batch)
+            task = asyncio.ensure_future(self._send(table, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, table: str, rows: List[dict]) -> None:
+        keys = [row[self.primary_keys[table]] for row in rows]
+        try:
+            inserted, failed = await self._upsert(table, rows)
+            self.inserted[table] += inserted
+            self.failed[table].difference_update(keys)
+            self.failed[table].update(failed)
+        finally:
+            self._in_flight[table].difference_update(keys)
+            self._slots.release()
+
+    async def _upsert(self, table: str, rows: List[dict]) -> Tuple[int, List[str]]:
+        """Write rows, returning the number of rows written and the primary keys of the rows that failed."""
+        try:
+            return len(await self._execute(table, rows)), []
+        except Exception as error:
+            console.log(
+                f"Failed to write {len(rows)} row(s) to DB-{table}: [bold red]{error}[/]. Retrying row by row"
+            )
+
+        # Retry individually so that a single invalid row does not drop the whole batch
+        inserted = 0
+        failed = []
+        for row in rows:
+            key = row[self.primary_keys[table]]
+            try:
+                inserted += len(await self._execute(table, [row]))
+            except Exception as error:
+                failed.append(key)
+                console.log(f"{table}_{key}: [bold red]{error}[/]")
+                console.print_exception()
+                console.save_html(
+                    os.path.join(self.error_log_path, f"{table}_{key}.html")
+                )
+        return inserted, failed
+
+    async def _execute(self, table: str, rows: List[dict]) -> List[dict]:
+        response = await (
+            self.client.table(table)
+            .upsert(
+                rows,
+                on_conflict=self.primary_keys[table],
+                ignore_duplicates=self.ignore_duplicates,
+            )
+            .execute()
+        )
+        return response.model_dump()["data"]
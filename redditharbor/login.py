@@ -1,9 +1,12 @@
 import os
+import re
 import logging.config 
+from typing import Optional
 from dotenv import load_dotenv
 from supabase import create_client, Client
 import praw
 from rich.console import Console
+from redditharbor.utils import ratelimit
 
 console = Console(record=True)
 load_dotenv()
@@ -28,12 +31,14 @@ def save_credentials_to_env(service_name: str, credentials: dict):
     with open(".env", "r") as env_file:
         lines = env_file.readlines()
 
-    # Remove all lines related to the specified service, including the comment line
+    # Remove all lines related to the specified service, including the comment line. Other keys with the same
+    # prefix (e.g. REDDIT_1_PUBLIC for a client pool) are kept
+    keys = {f"{service_name.upper()}_{key}" for key in credentials}
     new_lines = [
         line
         for line in lines
         if not line.startswith(f"# {service_name} credentials")
-        and not line.startswith(f"{service_name.upper()}_")
+        and line.split("=", 1)[0].strip() not in keys
     ]
 
     # Add new credentials to the end of the file
@@ -66,7 +71,10 @@ def load_credentials_from_env(service_name: str):
 
 
 def reddit(
-    public_key: str = None, secret_key: str = None, user_agent: str = None
+    public_key: str = None,
+    secret_key: str = None,
+    user_agent: str = None,
+    rate_scheduler: ratelimit.rate_scheduler = None,
 ) -> praw.Reddit:
     """
     Connect to the Reddit API using the provided credentials or those stored in the .env file.
@@ -79,6 +87,8 @@ def reddit(
             the program making the request. It is recommended to use the following format:  
             "<Institution>:<ResearchProject> (by /u/YourRedditUserName)". 
             For example, "LondonSchoolofEconomics:Govt&Economics (by /u/econ101)"
+        rate_scheduler (ratelimit.rate_scheduler, optional): A scheduler pacing every API request of the client on
+            the quota Reddit reports. Share one scheduler between all clients using the same credentials.
 
     Returns:
         praw.Reddit: An instance of the Reddit API client if the connection is successful, else None.
@@ -95,8 +105,16 @@ def reddit(
     user_agent = user_agent or existing_credentials.get("USER_AGENT")
 
     try:
+        requestor = (
+            {
+                "requestor_class": ratelimit.scheduled_requestor,
+                "requestor_kwargs": {"rate_scheduler": rate_scheduler},
+            }
+            if rate_scheduler is not None
+            else {}
+        )
         reddit_client = praw.Reddit(
-            client_id=public_key, client_secret=secret_key, user_agent=user_agent
+            client_id=public_key, client_secret=secret_key, user_agent=user_agent, **requestor
         )
 
         # Currently, there seems to be no method for checking whether API access is authorized
@@ -136,6 +154,70 @@ def reddit(
         return None
 
 
+def reddit_pool(
+    user_agent: str = None, target: float = 0.98, burst: int = 5
+) -> Optional[ratelimit.client_pool]:
+    """
+    Connect to the Reddit API with every set of credentials numbered in the .env file, and pool the clients.
+
+    Credentials are read from REDDIT_1_PUBLIC, REDDIT_1_SECRET and REDDIT_1_USER_AGENT, REDDIT_2_PUBLIC and so on.
+    A set without a user agent uses REDDIT_USER_AGENT. Each client gets its own rate scheduler, as Reddit applies
+    its rate limit per OAuth client. Pass the pool to `collect` or `update` in place of a single client.
+
+    Parameters:
+        user_agent (str, optional): The user agent used for all clients, overriding those in the .env file.
+        target (float, optional): The share of each client's quota to use. Defaults to 0.98.
+        burst (int, optional): The maximum number of requests each client sends back to back. Defaults to 5.
+
+    Returns:
+        Optional[ratelimit.client_pool]: A pool of the clients that connected successfully, or None if no
+            numbered credentials are set or none of them could connect.
+    """
+
+    create_empty_env_file()
+
+    credentials = {}
+    for key, value in os.environ.items():
+        match = re.fullmatch(r"REDDIT_(\d+)_(PUBLIC|SECRET|USER_AGENT)", key)
+        if match:
+            credentials.setdefault(int(match.group(1)), {})[match.group(2)] = value
+
+    if not credentials:
+        console.log("[bold red]No numbered Reddit credentials (REDDIT_1_PUBLIC, REDDIT_1_SECRET, ...) found.")
+        return None
+
+    clients = []
+    schedulers = []
+    for number in sorted(credentials):
+        credential = credentials[number]
+        scheduler = ratelimit.rate_scheduler(target=target, burst=burst)
+        try:
+            reddit_client = praw.Reddit(
+                client_id=credential.get("PUBLIC"),
+                client_secret=credential.get("SECRET"),
+                user_agent=user_agent or credential.get("USER_AGENT") or os.environ.get("REDDIT_USER_AGENT"),
+                requestor_class=ratelimit.scheduled_requestor,
+                requestor_kwargs={"rate_scheduler": scheduler},
+            )
+
+            # Currently, there seems to be no method for checking whether API access is authorized
+            submission = reddit_client.submission(
+                url="https://www.reddit.com/r/reddit/comments/sphocx/test_post_please_ignore/"
+            )
+            if submission.selftext is not None:
+                clients.append(reddit_client)
+                schedulers.append(scheduler)
+
+        except Exception as e:
+            console.log(f"[bold red]Failed to connect to Reddit with credentials {number}.[/] Error: {str(e)}")
+
+    if not clients:
+        return None
+
+    console.log(f"[bold green]Connected to Reddit successfully with {len(clients)} client(s).")
+    return ratelimit.client_pool(clients, schedulers)
+
+
 def supabase(url: str = None, private_key: str = None) -> Client:
     """
     Connect to the Supabase database using the provided credentials or those stored in the .env file.
@@ -0,0 +1,249 @@
+import os
+import csv
+import json
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional
+from PIL import Image
+
+HASH_BITS = 64
+
+
+def ahash(path: str, size: int = 8) -> int:
+    """
+    Compute the average hash of an image: one bit per pixel of a size x size grayscale thumbnail, set if the
+    pixel is brighter than the mean.
+    """
+    with Image.open(path) as image:
+        pixels = list(image.convert("L").resize((size, size), Image.Resampling.LANCZOS).getdata())
+    mean = sum(pixels) / len(pixels)
+    return sum(1 << i for i, pixel in enumerate(pixels) if pixel > mean)
+
+
+def dhash(path: str, size: int = 8) -> int:
+    """
+    Compute the difference hash of an image: one bit per pair of horizontally adjacent pixels of a
+    (size + 1) x size grayscale thumbnail, set if the left pixel is brighter.
+    """
+    with Image.open(path) as image:
+        pixels = list(image.convert("L").resize((size + 1, size), Image.Resampling.LANCZOS).getdata())
+    bits = (
+        pixels[row * (size + 1) + col] > pixels[row * (size + 1) + col + 1]
+        for row in range(size)
+        for col in range(size)
+    )
+    return sum(1 << i for i, bit in enumerate(bits) if bit)
+
+
+HASH_METHODS = {"ahash": ahash, "dhash": dhash}
+
+
+def _hash_image(path: str, method: str) -> Optional[int]:
+    """Hash an image in a worker process, returning None if the file is not a readable image."""
+    try:
+        return HASH_METHODS[method](path)
+    except Exception:
+        return None
+
+
+class image_index:
+    def __init__(
+        self,
+        folder: str,
+        method: str = "dhash",
+        max_distance: int = 4,
+        action: str = "hardlink",
+        index_name: str = ".image_index.json",
+        processes: int = None,
+    ):
+        """
+        Initialize a perceptual-hash index of the images saved in a folder, used to detect reposted images.
+
+        Each image is hashed with aHash or dHash, and an image whose hash is within `max_distance` bits of an
+        image already indexed is treated as a near-duplicate of it. The first image of each cluster is kept as
+        the canonical file, and duplicates are replaced by a hard link to it or deleted.
+
+        Args:
+            folder (str): The folder containing the images.
+            method (str, optional): The perceptual hash, "ahash" or "dhash". Defaults to "dhash".
+            max_distance (int, optional): The maximum number of differing bits between near-duplicates.
+                Defaults to 4. Set to 0 to only match identical hashes.
+            action (str, optional): "hardlink" to replace duplicates with a hard link to the canonical file,
+                saving disk while keeping one file per submission, or "skip" to delete duplicates.
+                Defaults to "hardlink".
+            index_name (str, optional): The file name of the index, stored in the folder.
+            processes (int, optional): The number of worker processes hashing images. Defaults to the number of
+                CPUs. The pool is started with "spawn" on the first call to `add` and reused until `close`, so
+                scripts must be guarded by `if __name__ == "__main__":`.
+
+        Raises:
+            ValueError: If method, max_distance or action is not valid.
+
+        Note:
+            The index is saved in the folder, so later runs only hash new images. Deleted ("skip") duplicates
+            remain in the index, so `to_img` does not download them again.
+        """
+        if method not in HASH_METHODS:
+            raise ValueError(f"Invalid input: method must be one of {list(HASH_METHODS)}")
+        if not 0 <= max_distance < HASH_BITS:
+            raise ValueError(f"Invalid input: max_distance must be between 0 and {HASH_BITS - 1}")
+        if action not in ("hardlink", "skip"):
+            raise ValueError("Invalid input: action must be 'hardlink' or 'skip'")
+
+        self.folder = folder
+        self.method = method
+        self.max_distance = max_distance
+        self.action = action
+        self.index_path = os.path.join(folder, index_name)
+
+        # file name -> hash, and file name -> canonical file name of its cluster
+        self.hashes: Dict[str, int] = dict()
+        self.clusters: Dict[str, str] = dict()
+        # Near-duplicates differ in at most max_distance bits, so they share at least one of max_distance + 1
+        # bands exactly. Canonical hashes are bucketed per band to avoid comparing each image with all others.
+        self._bands = self._band_masks(max_distance + 1)
+        self._buckets: List[Dict[int, List[str]]] = [dict() for _ in self._bands]
+        self._lock = threading.Lock()
+        self.processes = processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+        self._load()
+
+    @staticmethod
+    def _band_masks(count: int) -> List[int]:
+        width, remainder = divmod(HASH_BITS, count)
+        masks, start = [], 0
+        for band in range(count):
+            end = start + width + (1 if band < remainder else 0)
+            masks.append(((1 << (end - start)) - 1) << start)
+            start = end
+        return masks
+
+    def _load(self) -> None:
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("method") != self.method:
+            raise ValueError(
+                f"Invalid input: {self.index_path} was built with {index.get('method')}, not {self.method}"
+            )
+        for file_name, entry in index["files"].items():
+            self.hashes[file_name] = int(entry["hash"], 16)
+            self.clusters[file_name] = entry["canonical"]
+            if entry["canonical"] == file_name:
+                self._add_canonical(file_name, self.hashes[file_name])
+
+    def save(self) -> None:
+        """Write the index to the folder."""
+        with self._lock:
+            files = {
+                file_name: {"hash": f"{self.hashes[file_name]:016x}", "canonical": canonical}
+                for file_name, canonical in self.clusters.items()
+            }
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump({"method": self.method, "files": files}, f)
+
+    def __contains__(self, file_name: str) -> bool:
+        return file_name in self.clusters
+
+    def _add_canonical(self, file_name: str, hash_value: int) -> None:
+        for mask, buckets in zip(self._bands, self._buckets):
+            buckets.setdefault(hash_value & mask, []).append(file_name)
+
+    def _find_canonical(self, hash_value: int) -> Optional[str]:
+        best, best_distance = None, self.max_distance + 1
+        for mask, buckets in zip(self._bands, self._buckets):
+            for candidate in buckets.get(hash_value & mask, []):
+                distance = bin(hash_value ^ self.hashes[candidate]).count("1")
+                if distance < best_distance:
+                    best, best_distance = candidate, distance
+        return best
+
+    def add(self, file_names: List[str]) -> Dict[str, str]:
+        """
+        Hash new images in the index's process pool and deduplicate them against the index.
+
+        Args:
+            file_names (List[str]): The file names of the images, relative to the folder. Images already
+                indexed are not hashed again.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping each new image to the canonical file of its cluster. Images
+                that could not be read are left out.
+        """
+        new_files = [file_name for file_name in dict.fromkeys(file_names) if file_name not in self]
+        if not new_files:
+            return dict()
+
+        paths = [os.path.join(self.folder, file_name) for file_name in new_files]
+        if self._executor is None:
+            # Forked workers would inherit the caller's threads and locks (e.g. the writer), so spawn them
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+        hash_values = list(self._executor.map(partial(_hash_image, method=self.method), paths, chunksize=32))
+
+        added = dict()
+        with self._lock:
+            for file_name, path, hash_value in zip(new_files, paths, hash_values):
+                if hash_value is None:
+                    continue
+
+                canonical = self._find_canonical(hash_value)
+                self.hashes[file_name] = hash_value
+                if canonical is None:
+                    self.clusters[file_name] = file_name
+                    self._add_canonical(file_name, hash_value)
+                else:
+                    self.clusters[file_name] = canonical
+                    self._remove_duplicate(path, os.path.join(self.folder, canonical))
+                added[file_name] = self.clusters[file_name]
+
+        return added
+
+    def close(self) -> None:
+        """Shut down the worker processes. A later `add` starts a new pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _remove_duplicate(self, path: str, canonical_path: str) -> None:
+        os.remove(path)
+        if self.action == "hardlink":
+            try:
+                os.link(canonical_path, path)
+            except OSError:
+                # Hard links are not supported on every file system, the duplicate is then skipped
+                pass
+
+    def to_csv(self, file_name: str = "image_clusters.csv") -> str:
+        """
+        Save the submission_id -> image cluster mapping to a .csv file in the folder.
+
+        Each row holds the submission id, the file name, the cluster (the submission id of the canonical image),
+        the canonical file name and the perceptual hash.
+
+        Args:
+            file_name (str, optional): The name of the output file. Defaults to "image_clusters.csv".
+
+        Returns:
+            str: The path of the .csv file.
+        """
+        path = os.path.join(self.folder, file_name)
+        with self._lock, open(path, "w", newline="", encoding="utf-8") as f:
+            csv_writer = csv.writer(f)
+            csv_writer.writerow(["submission_id", "file", "cluster", "canonical", "hash"])
+            for image, canonical in sorted(self.clusters.items()):
+                csv_writer.writerow(
+                    [
+                        os.path.splitext(image)[0],
+                        image,
+                        os.path.splitext(canonical)[0],
+                        canonical,
+                        f"{self.hashes[image]:016x}",
+                    ]
+                )
+        return path
@@ -1,26 +1,287 @@
 import os
+import contextlib
 import supabase
 import pickle
 import json
 import csv
-from typing import List
+import re
+import datetime
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Iterator, List, Optional
 from rich.progress import track
 from rich.console import Console
 import requests 
-from io import BytesIO
-from PIL import Image
+from requests.adapters import HTTPAdapter
+from redditharbor.utils import keyset, dedup
 
 console = Console()
 
 # While it might have been possible to design a unified class for submission, comment, and redditor,
 # we opted for three separate classes with near-identical structures to enhance user experience (UX).
 
+
+def _validate_columns(columns: List[str] or str, valid_columns: List[str]) -> List[str] or str:
+    """Return the columns to select ("*" for "all"), raising ValueError if any column is invalid."""
+    if isinstance(columns, str):
+        if columns.lower() == "all":
+            return "*"
+        raise ValueError(f"Invalid input: {columns}")
+    elif isinstance(columns, list):
+        invalid_columns = set(columns) - set(valid_columns)
+        if invalid_columns:
+            raise ValueError(f"Invalid column names provided: {invalid_columns}")
+        return columns
+    else:
+        raise ValueError("Input is neither a string nor a list.")
+
+
+def _import_pyarrow():
+    """Import pyarrow lazily, as it is only required for Parquet exports."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Parquet export requires additional dependencies. "
+            "Please install with: pip install redditharbor[parquet]"
+        ) from e
+    return pyarrow, pyarrow.parquet
+
+
+def _arrow_types(pa, table: str) -> dict:
+    """Return the Arrow type of every column of a RedditHarbor table ("submission", "comment" or "user")."""
+    timestamp = pa.timestamp("us", tz="UTC")
+    if table == "submission":
+        return {
+            "submission_id": pa.string(),
+            "redditor_id": pa.string(),
+            "created_at": timestamp,
+            "title": pa.string(),
+            "text": pa.large_string(),
+            "subreddit": pa.string(),
+            "permalink": pa.string(),
+            "attachment": pa.map_(pa.string(), pa.string()),
+            "flair": pa.struct([("link", pa.string()), ("author", pa.string())]),
+            "awards": pa.struct(
+                [
+                    ("total_awards_count", pa.int64()),
+                    ("total_awards_price", pa.int64()),
+                    ("list", pa.map_(pa.string(), pa.list_(pa.int64()))),
+                ]
+            ),
+            "score": pa.map_(pa.string(), pa.int64()),
+            "upvote_ratio": pa.map_(pa.string(), pa.float64()),
+            "num_comments": pa.map_(pa.string(), pa.int64()),
+            "edited": pa.bool_(),
+            "archived": pa.bool_(),
+            "removed": pa.bool_(),
+            "poll": pa.struct(
+                [
+                    ("total_vote_count", pa.int64()),
+                    ("vote_ends_at", pa.string()),
+                    ("options", pa.map_(pa.string(), pa.string())),
+                    ("closed", pa.bool_()),
+                ]
+            ),
+        }
+    elif table == "comment":
+        return {
+            "comment_id": pa.string(),
+            "link_id": pa.string(),
+            "subreddit": pa.string(),
+            "parent_id": pa.string(),
+            "redditor_id": pa.string(),
+            "created_at": timestamp,
+            "body": pa.large_string(),
+            "score": pa.map_(pa.string(), pa.int64()),
+            "edited": pa.bool_(),
+            "removed": pa.string(),
+        }
+    else:
+        return {
+            "redditor_id": pa.string(),
+            "name": pa.string(),
+            "created_at": timestamp,
+            "karma": pa.struct(
+                [
+                    ("comment", pa.int64()),
+                    ("link", pa.int64()),
+                    ("awardee", pa.int64()),
+                    ("awarder", pa.int64()),
+                    ("total", pa.int64()),
+                ]
+            ),
+            "is_gold": pa.bool_(),
+            "is_mod": pa.map_(pa.string(), pa.list_(pa.string())),
+            "trophy": pa.struct([("list", pa.list_(pa.string())), ("count", pa.int64())]),
+            "removed": pa.string(),
+        }
+
+
+def _to_arrow_value(pa, value: Any, arrow_type) -> Any:
+    """Convert a value returned by Supabase to a Python value accepted by pyarrow for `arrow_type`."""
+    if value is None:
+        return None
+    if pa.types.is_timestamp(arrow_type):
+        # Postgres trims trailing zeros of fractional seconds, which fromisoformat() rejects before Python 3.11
+        value = re.sub(r"\.(\d+)", lambda m: "." + m.group(1)[:6].ljust(6, "0"), value.replace("Z", "+00:00"))
+        return datetime.datetime.fromisoformat(value)
+    if pa.types.is_map(arrow_type):
+        return [
+            (key, _to_arrow_value(pa, item, arrow_type.item_type))
+            for key, item in value.items()
+        ]
+    if pa.types.is_struct(arrow_type):
+        fields = [arrow_type.field(i) for i in range(arrow_type.num_fields)]
+        return {
+            field.name: _to_arrow_value(pa, value.get(field.name), field.type)
+            for field in fields
+        }
+    if pa.types.is_list(arrow_type):
+        return [_to_arrow_value(pa, item, arrow_type.value_type) for item in value]
+    if (pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)) and not isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def _write_parquet(
+    pages: Iterator[List[dict]],
+    file_name: str,
+    table: str,
+    columns: List[str],
+    compression: str,
+    row_group_size: int,
+) -> int:
+    """Stream pages of rows into a Parquet file, writing one row group per `row_group_size` rows."""
+    pa, pq = _import_pyarrow()
+    arrow_types = _arrow_types(pa, table)
+    schema = pa.schema([(column, arrow_types[column]) for column in columns])
+
+    row_count = 0
+    buffer = []
+
+    def write_row_group(parquet_writer, rows):
+        arrays = [
+            pa.array(
+                [_to_arrow_value(pa, row.get(column), arrow_types[column]) for row in rows],
+                type=arrow_types[column],
+            )
+            for column in columns
+        ]
+        parquet_writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+
+    with pq.ParquetWriter(file_name, schema, compression=compression) as parquet_writer:
+        for rows in pages:
+            buffer.extend(rows)
+            row_count += len(rows)
+            if len(buffer) >= row_group_size:
+                write_row_group(parquet_writer, buffer)
+                buffer = []
+        if buffer:
+            write_row_group(parquet_writer, buffer)
+
+    return row_count
+
+
+# Status codes worth retrying: rate limited or a transient server error
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+def _http_session(concurrency: int) -> requests.Session:
+    """Create a session keeping up to `concurrency` keep-alive connections open per host."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _download_file(
+    session: requests.Session,
+    url: str,
+    path: str,
+    retries: int = 5,
+    backoff: float = 1.0,
+    timeout: float = 30,
+    chunk_size: int = 64 * 1024,
+    resume: bool = False,
+) -> Optional[str]:
+    """
+    Stream a file to disk in chunks, retrying rate-limited and failed requests with exponential backoff.
+
+    The file is written to `<path>.part` and renamed once complete, so an interrupted download never leaves a
+    truncated file at `path`. With `resume`, an existing `<path>.part` is continued with an HTTP Range request,
+    both across runs and when a retry follows a dropped connection.
+
+    Returns:
+        Optional[str]: None if the file was downloaded, otherwise the reason of the failure.
+    """
+    part_path = f"{path}.part"
+
+    for attempt in range(retries + 1):
+        delay = backoff * 2**attempt * (1 + random.random())
+        offset = os.path.getsize(part_path) if resume and os.path.exists(part_path) else 0
+        # Byte ranges refer to the encoded body, so compression is disabled when resuming
+        headers = {"Range": f"bytes={offset}-", "Accept-Encoding": "identity"} if offset else None
+        try:
+            with session.get(url, headers=headers, stream=True, timeout=timeout) as response:
+                if response.status_code in RETRY_STATUS_CODES and attempt < retries:
+                    retry_after = response.headers.get("Retry-After", "")
+                    time.sleep(float(retry_after) if retry_after.isdigit() else delay)
+                    continue
+                if response.status_code == 416 and offset:
+                    # The partial file already holds the whole body
+                    os.replace(part_path, path)
+                    return None
+                if response.status_code not in (200, 206):
+                    return f"HTTP {response.status_code}"
+
+                # A server ignoring the Range header sends the whole body (200), which restarts the file
+                with open(part_path, "ab" if response.status_code == 206 else "wb") as file:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        file.write(chunk)
+            os.replace(part_path, path)
+            return None
+        except (requests.RequestException, OSError) as error:
+            if attempt == retries:
+                return str(error)
+            time.sleep(delay)
+
+
+# Renditions tried for v.redd.it videos, from the highest resolution. Reddit stores the video and audio tracks
+# separately, and the DASH video renditions have no audio.
+REDDIT_VIDEO_RESOLUTIONS = [1080, 720, 480, 360, 240]
+
+
+def _media_urls(media_type: str, url: str) -> List[str]:
+    """List the candidate file URLs of a video or gif attachment, in order of preference."""
+    if media_type == "video" and "v.redd.it" in url:
+        base_url = url.rstrip("/")
+        return [f"{base_url}/DASH_{resolution}.mp4" for resolution in REDDIT_VIDEO_RESOLUTIONS]
+    return [url]
+
+
+def _download_media(
+    session: requests.Session, urls: List[str], path: str, retries: int, chunk_size: int
+) -> Optional[str]:
+    """Download the first available candidate URL, resuming any partial download."""
+    error = None
+    for url in urls:
+        error = _download_file(session, url, path, retries=retries, chunk_size=chunk_size, resume=True)
+        if error is None or not error.startswith(("HTTP 403", "HTTP 404")):
+            return error
+    return error
+
+
 class submission:
     def __init__(
         self,
         supabase_client: supabase.Client,
         db_name: str,
         paginate: bool or dict = True,
+        workers: int = 1,
     ):
         """
         Initialize an instance for interacting with a Supabase table containing submission data.
@@ -30,17 +291,20 @@ class submission:
             db_name (str): The name of the Supabase table containing submission data.
             paginate (bool or dict, optional): Set to `True` to automatically paginate through large datasets.
                 You can also provide a dictionary with "row_count" and "page_size" values.
-                Defaults to False.
+                Defaults to True.
+            workers (int, optional): The number of pages fetched concurrently by the exporters. Defaults to 1.
+                Pages are still written in primary key order, so .csv and .txt files are identical to a
+                sequential export.
 
         Note:
-            If your database has more than 1 million rows, it's recommended to set the paginate parameter to 
-            ensure efficient data retrieval. You can set paginate to True for automatic settings or provide 
-            a dictionary with "row_count" and "page_size" values. 
-             
+            Rows are paged with keyset pagination on the primary key, so exports never count the entire table
+            and keep a constant cost per page regardless of the table size. You can set paginate to True for
+            automatic settings or provide a dictionary with "row_count" and "page_size" values.
+
             For larger datasets, consider:
                 1. Set "row_count" by checking row counts directly from the Supabase table editor. 
-                It is common for large datasets to raise ReadTimeoutError, when counting the entire rows. 
-                
+                It is only used to display the progress of exports.
+
                 2. Adjust the "Max Rows" setting in 'API Settings' on Supabase, allowing you to retrieve up to 10,000 rows at a time. 
                 The default limit to the amount of rows returned is 1,000 in Supabase.
             
@@ -51,6 +315,9 @@ class submission:
         self.submission_db_config = db_name
         self.submission_db = self.supabase.table(self.submission_db_config)
         self.paginate = paginate
+        if workers < 1:
+            raise ValueError("Invalid input: workers must be a positive integer.")
+        self.workers = workers
 
         self.columns = [
             "submission_id",
@@ -73,24 +340,67 @@ class submission:
         ]
 
         if self.paginate is True:
-            self.row_count = (
-                self.submission_db.select("submission_id", count="exact")
-                .execute()
-                .count
-            )
+            self.row_count = None
             self.page_size = 1000
-            self.page_numbers = (self.row_count // self.page_size) + (1 if self.row_count % self.page_size != 0 else 0)
         else:
             # self.paginate.get("key", default) is a dictionary method that returns the value for the given key if the key is present in the dictionary. If the key is not found, it returns the default value.
-            # In this case, it's used to get the "row_count" and "page_size" from the paginate dictionary, with default values of fetching the row count from Supabase and using a default page size of 1000 if these keys are not present.
-            self.row_count = self.paginate.get(
-                "row_count",
-                self.submission_db.select("submission_id", count="exact")
-                .execute()
-                .count,
-            )
+            # In this case, it's used to get the "row_count" and "page_size" from the paginate dictionary. The row count is only used to display progress, and the page size defaults to 1000.
+            self.row_count = self.paginate.get("row_count")
             self.page_size = self.paginate.get("page_size", 1000)
+
+        if self.row_count is not None:
             self.page_numbers = (self.row_count // self.page_size) + (1 if self.row_count % self.page_size != 0 else 0)
+        else:
+            self.page_numbers = None
+
+    def _pages(self, columns: List[str] or str, page_size: int = None):
+        """Page through the table in primary key order, yielding one list of rows per page."""
+        if self.workers > 1:
+            return keyset.parallel_pages(
+                self.submission_db, columns, key="submission_id", page_size=page_size or self.page_size, workers=self.workers
+            )
+        return keyset.pages(
+            self.submission_db, columns, key="submission_id", page_size=page_size or self.page_size
+        )
+
+    def iter_batches(self, columns: List[str] or str = "all", batch_size: int = None) -> Iterator[List[dict]]:
+        """
+        Lazily iterate over the submission data in batches of rows, in primary key order.
+
+        Only one batch is held in memory at a time, whatever the size of the table (up to `2 * workers` batches
+        when fetching with several workers).
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            batch_size (int, optional): The number of rows per batch. Defaults to the page size.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+
+        Returns:
+            Iterator[List[dict]]: A generator of batches of rows, each row mapping column names to values.
+        """
+        return self._pages(_validate_columns(columns, self.columns), batch_size)
+
+    def iter_rows(self, columns: List[str] or str = "all", batch_size: int = None) -> Iterator[dict]:
+        """
+        Lazily iterate over the submission data row by row, in primary key order.
+
+        Rows are fetched in batches of `batch_size`, so memory stays bounded by one batch (by `2 * workers`
+        batches when fetching with several workers).
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            batch_size (int, optional): The number of rows fetched per request. Defaults to the page size.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+
+        Returns:
+            Iterator[dict]: A generator of rows, each mapping column names to values.
+        """
+        batches = self.iter_batches(columns, batch_size)
+        return (row for batch in batches for row in batch)
 
     def to_pkl(self, columns: List[str] or str, file_name: str = "submission", file_path: str = "submission_exports"):
         """
@@ -110,36 +420,19 @@ class submission:
         save_file_path = os.path.join(self.cwd, f"{file_path}")
         
         os.makedirs(save_file_path, exist_ok=True)
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count, page = 0, 0
 
-        for page in track(
-            range(1, self.page_numbers + 1),
-            description=f"Downloading to .pickle file in {save_file_path}",
+        for page, paginated_submissions in enumerate(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .pickle file in {save_file_path}",
+            ),
+            start=1,
         ):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_submissions = (
-                self.submission_db.select(*columns).range(start_row, end_row).execute()
-            ).model_dump()["data"]
+            row_count += len(paginated_submissions)
             with open(
                 os.path.join(save_file_path, f"{file_name}_{page}.pickle"), "wb"
             ) as handle:
@@ -148,7 +441,7 @@ class submission:
                 )
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {self.page_numbers - 1} pickle files"
+            f"{row_count} rows downloaded and saved in {page} pickle files"
         )
 
     def to_csv(self, columns: List[str] or str, file_name: str = "submission", file_path: str = "submission_exports"):
@@ -172,19 +465,9 @@ class submission:
 
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, 1000
+        row_count = 0
 
         with open(
             save_file_name, "w", newline="", encoding="utf-8"
@@ -192,29 +475,17 @@ class submission:
             writer = csv.writer(csvfile)
             writer.writerow(columns if columns != "*" else self.columns)
 
-            for page in track(
-                range(1, self.page_numbers + 1),
+            for paginated_submissions in track(
+                self._pages(columns),
+                total=self.page_numbers,
                 description=f"Downloading to .csv file in {save_file_path}",
             ):
-                if page == 1:
-                    pass
-                elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-                else:
-                    start_row += self.page_size
-                    end_row = self.row_count
-                
-                paginated_submissions = (
-                    self.submission_db.select(*columns)
-                    .range(start_row, end_row)
-                    .execute()
-                ).model_dump()["data"]
+                row_count += len(paginated_submissions)
                 for row in paginated_submissions:
                     writer.writerow(list(row.values()))
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {save_file_name}"
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
     def to_txt(self, columns: List[str] or str, file_name: str = "submission", file_path: str = "submission_exports"):
@@ -238,46 +509,24 @@ class submission:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count = 0
 
         with open(save_file_name, "w", encoding="utf-8") as txtfile:
             txtfile.write("\t".join(columns if columns != "*" else self.columns) + "\n")
 
-            for page in track(
-                range(1, self.page_numbers + 1),
+            for paginated_submissions in track(
+                self._pages(columns),
+                total=self.page_numbers,
                 description=f"Downloading to .txt file in {save_file_path}",
             ):
-                if page == 1:
-                    pass
-                elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-                else:
-                    start_row += self.page_size
-                    end_row = self.row_count
-                
-                paginated_submissions = (
-                    self.submission_db.select(*columns)
-                    .range(start_row, end_row)
-                    .execute()
-                ).model_dump()["data"]
+                row_count += len(paginated_submissions)
                 for row in paginated_submissions:
                     txtfile.write("\t".join(map(str, row.values())) + "\n")
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {save_file_name}"
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
     def to_json(self, columns: List[str] or str, file_name: str = "submission", file_path: str = "submission_exports"):
@@ -300,51 +549,112 @@ class submission:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count, page = 0, 0
 
-        for page in track(
-            range(1, self.page_numbers + 1),
-            description=f"Downloading to .json file in {save_file_path}",
+        for page, paginated_submissions in enumerate(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .json file in {save_file_path}",
+            ),
+            start=1,
         ):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_submissions = (
-                self.submission_db.select(*columns).range(start_row, end_row).execute()
-            ).model_dump()["data"]
+            row_count += len(paginated_submissions)
             with open(
                 os.path.join(save_file_path, f"{file_name}_{page}.json"), "w", encoding="utf-8"
             ) as jsonfile:
                 json.dump(paginated_submissions, jsonfile, ensure_ascii=False, indent=2)
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {self.page_numbers - 1} json files"
+            f"{row_count} rows downloaded and saved in {page} json files"
         )
     
-    def to_img(self, file_path: str = "submission_exports"):
+    def to_parquet(
+        self,
+        columns: List[str] or str,
+        file_name: str = "submission",
+        file_path: str = "submission_exports",
+        compression: str = "zstd",
+        row_group_size: int = 100000,
+    ):
+        """
+        Save Supabase data to a typed, compressed .parquet file.
+
+        Rows are streamed into the file one row group at a time. Timestamps are stored as timestamps, booleans as
+        booleans, and JSON columns as Arrow maps and structs.
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            file_name (str): The base name for the output file. Defaults to submission.
+            file_path (str): The relative path to the directory where the Parquet file will be saved.
+            compression (str): The compression codec, e.g. "zstd", "snappy", "gzip" or "none". Defaults to "zstd".
+            row_group_size (int): The number of rows per row group. Defaults to 100,000.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+            ImportError: If pyarrow is not installed.
+
+        Returns:
+            None. Prints the number of rows downloaded and the Parquet file created.
+        """
+        save_file_path = os.path.join(self.cwd, f"{file_path}")
+        save_file_name = os.path.join(save_file_path, f"{file_name}.parquet")
+
+        os.makedirs(save_file_path, exist_ok=True)
+
+        columns = _validate_columns(columns, self.columns)
+
+        row_count = _write_parquet(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .parquet file in {save_file_path}",
+            ),
+            save_file_name,
+            table="submission",
+            columns=columns if columns != "*" else self.columns,
+            compression=compression,
+            row_group_size=row_group_size,
+        )
+
+        return console.print(
+            f"{row_count} rows downloaded and saved in {save_file_name}"
+        )
+
+    def to_img(
+        self,
+        file_path: str = "submission_exports",
+        concurrency: int = 16,
+        retries: int = 5,
+        overwrite: bool = False,
+        deduplicate: str = None,
+        hash_method: str = "dhash",
+        max_distance: int = 4,
+    ):
         """
         Save image data in submissions to .jpeg or .png files. Ignores all other columns. 
 
         Args:
             file_path (str): The relative path to the directory where the image file will be saved.
+            concurrency (int, optional): The number of images downloaded at once. Defaults to 16.
+            retries (int, optional): The number of retries, with exponential backoff, when a request is rate
+                limited (429), fails with a server error (5xx) or times out. Defaults to 5.
+            overwrite (bool, optional): Download images already saved in file_path again. Defaults to False,
+                so an interrupted download can be resumed by running it again.
+            deduplicate (str, optional): Detect reposted images with a perceptual hash. Set to "hardlink" to
+                replace near-duplicates with a hard link to the first copy, or "skip" to delete them.
+                Defaults to None, keeping every image.
+            hash_method (str, optional): The perceptual hash used to deduplicate, "ahash" or "dhash".
+                Defaults to "dhash".
+            max_distance (int, optional): The maximum number of differing hash bits between near-duplicates.
+                Defaults to 4.
+
+        Note:
+            When deduplicating, images are hashed in a process pool and indexed in `.image_index.json`, and
+            the submission_id -> image cluster mapping is saved to `image_clusters.csv` in file_path. Scripts
+            using it on Windows or macOS must be guarded by `if __name__ == "__main__":`.
 
         Returns:
             None. Prints the number of images downloaded.
@@ -353,51 +663,69 @@ class submission:
         
         os.makedirs(save_file_path, exist_ok=True)
         
-        success, fail = 0, 0 
+        success, skipped, fail = 0, 0, 0 
         failed_urls = list()
-        start_row, end_row = 0, self.page_size
         
         console.print(f"Downloading image file(s) in {save_file_path}")
-        
-        for page in range(1, self.page_numbers + 1):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_submissions = (
-                self.submission_db.select("submission_id", "attachment").range(start_row, end_row).execute()
-            ).model_dump()["data"]
-            
-            for data in track(paginated_submissions, description=f"Downloading bulk {page}\{self.page_numbers}"): 
-                if (data['attachment'] is None): 
-                    pass 
-                else:
-                    if 'jpg' in data['attachment'].keys():  
-                        img_url = data.get('attachment', {}).get('jpg', None)
-                        img_type = 'jpg'
-                    elif 'png' in data["attachment"].keys():
-                        img_url = data.get('attachment', {}).get('png', None)
-                        img_type = 'png'
+
+        index = None
+        if deduplicate is not None:
+            index = dedup.image_index(
+                save_file_path, method=hash_method, max_distance=max_distance, action=deduplicate
+            )
+
+        # The index's hashing processes are reused for every page, and stopped once the export ends
+        hashing = contextlib.closing(index) if index is not None else contextlib.nullcontext()
+        with _http_session(concurrency) as session, ThreadPoolExecutor(max_workers=concurrency) as executor, hashing:
+            for page, paginated_submissions in enumerate(
+                self._pages(["submission_id", "attachment"]), start=1
+            ):
+                futures, unindexed = dict(), list()
+                for data in paginated_submissions: 
+                    attachment = data["attachment"] or {}
+                    if 'jpg' in attachment.keys():  
+                        img_url, img_type = attachment.get('jpg'), 'jpg'
+                    elif 'png' in attachment.keys():
+                        img_url, img_type = attachment.get('png'), 'png'
                     else: 
                         img_url = None 
-                    
-                    if img_url is not None:         
-                        response = requests.get(img_url)
-                        if response.status_code == 200: 
-                            path = os.path.join(save_file_path, f"{data['submission_id']}.{img_type}")
-                            with open(path, 'wb') as file:
-                                file.write(response.content)
-                            success += 1
-                        else:
-                            # console.print(f"[bold red]{response.status_code}[/]: Failed to download image (url: {img_url})") 
-                            fail += 1 
-                            failed_urls.append(img_url)
-        
+
+                    if img_url is None:
+                        continue
+
+                    img_file = f"{data['submission_id']}.{img_type}"
+                    path = os.path.join(save_file_path, img_file)
+                    if not overwrite and (os.path.exists(path) or (index is not None and img_file in index)):
+                        skipped += 1
+                        # Images saved before deduplication was enabled are indexed as well
+                        if index is not None and img_file not in index:
+                            unindexed.append(img_file)
+                        continue
+
+                    futures[executor.submit(_download_file, session, img_url, path, retries)] = (img_url, img_file)
+
+                downloaded = list()
+                for future in track(as_completed(futures), total=len(futures), description=f"Downloading bulk {page}"):
+                    if future.result() is None:
+                        success += 1
+                        downloaded.append(futures[future][1])
+                    else:
+                        fail += 1 
+                        failed_urls.append(futures[future][0])
+
+                if index is not None and (unindexed or downloaded):
+                    index.add(unindexed + downloaded)
+                    index.save()
+
+        if index is not None:
+            duplicates = sum(1 for image, canonical in index.clusters.items() if image != canonical)
+            console.print(
+                f"{duplicates} of {len(index.clusters)} indexed images are reposts, "
+                f"cluster mapping saved in {index.to_csv()}"
+            )
+
+        if skipped:
+            console.print(f"{skipped} image files already saved were skipped")
         if fail == 0: 
             return console.print(f"[bold green]{success} image files successfully downloaded and saved\n")
         else: 
@@ -407,12 +735,101 @@ class submission:
                 f"Failed urls: {failed_urls}"
             )
 
+    def to_media(
+        self,
+        file_path: str = "submission_exports",
+        media_types: List[str] or str = "all",
+        concurrency: int = 4,
+        retries: int = 5,
+        overwrite: bool = False,
+        chunk_size: int = 1024 * 1024,
+    ):
+        """
+        Save video and gif data in submissions to .mp4 and .gif files. Ignores all other columns.
+
+        Files are streamed to disk in fixed-size chunks, so memory use stays flat whatever the size of the file.
+        Partial files left by an interrupted download are resumed with HTTP Range requests.
+
+        Args:
+            file_path (str): The relative path to the directory where the media files will be saved.
+            media_types (Union[List[str], str], optional): A list of attachment types to save ("video", "gif")
+                or "all" for both. Defaults to "all".
+            concurrency (int, optional): The number of files downloaded at once. Defaults to 4.
+            retries (int, optional): The number of retries, with exponential backoff, when a request is rate
+                limited (429), fails with a server error (5xx) or is interrupted. Defaults to 5.
+            overwrite (bool, optional): Download files already saved in file_path again. Defaults to False.
+            chunk_size (int, optional): The number of bytes written at a time. Defaults to 1 MiB.
+
+        Raises:
+            ValueError: If the provided media types are not valid.
+
+        Note:
+            Reddit-hosted videos (v.redd.it) are saved in the highest available resolution. Reddit serves the
+            video and audio tracks separately, and the saved .mp4 files contain the video track only.
+
+        Returns:
+            None. Prints the number of media files downloaded.
+        """
+        extensions = {"video": "mp4", "gif": "gif"}
+        if media_types == "all":
+            media_types = list(extensions)
+        elif not isinstance(media_types, list) or set(media_types) - set(extensions):
+            raise ValueError(f"Invalid input: media_types must be 'all' or a list of {list(extensions)}")
+
+        save_file_path = os.path.join(self.cwd, f"{file_path}")
+
+        os.makedirs(save_file_path, exist_ok=True)
+
+        success, skipped, fail = 0, 0, 0
+        failed_urls = list()
+
+        console.print(f"Downloading media file(s) in {save_file_path}")
+
+        with _http_session(concurrency) as session, ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for page, paginated_submissions in enumerate(
+                self._pages(["submission_id", "attachment"]), start=1
+            ):
+                futures = dict()
+                for data in paginated_submissions:
+                    attachment = data["attachment"] or {}
+                    media_type = next((media_type for media_type in media_types if attachment.get(media_type)), None)
+                    if media_type is None:
+                        continue
+
+                    path = os.path.join(save_file_path, f"{data['submission_id']}.{extensions[media_type]}")
+                    if not overwrite and os.path.exists(path):
+                        skipped += 1
+                        continue
+
+                    media_urls = _media_urls(media_type, attachment[media_type])
+                    future = executor.submit(_download_media, session, media_urls, path, retries, chunk_size)
+                    futures[future] = attachment[media_type]
+
+                for future in track(as_completed(futures), total=len(futures), description=f"Downloading bulk {page}"):
+                    if future.result() is None:
+                        success += 1
+                    else:
+                        fail += 1
+                        failed_urls.append(futures[future])
+
+        if skipped:
+            console.print(f"{skipped} media files already saved were skipped")
+        if fail == 0:
+            return console.print(f"[bold green]{success} media files successfully downloaded and saved\n")
+        else:
+            return console.print(
+                f"[bold green]{success} media files successfully downloaded and saved\n",
+                f"[bold red]Failed to download {fail} media files\n",
+                f"Failed urls: {failed_urls}"
+            )
+
 class comment:
     def __init__(
         self,
         supabase_client: supabase.Client,
         db_name: str,
         paginate: bool or dict = True,
+        workers: int = 1,
     ):
         """
         Initialize an instance for interacting with a Supabase table containing comment data.
@@ -422,17 +839,20 @@ class comment:
             db_name (str): The name of the Supabase table containing comment data.
             paginate (bool or dict, optional): Set to `True` to automatically paginate through large datasets.
                 You can also provide a dictionary with "row_count" and "page_size" values.
-                Defaults to False.
+                Defaults to True.
+            workers (int, optional): The number of pages fetched concurrently by the exporters. Defaults to 1.
+                Pages are still written in primary key order, so .csv and .txt files are identical to a
+                sequential export.
 
         Note:
-            If your database has more than 1 million rows, it's recommended to set the paginate parameter to 
-            ensure efficient data retrieval. You can set paginate to True for automatic settings or provide 
-            a dictionary with "row_count" and "page_size" values. 
-             
+            Rows are paged with keyset pagination on the primary key, so exports never count the entire table
+            and keep a constant cost per page regardless of the table size. You can set paginate to True for
+            automatic settings or provide a dictionary with "row_count" and "page_size" values.
+
             For larger datasets, consider:
                 1. Set "row_count" by checking row counts directly from the Supabase table editor. 
-                It is common for large datasets to raise ReadTimeoutError, when counting the entire rows. 
-                
+                It is only used to display the progress of exports.
+
                 2. Adjust the "Max Rows" setting in 'API Settings' on Supabase, allowing you to retrieve up to 10,000 rows at a time. 
                 The default limit to the amount of rows returned is 1,000 in Supabase.
             
@@ -443,6 +863,9 @@ class comment:
         self.comment_db_config = db_name
         self.comment_db = self.supabase.table(self.comment_db_config)
         self.paginate = paginate
+        if workers < 1:
+            raise ValueError("Invalid input: workers must be a positive integer.")
+        self.workers = workers
 
         self.columns = [
             "comment_id",
@@ -458,22 +881,67 @@ class comment:
         ]
 
         if self.paginate is True:
-            self.row_count = (
-                self.comment_db.select("comment_id", count="exact")
-                .execute()
-                .count
-            )
+            self.row_count = None
             self.page_size = 1000
-            self.page_numbers = (self.row_count // self.page_size) + (1 if self.row_count % self.page_size != 0 else 0)
         else:
-            self.row_count = self.paginate.get(
-                "row_count",
-                self.comment_db.select("comment_id", count="exact")
-                .execute()
-                .count,
-            )
+            # self.paginate.get("key", default) is a dictionary method that returns the value for the given key if the key is present in the dictionary. If the key is not found, it returns the default value.
+            # In this case, it's used to get the "row_count" and "page_size" from the paginate dictionary. The row count is only used to display progress, and the page size defaults to 1000.
+            self.row_count = self.paginate.get("row_count")
             self.page_size = self.paginate.get("page_size", 1000)
+
+        if self.row_count is not None:
             self.page_numbers = (self.row_count // self.page_size) + (1 if self.row_count % self.page_size != 0 else 0)
+        else:
+            self.page_numbers = None
+
+    def _pages(self, columns: List[str] or str, page_size: int = None):
+        """Page through the table in primary key order, yielding one list of rows per page."""
+        if self.workers > 1:
+            return keyset.parallel_pages(
+                self.comment_db, columns, key="comment_id", page_size=page_size or self.page_size, workers=self.workers
+            )
+        return keyset.pages(
+            self.comment_db, columns, key="comment_id", page_size=page_size or self.page_size
+        )
+
+    def iter_batches(self, columns: List[str] or str = "all", batch_size: int = None) -> Iterator[List[dict]]:
+        """
+        Lazily iterate over the comment data in batches of rows, in primary key order.
+
+        Only one batch is held in memory at a time, whatever the size of the table (up to `2 * workers` batches
+        when fetching with several workers).
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            batch_size (int, optional): The number of rows per batch. Defaults to the page size.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+
+        Returns:
+            Iterator[List[dict]]: A generator of batches of rows, each row mapping column names to values.
+        """
+        return self._pages(_validate_columns(columns, self.columns), batch_size)
+
+    def iter_rows(self, columns: List[str] or str = "all", batch_size: int = None) -> Iterator[dict]:
+        """
+        Lazily iterate over the comment data row by row, in primary key order.
+
+        Rows are fetched in batches of `batch_size`, so memory stays bounded by one batch (by `2 * workers`
+        batches when fetching with several workers).
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            batch_size (int, optional): The number of rows fetched per request. Defaults to the page size.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+
+        Returns:
+            Iterator[dict]: A generator of rows, each mapping column names to values.
+        """
+        batches = self.iter_batches(columns, batch_size)
+        return (row for batch in batches for row in batch)
 
     def to_pkl(self, columns: List[str] or str, file_name: str = "comment", file_path: str = "comment_exports"):
         """
@@ -494,36 +962,19 @@ class comment:
         
         os.makedirs(save_file_path, exist_ok=True)
         
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count, page = 0, 0
 
-        for page in track(
-            range(1, self.page_numbers + 1),
-            description=f"Downloading to .pickle file in {save_file_path}",
+        for page, paginated_comments in enumerate(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .pickle file in {save_file_path}",
+            ),
+            start=1,
         ):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_comments = (
-                self.comment_db.select(*columns).range(start_row, end_row).execute()
-            ).model_dump()["data"]
+            row_count += len(paginated_comments)
             with open(
                 os.path.join(save_file_path, f"{file_name}_{page}.pickle"), "wb"
             ) as handle:
@@ -532,7 +983,7 @@ class comment:
                 )
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {self.page_numbers - 1} pickle files"
+            f"{row_count} rows downloaded and saved in {page} pickle files"
         )
 
     def to_csv(self, columns: List[str] or str, file_name: str = "comment", file_path: str = "comment_exports"):
@@ -556,19 +1007,9 @@ class comment:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count = 0
 
         with open(
             save_file_name, "w", newline="", encoding="utf-8"
@@ -576,29 +1017,17 @@ class comment:
             writer = csv.writer(csvfile)
             writer.writerow(columns if columns != "*" else self.columns)
 
-            for page in track(
-                range(1, self.page_numbers + 1),
+            for paginated_comments in track(
+                self._pages(columns),
+                total=self.page_numbers,
                 description=f"Downloading to .csv file in {save_file_path}",
             ):
-                if page == 1:
-                    pass
-                elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-                else:
-                    start_row += self.page_size
-                    end_row = self.row_count
-                
-                paginated_comments = (
-                    self.comment_db.select(*columns)
-                    .range(start_row, end_row)
-                    .execute()
-                ).model_dump()["data"]
+                row_count += len(paginated_comments)
                 for row in paginated_comments:
                     writer.writerow(list(row.values()))
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {save_file_name}"
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
     def to_txt(self, columns: List[str] or str, file_name: str = "comment", file_path: str = "comment_exports"):
@@ -622,46 +1051,24 @@ class comment:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count = 0
 
         with open(save_file_name, "w", encoding="utf-8") as txtfile:
             txtfile.write("\t".join(columns if columns != "*" else self.columns) + "\n")
 
-            for page in track(
-                range(1, self.page_numbers + 1),
+            for paginated_comments in track(
+                self._pages(columns),
+                total=self.page_numbers,
                 description=f"Downloading to .txt file in {save_file_path}",
             ):
-                if page == 1:
-                    pass
-                elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-                else:
-                    start_row += self.page_size
-                    end_row = self.row_count
-                
-                paginated_comments = (
-                    self.comment_db.select(*columns)
-                    .range(start_row, end_row)
-                    .execute()
-                ).model_dump()["data"]
+                row_count += len(paginated_comments)
                 for row in paginated_comments:
                     txtfile.write("\t".join(map(str, row.values())) + "\n")
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {save_file_name}"
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
     def to_json(self, columns: List[str] or str, file_name: str = "comment", file_path: str = "comment_exports"):
@@ -684,43 +1091,78 @@ class comment:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count, page = 0, 0
 
-        for page in track(
-            range(1, self.page_numbers + 1),
-            description=f"Downloading to .json file in {save_file_path}",
+        for page, paginated_comments in enumerate(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .json file in {save_file_path}",
+            ),
+            start=1,
         ):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_comments = (
-                self.comment_db.select(*columns).range(start_row, end_row).execute()
-            ).model_dump()["data"]
+            row_count += len(paginated_comments)
             with open(
                 os.path.join(save_file_path, f"{file_name}_{page}.json"), "w", encoding="utf-8"
             ) as jsonfile:
                 json.dump(paginated_comments, jsonfile, ensure_ascii=False, indent=2)
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {self.page_numbers - 1} json files"
+            f"{row_count} rows downloaded and saved in {page} json files"
+        )
+
+    def to_parquet(
+        self,
+        columns: List[str] or str,
+        file_name: str = "comment",
+        file_path: str = "comment_exports",
+        compression: str = "zstd",
+        row_group_size: int = 100000,
+    ):
+        """
+        Save Supabase data to a typed, compressed .parquet file.
+
+        Rows are streamed into the file one row group at a time. Timestamps are stored as timestamps, booleans as
+        booleans, and JSON columns as Arrow maps and structs.
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            file_name (str): The base name for the output file. Defaults to comment.
+            file_path (str): The relative path to the directory where the Parquet file will be saved.
+            compression (str): The compression codec, e.g. "zstd", "snappy", "gzip" or "none". Defaults to "zstd".
+            row_group_size (int): The number of rows per row group. Defaults to 100,000.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+            ImportError: If pyarrow is not installed.
+
+        Returns:
+            None. Prints the number of rows downloaded and the Parquet file created.
+        """
+        save_file_path = os.path.join(self.cwd, f"{file_path}")
+        save_file_name = os.path.join(save_file_path, f"{file_name}.parquet")
+
+        os.makedirs(save_file_path, exist_ok=True)
+
+        columns = _validate_columns(columns, self.columns)
+
+        row_count = _write_parquet(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .parquet file in {save_file_path}",
+            ),
+            save_file_name,
+            table="comment",
+            columns=columns if columns != "*" else self.columns,
+            compression=compression,
+            row_group_size=row_group_size,
+        )
+
+        return console.print(
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
 class user:
@@ -729,6 +1171,7 @@ class user:
         supabase_client: supabase.Client,
         db_name: str,
         paginate: bool or dict = True,
+        workers: int = 1,
     ):
         """
         Initialize an instance for interacting with a Supabase table containing user data.
@@ -738,17 +1181,20 @@ class user:
             db_name (str): The name of the Supabase table containing comment data.
             paginate (bool or dict, optional): Set to `True` to automatically paginate through large datasets.
                 You can also provide a dictionary with "row_count" and "page_size" values.
-                Defaults to False.
+                Defaults to True.
+            workers (int, optional): The number of pages fetched concurrently by the exporters. Defaults to 1.
+                Pages are still written in primary key order, so .csv and .txt files are identical to a
+                sequential export.
 
         Note:
-            If your database has more than 1 million rows, it's recommended to set the paginate parameter to 
-            ensure efficient data retrieval. You can set paginate to True for automatic settings or provide 
-            a dictionary with "row_count" and "page_size" values. 
-             
+            Rows are paged with keyset pagination on the primary key, so exports never count the entire table
+            and keep a constant cost per page regardless of the table size. You can set paginate to True for
+            automatic settings or provide a dictionary with "row_count" and "page_size" values.
+
             For larger datasets, consider:
                 1. Set "row_count" by checking row counts directly from the Supabase table editor. 
-                It is common for large datasets to raise ReadTimeoutError, when counting the entire rows. 
-                
+                It is only used to display the progress of exports.
+
                 2. Adjust the "Max Rows" setting in 'API Settings' on Supabase, allowing you to retrieve up to 10,000 rows at a time. 
                 The default limit to the amount of rows returned is 1,000 in Supabase.
             
@@ -759,6 +1205,9 @@ class user:
         self.redditor_db_config = db_name
         self.redditor_db = self.supabase.table(self.redditor_db_config)
         self.paginate = paginate
+        if workers < 1:
+            raise ValueError("Invalid input: workers must be a positive integer.")
+        self.workers = workers
 
         self.columns = [
             "redditor_id",
@@ -772,22 +1221,67 @@ class user:
         ]
 
         if self.paginate is True:
-            self.row_count = (
-                self.redditor_db.select("redditor_id", count="exact")
-                .execute()
-                .count
-            )
+            self.row_count = None
             self.page_size = 1000
-            self.page_numbers = (self.row_count // self.page_size) + (1 if self.row_count % self.page_size != 0 else 0)
         else:
-            self.row_count = self.paginate.get(
-                "row_count",
-                self.redditor_db.select("redditor_id", count="exact")
-                .execute()
-                .count,
-            )
+            # self.paginate.get("key", default) is a dictionary method that returns the value for the given key if the key is present in the dictionary. If the key is not found, it returns the default value.
+            # In this case, it's used to get the "row_count" and "page_size" from the paginate dictionary. The row count is only used to display progress, and the page size defaults to 1000.
+            self.row_count = self.paginate.get("row_count")
             self.page_size = self.paginate.get("page_size", 1000)
+
+        if self.row_count is not None:
             self.page_numbers = (self.row_count // self.page_size) + (1 if self.row_count % self.page_size != 0 else 0)
+        else:
+            self.page_numbers = None
+
+    def _pages(self, columns: List[str] or str, page_size: int = None):
+        """Page through the table in primary key order, yielding one list of rows per page."""
+        if self.workers > 1:
+            return keyset.parallel_pages(
+                self.redditor_db, columns, key="redditor_id", page_size=page_size or self.page_size, workers=self.workers
+            )
+        return keyset.pages(
+            self.redditor_db, columns, key="redditor_id", page_size=page_size or self.page_size
+        )
+
+    def iter_batches(self, columns: List[str] or str = "all", batch_size: int = None) -> Iterator[List[dict]]:
+        """
+        Lazily iterate over the user data in batches of rows, in primary key order.
+
+        Only one batch is held in memory at a time, whatever the size of the table (up to `2 * workers` batches
+        when fetching with several workers).
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            batch_size (int, optional): The number of rows per batch. Defaults to the page size.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+
+        Returns:
+            Iterator[List[dict]]: A generator of batches of rows, each row mapping column names to values.
+        """
+        return self._pages(_validate_columns(columns, self.columns), batch_size)
+
+    def iter_rows(self, columns: List[str] or str = "all", batch_size: int = None) -> Iterator[dict]:
+        """
+        Lazily iterate over the user data row by row, in primary key order.
+
+        Rows are fetched in batches of `batch_size`, so memory stays bounded by one batch (by `2 * workers`
+        batches when fetching with several workers).
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            batch_size (int, optional): The number of rows fetched per request. Defaults to the page size.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+
+        Returns:
+            Iterator[dict]: A generator of rows, each mapping column names to values.
+        """
+        batches = self.iter_batches(columns, batch_size)
+        return (row for batch in batches for row in batch)
         
     def to_pkl(self, columns: List[str] or str, file_name: str = "user", file_path: str = "user_exports") -> None:
         """
@@ -807,36 +1301,19 @@ class user:
         save_file_path = os.path.join(self.cwd, f"{file_path}")
         
         os.makedirs(save_file_path, exist_ok=True)
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count, page = 0, 0
 
-        for page in track(
-            range(1, self.page_numbers + 1),
-            description=f"Downloading to .pickle file in {save_file_path}",
+        for page, paginated_redditors in enumerate(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .pickle file in {save_file_path}",
+            ),
+            start=1,
         ):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_redditors = (
-                self.redditor_db.select(*columns).range(start_row, end_row).execute()
-            ).model_dump()["data"]
+            row_count += len(paginated_redditors)
             with open(
                 os.path.join(save_file_path, f"{file_name}_{page}.pickle"), "wb"
             ) as handle:
@@ -845,7 +1322,7 @@ class user:
                 )
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {self.page_numbers - 1} pickle files"
+            f"{row_count} rows downloaded and saved in {page} pickle files"
         )
 
     def to_csv(self, columns: List[str] or str, file_name: str = "user", file_path: str = "user_exports"):
@@ -869,19 +1346,9 @@ class user:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count = 0
 
         with open(
             save_file_name, "w", newline="", encoding="utf-8"
@@ -889,29 +1356,17 @@ class user:
             writer = csv.writer(csvfile)
             writer.writerow(columns if columns != "*" else self.columns)
 
-            for page in track(
-                range(1, self.page_numbers + 1),
+            for paginated_redditors in track(
+                self._pages(columns),
+                total=self.page_numbers,
                 description=f"Downloading to .csv file in {save_file_path}",
             ):
-                if page == 1:
-                    pass
-                elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-                else:
-                    start_row += self.page_size
-                    end_row = self.row_count
-                
-                paginated_redditors = (
-                    self.redditor_db.select(*columns)
-                    .range(start_row, end_row)
-                    .execute()
-                ).model_dump()["data"]
+                row_count += len(paginated_redditors)
                 for row in paginated_redditors:
                     writer.writerow(list(row.values()))
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {save_file_name}"
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
     def to_txt(self, columns: List[str] or str, file_name: str = "user", file_path: str = "user_exports"):
@@ -935,46 +1390,24 @@ class user:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count = 0
 
         with open(save_file_name, "w", encoding="utf-8") as txtfile:
             txtfile.write("\t".join(columns if columns != "*" else self.columns) + "\n")
 
-            for page in track(
-                range(1, self.page_numbers + 1),
+            for paginated_redditors in track(
+                self._pages(columns),
+                total=self.page_numbers,
                 description=f"Downloading to .txt file in {save_file_path}",
             ):
-                if page == 1:
-                    pass
-                elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-                else:
-                    start_row += self.page_size
-                    end_row = self.row_count
-                
-                paginated_redditors = (
-                    self.redditor_db.select(*columns)
-                    .range(start_row, end_row)
-                    .execute()
-                ).model_dump()["data"]
+                row_count += len(paginated_redditors)
                 for row in paginated_redditors:
                     txtfile.write("\t".join(map(str, row.values())) + "\n")
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {save_file_name}"
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
 
     def to_json(self, columns: List[str] or str, file_name: str = "user", file_path: str = "user_exports"):
@@ -997,41 +1430,76 @@ class user:
         
         os.makedirs(save_file_path, exist_ok=True)
 
-        if isinstance(columns, str):
-            if columns.lower() == "all":
-                columns = "*"
-            else:
-                raise ValueError(f"Invalid input: {columns}")
-        elif isinstance(columns, list):
-            invalid_columns = set(columns) - set(self.columns)
-            if invalid_columns:
-                raise ValueError(f"Invalid column names provided: {invalid_columns}")
-        else:
-            raise ValueError("Input is neither a string nor a list.")
+        columns = _validate_columns(columns, self.columns)
 
-        start_row, end_row = 0, self.page_size
+        row_count, page = 0, 0
 
-        for page in track(
-            range(1, self.page_numbers + 1),
-            description=f"Downloading to .json file in {save_file_path}",
+        for page, paginated_redditors in enumerate(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .json file in {save_file_path}",
+            ),
+            start=1,
         ):
-            if page == 1:
-                pass
-            elif page < (self.page_numbers - 1):
-                    start_row += self.page_size
-                    end_row += self.page_size
-            else:
-                start_row += self.page_size
-                end_row = self.row_count
-            
-            paginated_redditors = (
-                self.redditor_db.select(*columns).range(start_row, end_row).execute()
-            ).model_dump()["data"]
+            row_count += len(paginated_redditors)
             with open(
                 os.path.join(save_file_path, f"{file_name}_{page}.json"), "w", encoding="utf-8"
             ) as jsonfile:
                 json.dump(paginated_redditors, jsonfile, ensure_ascii=False, indent=2)
 
         return console.print(
-            f"{self.row_count} rows downloaded and saved in {self.page_numbers} json files"
+            f"{row_count} rows downloaded and saved in {page} json files"
+        )
+
+    def to_parquet(
+        self,
+        columns: List[str] or str,
+        file_name: str = "user",
+        file_path: str = "user_exports",
+        compression: str = "zstd",
+        row_group_size: int = 100000,
+    ):
+        """
+        Save Supabase data to a typed, compressed .parquet file.
+
+        Rows are streamed into the file one row group at a time. Timestamps are stored as timestamps, booleans as
+        booleans, and JSON columns as Arrow maps and structs.
+
+        Args:
+            columns (Union[List[str], str]): A list of column names to select or "all" for all columns.
+            file_name (str): The base name for the output file. Defaults to user.
+            file_path (str): The relative path to the directory where the Parquet file will be saved.
+            compression (str): The compression codec, e.g. "zstd", "snappy", "gzip" or "none". Defaults to "zstd".
+            row_group_size (int): The number of rows per row group. Defaults to 100,000.
+
+        Raises:
+            ValueError: If the provided columns are not valid or if the input is neither a string nor a list.
+            ImportError: If pyarrow is not installed.
+
+        Returns:
+            None. Prints the number of rows downloaded and the Parquet file created.
+        """
+        save_file_path = os.path.join(self.cwd, f"{file_path}")
+        save_file_name = os.path.join(save_file_path, f"{file_name}.parquet")
+
+        os.makedirs(save_file_path, exist_ok=True)
+
+        columns = _validate_columns(columns, self.columns)
+
+        row_count = _write_parquet(
+            track(
+                self._pages(columns),
+                total=self.page_numbers,
+                description=f"Downloading to .parquet file in {save_file_path}",
+            ),
+            save_file_name,
+            table="user",
+            columns=columns if columns != "*" else self.columns,
+            compression=compression,
+            row_group_size=row_group_size,
+        )
+
+        return console.print(
+            f"{row_count} rows downloaded and saved in {save_file_name}"
         )
@@ -2,6 +2,7 @@ import supabase
 from typing import List
 from rich.progress import track
 from rich.console import Console
+from redditharbor.utils import keyset
 
 console = Console()
     
@@ -41,40 +42,11 @@ class user:
             List[str]: A list of user names.
         """
         redditor_names = list()
-        
-        if limit is None: 
-            #Get all rows 
-            row_count = (
-                self.redditor_db.select("redditor_id", count="exact")
-                .execute()
-                .count
-            ) 
-            page_size = 1000
-            page_numbers = (row_count // page_size) + (1 if row_count % page_size != 0 else 0)
-        else: 
-            #Get limited rows 
-            row_count = limit 
-            page_size = 1000 
-            page_numbers = (row_count // page_size) + (1 if row_count % page_size != 0 else 0)
-        
-        start_row, end_row = 0, min(row_count, page_size) 
 
-        for page in track(
-            range(1, page_numbers + 1),
+        for paginated_redditor_name in track(
+            keyset.pages(self.redditor_db, ["name"], key="redditor_id", limit=limit),
             description=f"Fetching user names from {self.redditor_db_config}",
         ):
-            if page == 1:
-                pass
-            elif page < (page_numbers - 1):
-                    start_row += page_size
-                    end_row += page_size
-            else:
-                start_row += page_size
-                end_row = row_count
-            
-            paginated_redditor_name = (
-                self.redditor_db.select("name").range(start_row, end_row).execute()
-            ).model_dump()["data"]
             redditor_name = [redditor["name"] for redditor in paginated_redditor_name]
             # Could use redditor_name += redditor_name, but in general, 'extend' method is often preferred 
             #because it modifies the list in place, while the + operator creates a new list, which might be 
@@ -119,40 +91,11 @@ class submission:
             List[str]: A list of submission IDs.
         """
         submission_ids = list()
-        
-        if limit is None: 
-            #Get all rows 
-            row_count = (
-                self.submission_db.select("submission_id", count="exact")
-                .execute()
-                .count
-            ) 
-            page_size = 1000
-            page_numbers = (row_count // page_size) + (1 if row_count % page_size != 0 else 0)
-        else: 
-            #Get limited rows 
-            row_count = limit 
-            page_size = 1000 
-            page_numbers = (row_count // page_size) + (1 if row_count % page_size != 0 else 0)
-        
-        start_row, end_row = 0, min(row_count, page_size) 
 
-        for page in track(
-            range(1, page_numbers + 1),
+        for paginated_submission_id in track(
+            keyset.pages(self.submission_db, ["submission_id"], key="submission_id", limit=limit),
             description=f"Fetching submission ids from {self.submission_db_config}",
         ):
-            if page == 1:
-                pass
-            elif page < (page_numbers - 1):
-                    start_row += page_size
-                    end_row += page_size
-            else:
-                start_row += page_size
-                end_row = row_count
-            
-            paginated_submission_id = (
-                self.submission_db.select("submission_id").range(start_row, end_row).execute()
-            ).model_dump()["data"]
             submission_id = [data["submission_id"] for data in paginated_submission_id]
             submission_ids.extend(submission_id)
         
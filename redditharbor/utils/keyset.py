@@ -0,0 +1,218 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+
+def pages(
+    db,
+    columns: Union[List[str], str],
+    key: Union[str, Tuple[str, str]],
+    page_size: int = 1000,
+    limit: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None,
+    desc: bool = False,
+    start_after: Optional[Any] = None,
+    end_at: Optional[Any] = None,
+) -> Iterator[List[dict]]:
+    """
+    Page through a Supabase table with keyset pagination.
+
+    Rows are ordered by `key` and each page starts after the last key of the previous page, so every page is an
+    index scan regardless of how deep it is, and no row is skipped or repeated at page boundaries. Unlike
+    `.range()` pagination, the total row count is never needed.
+
+    Args:
+        db: The Supabase table to page through, e.g. `supabase_client.table("test_submission")`.
+        columns (Union[List[str], str]): A list of column names to select or "*" for all columns.
+        key (Union[str, Tuple[str, str]]): The unique column to order by (usually the primary key), or a
+            (column, unique column) pair such as ("created_at", "submission_id").
+        page_size (int, optional): The number of rows per page. Defaults to 1000. Must not exceed the "Max Rows"
+            setting of the Supabase API.
+        limit (int, optional): The maximum number of rows to return. Defaults to None, returning all rows.
+        filters (Dict[str, Any], optional): Equality filters applied to every page, e.g. {"archived": False}.
+        desc (bool, optional): Page in descending key order. Defaults to False.
+        start_after (Any, optional): Only return rows after this key value (a tuple for a column pair), e.g. to
+            resume from the last key of a previous run. Defaults to None, starting from the first row.
+        end_at (Any, optional): Only return rows up to and including this key value (a tuple for a column pair).
+            Defaults to None, returning rows up to the last one.
+
+    Yields:
+        List[dict]: The rows of each page, containing the requested columns only.
+    """
+    keys = (key,) if isinstance(key, str) else tuple(key)
+    columns = ["*"] if columns == "*" else list(columns)
+    # Key columns are needed to resume after the last row, but are only returned if they were requested
+    extra_keys = [] if columns == ["*"] else [k for k in keys if k not in columns]
+
+    last_key = None
+    if start_after is not None:
+        last_key = tuple(start_after) if isinstance(start_after, (tuple, list)) else (start_after,)
+    end_key = None
+    if end_at is not None:
+        end_key = tuple(end_at) if isinstance(end_at, (tuple, list)) else (end_at,)
+    fetched = 0
+
+    while limit is None or fetched < limit:
+        size = page_size if limit is None else min(page_size, limit - fetched)
+
+        query = db.select(*columns, *extra_keys)
+        for column, value in (filters or {}).items():
+            query = query.eq(column, value)
+        if last_key is not None:
+            query = _after(query, keys, last_key, desc)
+        if end_key is not None:
+            query = _up_to(query, keys, end_key, desc)
+        for k in keys:
+            query = query.order(k, desc=desc)
+
+        rows = query.limit(size).execute().model_dump()["data"]
+        if not rows:
+            return
+
+        last_key = tuple(rows[-1][k] for k in keys)
+        fetched += len(rows)
+
+        if extra_keys:
+            rows = [
+                {column: value for column, value in row.items() if column not in extra_keys}
+                for row in rows
+            ]
+        yield rows
+
+        if len(rows) < size:
+            return
+
+
+def _after(query, keys: Tuple[str, ...], last_key: Tuple[Any, ...], desc: bool):
+    """Restrict a query to the rows after `last_key` in key order."""
+    operator = "lt" if desc else "gt"
+
+    if len(keys) == 1:
+        return getattr(query, operator)(keys[0], last_key[0])
+
+    # (a, b) > (x, y)  <=>  a > x OR (a = x AND b > y). Values are quoted as timestamps contain reserved characters
+    (first, second), (first_value, second_value) = keys, last_key
+    return query.or_(
+        f'{first}.{operator}."{first_value}",'
+        f'and({first}.eq."{first_value}",{second}.{operator}."{second_value}")'
+    )
+
+
+def _up_to(query, keys: Tuple[str, ...], end_key: Tuple[Any, ...], desc: bool):
+    """Restrict a query to the rows up to and including `end_key` in key order."""
+    operator, strict = ("gte", "gt") if desc else ("lte", "lt")
+
+    if len(keys) == 1:
+        return getattr(query, operator)(keys[0], end_key[0])
+
+    # (a, b) <= (x, y)  <=>  a < x OR (a = x AND b <= y)
+    (first, second), (first_value, second_value) = keys, end_key
+    return query.or_(
+        f'{first}.{strict}."{first_value}",'
+        f'and({first}.eq."{first_value}",{second}.{operator}."{second_value}")'
+    )
+
+
+def boundaries(
+    db,
+    key: str,
+    page_size: int = 1000,
+    filters: Optional[Dict[str, Any]] = None,
+    workers: int = 1,
+) -> Iterator[Tuple[Optional[Any], Optional[Any]]]:
+    """
+    Split a Supabase table into consecutive key ranges of about `page_size` rows.
+
+    Each boundary is found with a single-row request skipping a multiple of `page_size` index entries after the
+    last boundary found. `workers` such requests are sent concurrently, so listing N ranges takes about
+    N / workers round trips. Ranges are exclusive of their lower key and inclusive of their upper key, and
+    together cover the whole table even when rows are inserted while it is split.
+
+    Args:
+        db: The Supabase table to split.
+        key (str): The unique column to order by (usually the primary key).
+        page_size (int, optional): The number of rows per range. Defaults to 1000.
+        filters (Dict[str, Any], optional): Equality filters applied to every range, e.g. {"archived": False}.
+        workers (int, optional): The number of boundaries probed concurrently. Defaults to 1.
+
+    Yields:
+        Tuple[Optional[Any], Optional[Any]]: The (exclusive lower, inclusive upper) key of each range.
+            None stands for an open bound.
+    """
+
+    def probe(after: Optional[Any], offset: int) -> Optional[Any]:
+        query = db.select(key)
+        for column, value in (filters or {}).items():
+            query = query.eq(column, value)
+        if after is not None:
+            query = query.gt(key, after)
+        rows = query.order(key).range(offset, offset).execute().model_dump()["data"]
+        return rows[0][key] if rows else None
+
+    last_key = None
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while True:
+            anchor = last_key
+            probes = [
+                executor.submit(probe, anchor, page_size * step - 1) for step in range(1, max(1, workers) + 1)
+            ]
+            for future in probes:
+                boundary = future.result()
+                if boundary is None:
+                    yield last_key, None
+                    return
+                # Probes run at slightly different times: skip a boundary moved back by concurrent writes
+                if last_key is not None and boundary <= last_key:
+                    continue
+                yield last_key, boundary
+                last_key = boundary
+
+
+def parallel_pages(
+    db,
+    columns: Union[List[str], str],
+    key: str,
+    page_size: int = 1000,
+    workers: int = 4,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Iterator[List[dict]]:
+    """
+    Page through a Supabase table like `pages`, fetching up to `workers` pages concurrently.
+
+    The table is split into key ranges with `boundaries`, and each range is fetched with `pages` until it is
+    exhausted, so rows inserted into a range after it was found are still returned. Ranges are fetched over a
+    thread pool sharing the client's pooled HTTP connections, and are yielded in key order. At most `2 * workers`
+    ranges are held in memory at a time.
+
+    Args:
+        db: The Supabase table to page through.
+        columns (Union[List[str], str]): A list of column names to select or "*" for all columns.
+        key (str): The unique column to order by (usually the primary key).
+        page_size (int, optional): The number of rows per page. Defaults to 1000.
+        workers (int, optional): The number of pages fetched concurrently. Defaults to 4.
+        filters (Dict[str, Any], optional): Equality filters applied to every page, e.g. {"archived": False}.
+
+    Yields:
+        List[dict]: The rows of each range (usually one page), containing the requested columns only.
+    """
+
+    def fetch(lower: Optional[Any], upper: Optional[Any]) -> List[dict]:
+        rows = []
+        for page in pages(
+            db, columns, key, page_size=page_size, filters=filters, start_after=lower, end_at=upper
+        ):
+            rows.extend(page)
+        return rows
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for lower, upper in boundaries(db, key, page_size=page_size, filters=filters, workers=workers):
+            in_flight.append(executor.submit(fetch, lower, upper))
+            if len(in_flight) >= 2 * workers:
+                rows = in_flight.popleft().result()
+                if rows:
+                    yield rows
+        while in_flight:
+            rows = in_flight.popleft().result()
+            if rows:
+                yield rows
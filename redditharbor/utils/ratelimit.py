@@ -0,0 +1,242 @@
+import time
+import threading
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+import praw
+import prawcore
+import requests
+
+# Requests per minute granted to an OAuth client by Reddit's free API tier
+REDDIT_QPM = 100
+
+
+class rate_scheduler:
+    """
+    Hand out Reddit API requests from a token bucket refilled at the pace of the remaining quota.
+
+    Reddit reports the quota left in the current window with every response (the X-Ratelimit-Remaining, -Used and
+    -Reset headers, also exposed as `reddit.auth.limits`). After each response the bucket's refill rate is set so
+    that `target` of the window's quota is spread evenly over the time left until the reset, and a request only
+    goes out once a token is available. Bursts are capped at `burst` requests, so workers sharing the scheduler
+    never drain the quota early and then stall until the window resets.
+
+    The scheduler is thread-safe. Share one instance between every client using the same credentials, through
+    `login.reddit(rate_scheduler=...)`, so that every `collect` and `update` worker draws from the same budget.
+
+    Args:
+        requests_per_minute (int, optional): The quota assumed before Reddit reports one. Defaults to 100.
+        target (float, optional): The share of the quota to use, leaving headroom for clock drift and requests
+            made outside the scheduler. Defaults to 0.98.
+        burst (int, optional): The maximum number of requests sent back to back. Defaults to 5.
+    """
+
+    def __init__(self, requests_per_minute: int = REDDIT_QPM, target: float = 0.98, burst: int = 5) -> None:
+        if not 0 < target <= 1:
+            raise ValueError("Invalid input: target must be in (0, 1].")
+        if burst < 1:
+            raise ValueError("Invalid input: burst must be a positive integer.")
+
+        self.target = target
+        self.burst = burst
+        self.remaining: Optional[float] = None
+        self.used: Optional[int] = None
+        self.reset_timestamp: Optional[float] = None
+
+        self._rate = requests_per_minute * target / 60
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self.granted = 0
+        self.waited = 0.0
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        Tokens are reserved in call order, so concurrent workers are served first come, first served.
+
+        Returns:
+            float: The number of seconds waited.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(-self._tokens / self._rate, self._paused_until - now, 0.0)
+            self.granted += 1
+            self.waited += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def update(
+        self,
+        remaining: Optional[float] = None,
+        used: Optional[int] = None,
+        reset_timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Pace the bucket on the quota Reddit reports. The arguments match the keys of `reddit.auth.limits`.
+
+        Args:
+            remaining (float, optional): The number of requests left in the current window.
+            used (int, optional): The number of requests made in the current window.
+            reset_timestamp (float, optional): The Unix time at which the window resets.
+        """
+        if remaining is None or used is None or reset_timestamp is None:
+            return
+
+        with self._lock:
+            self.remaining, self.used, self.reset_timestamp = remaining, used, reset_timestamp
+            seconds_to_reset = max(reset_timestamp - time.time(), 1.0)
+            allowed = self.target * (remaining + used) - used
+
+            if allowed < 1:
+                # Quota used up: hold every request until the window resets
+                self._paused_until = time.monotonic() + seconds_to_reset
+                self._tokens = min(self._tokens, 0.0)
+                return
+
+            self._rate = allowed / seconds_to_reset
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Pace the bucket on the X-Ratelimit headers of a response, if present."""
+        if "x-ratelimit-remaining" not in headers:
+            return
+        self.update(
+            remaining=float(headers["x-ratelimit-remaining"]),
+            used=int(headers["x-ratelimit-used"]),
+            reset_timestamp=time.time() + int(headers["x-ratelimit-reset"]),
+        )
+
+    def sync(self, reddit_client: Any) -> None:
+        """Pace the bucket on the limits a PRAW client last received (`reddit.auth.limits`)."""
+        limits = reddit_client.auth.limits
+        # Recent PRAW versions no longer report the reset time, which is then taken from the last response seen
+        self.update(
+            remaining=limits.get("remaining"),
+            used=limits.get("used"),
+            reset_timestamp=limits.get("reset_timestamp") or self.reset_timestamp,
+        )
+
+    def available(self) -> float:
+        """Return the number of tokens currently in the bucket (negative when requests are queued)."""
+        with self._lock:
+            now = time.monotonic()
+            tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+            return tokens if now >= self._paused_until else min(tokens, 0.0)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request for a number of seconds, e.g. after a 429 response."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the scheduler's counters.
+
+        Returns:
+            Dict[str, Any]: The number of requests granted, the total seconds spent waiting, the current pace in
+            requests per minute and the quota last reported by Reddit.
+        """
+        with self._lock:
+            return {
+                "granted": self.granted,
+                "waited": self.waited,
+                "requests_per_minute": self._rate * 60,
+                "remaining": self.remaining,
+                "used": self.used,
+                "reset_timestamp": self.reset_timestamp,
+            }
+
+
+class scheduled_requestor(prawcore.Requestor):
+    """
+    A prawcore requestor taking a token from a `rate_scheduler` before each API request.
+
+    Pass it to PRAW with `praw.Reddit(..., requestor_class=scheduled_requestor,
+    requestor_kwargs={"rate_scheduler": scheduler})`, or use `login.reddit(rate_scheduler=scheduler)`. Access
+    token requests do not count against the API quota and are not scheduled.
+    """
+
+    def __init__(self, *args: Any, rate_scheduler: rate_scheduler, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.rate_scheduler = rate_scheduler
+
+    def request(self, *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> requests.Response:
+        url = args[1] if len(args) > 1 else kwargs.get("url", "")
+        scheduled = url.startswith(self.oauth_url)
+        if scheduled:
+            self.rate_scheduler.acquire()
+
+        response = super().request(*args, timeout=timeout, **kwargs)
+
+        if scheduled:
+            self.rate_scheduler.update_from_headers(response.headers)
+            if response.status_code == 429:
+                retry_after = response.headers.get("retry-after")
+                self.rate_scheduler.pause(float(retry_after) if retry_after else 60.0)
+        return response
+
+
+class client_pool:
+    """
+    A pool of Reddit clients, one per set of app credentials, each paced by its own `rate_scheduler`.
+
+    Every OAuth client has its own quota, so spreading requests over N clients multiplies the API throughput by N.
+    `collect` and `update` accept a pool in place of a single client: listings, users and batches of submissions
+    are then handed to the client with the most quota to spare. Create a pool from the credentials in the .env
+    file with `login.reddit_pool()`.
+
+    Args:
+        clients (List[praw.Reddit]): The Reddit clients.
+        schedulers (List[rate_scheduler], optional): The scheduler of each client. Defaults to None, giving every
+            client a scheduler of its own (clients created with a `scheduled_requestor` should pass theirs).
+    """
+
+    def __init__(self, clients: List[praw.Reddit], schedulers: List[rate_scheduler] = None) -> None:
+        if not clients:
+            raise ValueError("Invalid input: a client pool needs at least one client.")
+        if schedulers is not None and len(schedulers) != len(clients):
+            raise ValueError("Invalid input: clients and schedulers must have the same length.")
+
+        self.clients = list(clients)
+        self.schedulers = list(schedulers) if schedulers is not None else [rate_scheduler() for _ in clients]
+        self._turn = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __iter__(self) -> Iterator[praw.Reddit]:
+        return iter(self.clients)
+
+    def __getitem__(self, index: int) -> praw.Reddit:
+        return self.clients[index]
+
+    def next(self) -> praw.Reddit:
+        """
+        Return the client with the most quota to spare, taking turns between clients with as much.
+
+        Returns:
+            praw.Reddit: The client to send the next unit of work to.
+        """
+        with self._lock:
+            order = [(self._turn + i) % len(self.clients) for i in range(len(self.clients))]
+            index = max(order, key=lambda i: self.schedulers[i].available())
+            self._turn = (index + 1) % len(self.clients)
+        return self.clients[index]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Return the counters of each client's scheduler (see `rate_scheduler.stats`)."""
+        return [scheduler.stats() for scheduler in self.schedulers]
+
+
+def next_client(reddit_client: Any) -> praw.Reddit:
+    """Return the next client of a `client_pool`, or the client itself when given a single client."""
+    if isinstance(reddit_client, client_pool):
+        return reddit_client.next()
+    return reddit_client
@@ -38,6 +38,13 @@ setup(
             'presidio-analyzer>=2.2.351,<3.0.0',
             'presidio-anonymizer>=2.2.351,<3.0.0',
         ],
+        'parquet': [
+            'pyarrow>=12.0.0',
+        ],
+        'async': [
+            'asyncpraw>=7.7.1',
+            'supabase>=2.4.0',
+        ],
     },
     classifiers=[
         'Development Status :: 3 - Alpha', 